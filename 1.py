@@ -4,8 +4,11 @@ import random
 import threading
 import time
 
+from memoria import MemoriaProcesos
+from vistas import CanvasMemoria
+
 class MemoriaPaginada(tk.Tk):
-    def __init__(self, tamano_memoria, tamano_pagina):
+    def __init__(self, tamano_memoria, tamano_pagina, buddy=False):
         super().__init__()
         self.title("Simulador de Memoria Paginada")
         
@@ -13,16 +16,15 @@ class MemoriaPaginada(tk.Tk):
         self.tamano_memoria = tamano_memoria
         self.tamano_pagina = tamano_pagina
         self.paginas_totales = tamano_memoria // tamano_pagina
-        self.memoria = [None] * self.paginas_totales  # Lista que representa cada página de memoria
-        self.memoria_usada = 0  # Espacio usado en memoria
+        self.memoria = MemoriaProcesos(tamano_memoria, tamano_pagina, buddy)  # Páginas y procesos (con su propio lock)
         self.memoria_total = tamano_memoria  # Tamaño total de la memoria visual
 
-        # Lock para manejar exclusión mutua
-        self.lock = threading.Lock()
-
         # Crear la interfaz gráfica
         self.canvas = tk.Canvas(self, width=300, height=self.paginas_totales * 30)
         self.canvas.grid(row=0, column=0, columnspan=3)
+        self.vista_memoria = CanvasMemoria(self.canvas, self.paginas_totales, columnas=1, ancho=200, alto=30,
+                                           margen_x=50, color_libre="white", texto_libre="Vacío",
+                                           texto_ocupada="ID: {}")
         
         self.label_id = tk.Label(self, text="ID del proceso")
         self.label_id.grid(row=1, column=0)
@@ -48,61 +50,32 @@ class MemoriaPaginada(tk.Tk):
         self.label_proceso_actual.grid(row=4, column=0, columnspan=3)
 
         # Label para mostrar memoria usada
-        self.label_memoria_usada = tk.Label(self, text=f"Memoria Usada: {self.memoria_usada}/{self.memoria_total}", font=("Arial", 12))
+        self.label_memoria_usada = tk.Label(self, text=f"Memoria Usada: {self.memoria.memoria_usada}/{self.memoria_total}", font=("Arial", 12))
         self.label_memoria_usada.grid(row=5, column=0, columnspan=3)
 
         # Dibuja la memoria en el canvas
         self.dibujar_memoria()
 
-        # Lista para almacenar los procesos activos
-        self.procesos = []
-
         # Iniciar generación automática al inicio
         self.generacion_automatica = True
         threading.Thread(target=self.generar_procesos_automaticos).start()
 
     def dibujar_memoria(self):
-        self.canvas.delete("all")  # Limpiar el canvas antes de redibujar
-        for i in range(self.paginas_totales):
-            if self.memoria[i] is None:
-                texto = "Vacío"  # Texto si la página está vacía
-                color = "white"
-            else:
-                texto = f"ID: {self.memoria[i]}"  # Mostrar el ID del proceso que ocupa la página
-                color = "lightblue"
-
-            self.canvas.create_rectangle(50, i * 30, 250, (i + 1) * 30, fill=color, outline="black")
-            self.canvas.create_text(150, (i * 30) + 15, text=texto, fill="black")
+        # Solo se reconfiguran las páginas que cambiaron desde el último dibujo
+        self.vista_memoria.dibujar(self.memoria.paginas, self.memoria.tomar_cambios())
 
         # Actualizar el label de memoria usada
-        self.label_memoria_usada.config(text=f"Memoria Usada: {self.memoria_usada}/{self.memoria_total}")
+        self.label_memoria_usada.config(text=f"Memoria Usada: {self.memoria.memoria_usada}/{self.memoria_total}")
 
     def agregar_proceso(self):
         try:
             id_proceso = self.entry_id.get()
             espacio_proceso = int(self.entry_espacio.get())
 
-            # Calcular cuántas páginas necesita el proceso
-            paginas_necesarias = (espacio_proceso + self.tamano_pagina - 1) // self.tamano_pagina
-
-            # Buscar espacio en la memoria
-            paginas_disponibles = [i for i, pagina in enumerate(self.memoria) if pagina is None]
-
-            # Verificar si hay suficiente espacio
-            if len(paginas_disponibles) < paginas_necesarias or (self.memoria_usada + espacio_proceso > self.memoria_total):
+            # Asignar páginas al proceso (falla si no hay suficiente espacio)
+            if not self.memoria.agregar(id_proceso, espacio_proceso):
                 messagebox.showwarning("Advertencia", "No hay suficiente espacio en memoria para el proceso.")
                 return
-
-            # Asignar páginas al proceso
-            with self.lock:  # Iniciar bloque de exclusión mutua
-                for i in range(paginas_necesarias):
-                    self.memoria[paginas_disponibles[i]] = id_proceso
-
-                # Actualizar memoria usada
-                self.memoria_usada += espacio_proceso
-
-            # Guardar el proceso en la lista de procesos
-            self.procesos.append({"id": id_proceso, "estado": "En ejecución", "espacio": espacio_proceso})
             self.dibujar_memoria()
 
             # Iniciar ejecución del proceso en un hilo separado
@@ -116,27 +89,10 @@ class MemoriaPaginada(tk.Tk):
         id_proceso = f"Proceso{random.randint(1, 100)}"
         espacio_proceso = random.randint(1, self.tamano_memoria // 4)  # Tamaño máximo del proceso es un cuarto de la memoria
 
-        # Calcular cuántas páginas necesita el proceso
-        paginas_necesarias = (espacio_proceso + self.tamano_pagina - 1) // self.tamano_pagina
-
-        # Buscar espacio en la memoria
-        paginas_disponibles = [i for i, pagina in enumerate(self.memoria) if pagina is None]
-
-        # Verificar si hay suficiente espacio
-        if len(paginas_disponibles) < paginas_necesarias or (self.memoria_usada + espacio_proceso > self.memoria_total):
+        # Asignar páginas al proceso (falla si no hay suficiente espacio)
+        if not self.memoria.agregar(id_proceso, espacio_proceso):
             print(f"El proceso {id_proceso} no puede entrar a la memoria, no hay suficiente espacio.")
             return
-
-        # Asignar páginas al proceso
-        with self.lock:  # Iniciar bloque de exclusión mutua
-            for i in range(paginas_necesarias):
-                self.memoria[paginas_disponibles[i]] = id_proceso
-
-            # Actualizar memoria usada
-            self.memoria_usada += espacio_proceso
-
-        # Guardar el proceso en la lista de procesos
-        self.procesos.append({"id": id_proceso, "estado": "En ejecución", "espacio": espacio_proceso})
         self.dibujar_memoria()
 
         # Iniciar ejecución del proceso en un hilo separado
@@ -150,19 +106,8 @@ class MemoriaPaginada(tk.Tk):
         time.sleep(tiempo_ejecucion)
 
         # Liberar la memoria ocupada por el proceso después de la ejecución
-        paginas_liberadas = 0
-        espacio_liberado = 0
-        with self.lock:  # Iniciar bloque de exclusión mutua
-            for i in range(self.paginas_totales):
-                if self.memoria[i] == id_proceso:
-                    self.memoria[i] = None
-                    paginas_liberadas += 1
-                    espacio_liberado += self.procesos[self.procesos.index({"id": id_proceso, "estado": "En ejecución", "espacio": espacio_liberado})]["espacio"]
-
+        paginas_liberadas = self.memoria.liberar(id_proceso)
         if paginas_liberadas > 0:
-            # Actualizar la lista de procesos y dibujar la memoria
-            self.procesos = [p for p in self.procesos if p["id"] != id_proceso]
-            self.memoria_usada -= espacio_liberado  # Actualizar memoria usada
             self.dibujar_memoria()
 
         print(f"El proceso {id_proceso} ha finalizado y liberado {paginas_liberadas} páginas.")
@@ -172,29 +117,14 @@ class MemoriaPaginada(tk.Tk):
         id_proceso = self.entry_id.get()
 
         # Buscar el proceso en la memoria y liberarlo
-        paginas_liberadas = 0
-        espacio_liberado = 0
-        with self.lock:  # Iniciar bloque de exclusión mutua
-            for i in range(self.paginas_totales):
-                if self.memoria[i] == id_proceso:
-                    self.memoria[i] = None
-                    paginas_liberadas += 1
-                    espacio_liberado += self.procesos[self.procesos.index({"id": id_proceso, "estado": "En ejecución", "espacio": espacio_liberado})]["espacio"]
-
-        if paginas_liberadas > 0:
-            # Actualizar la lista de procesos y dibujar la memoria
-            self.procesos = [p for p in self.procesos if p["id"] != id_proceso]
-            self.memoria_usada -= espacio_liberado  # Actualizar memoria usada
+        if self.memoria.liberar(id_proceso) > 0:
             self.dibujar_memoria()
         else:
             messagebox.showinfo("Info", "El proceso no se encuentra en la memoria")
 
     def reiniciar_memoria(self):
         # Limpiar la memoria y la lista de procesos
-        with self.lock:  # Iniciar bloque de exclusión mutua
-            self.memoria = [None] * self.paginas_totales
-            self.memoria_usada = 0  # Reiniciar memoria usada
-        self.procesos = []
+        self.memoria.reiniciar()
         self.dibujar_memoria()
 
     def generar_procesos_automaticos(self):
@@ -205,6 +135,7 @@ class MemoriaPaginada(tk.Tk):
 if __name__ == "__main__":
     tamano_memoria = 1024  # Tamaño total de la memoria
     tamano_pagina = 64  # Tamaño de cada página
+    buddy = False  # Repartir la memoria en bloques buddy (potencias de dos) en lugar de páginas sueltas
 
-    app = MemoriaPaginada(tamano_memoria, tamano_pagina)
+    app = MemoriaPaginada(tamano_memoria, tamano_pagina, buddy)
     app.mainloop()
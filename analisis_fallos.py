@@ -0,0 +1,253 @@
+import sys
+
+try:
+    import numpy as np
+except ImportError:  # NumPy es opcional: solo hace falta para este análisis
+    np = None
+
+from paginacion import LARGO_FASE, LOCALIDAD, VENTANA
+
+# Análisis de fallos de página fuera de línea sobre cadenas de referencias largas
+# (10^7 referencias o más) para muchas cantidades de marcos a la vez, con NumPy.
+# Las referencias son números de página virtual, como en la paginación del simulador.
+#   LRU: distancias de pila (1 + cuántas páginas distintas hubo desde el uso anterior); con
+#        k marcos hay fallo si la distancia es > k, así que una sola pasada da toda la curva.
+#   OPT: se precalcula el próximo uso de cada referencia y con eso como prioridad se
+#        calculan las distancias de pila de OPT (Mattson): también una sola pasada.
+#   FIFO: no es un algoritmo de pila (puede tener anomalía de Belady), así que se simulan
+#        todas las cantidades de marcos en paralelo, como un vector, en una sola pasada.
+
+POLITICAS = ('fifo', 'lru', 'opt')
+
+def _requiere_numpy():
+    if np is None:
+        raise ImportError("El análisis de fallos necesita NumPy (pip install numpy)")
+
+# Función para numerar las páginas de 0 a P-1 (los arreglos por página quedan chicos)
+def densificar(referencias):
+    _requiere_numpy()
+    _, densas = np.unique(np.asarray(referencias), return_inverse=True)
+    return densas.astype(np.int64).ravel()
+
+# Función para obtener, para cada referencia, la posición del próximo uso de la misma página
+# (n si no se vuelve a usar) y la del uso anterior (-1 si es la primera)
+def proximo_y_anterior(referencias):
+    referencias = np.asarray(referencias)
+    n = len(referencias)
+    orden = np.argsort(referencias, kind='stable')  # Por página y, dentro de cada página, por posición
+    ordenadas = referencias[orden]
+    misma = ordenadas[1:] == ordenadas[:-1]
+    desde, hasta = orden[:-1][misma], orden[1:][misma]
+    proximo = np.full(n, n, dtype=np.int64)
+    proximo[desde] = hasta
+    anterior = np.full(n, -1, dtype=np.int64)
+    anterior[hasta] = desde
+    return proximo, anterior
+
+def proximo_uso(referencias):
+    return proximo_y_anterior(referencias)[0]
+
+# Función para calcular las distancias de pila LRU (0 en la primera referencia a cada página).
+# La distancia de i es su posición en la pila LRU: 1 + las páginas distintas entre su uso
+# anterior p e i, que son las j
+# con p < j < i cuyo próximo uso es posterior a i. Se cuentan las que no cumplen (próximo
+# uso < i) con un conteo de dominancia: el sufijo (p, n) se parte en bloques alineados de
+# tamaño 2^L (a lo sumo uno por nivel) y en cada bloque se busca con searchsorted sobre los
+# próximos usos ordenados. Son O(log n) ordenamientos vectorizados.
+def distancias_lru(referencias):
+    _requiere_numpy()
+    referencias = np.asarray(referencias)
+    n = len(referencias)
+    proximo, anterior = proximo_y_anterior(referencias)
+    distancias = np.zeros(n, dtype=np.int64)
+    consultas = np.nonzero(anterior >= 0)[0]
+    if not len(consultas):
+        return distancias
+    p = anterior[consultas]
+    inicio = p + 1
+    adentro = np.zeros(len(consultas), dtype=np.int64)  # j en (p, i) con próximo uso < i
+    posiciones = np.arange(n, dtype=np.int64)
+    nivel = 0
+    while (1 << nivel) < n:
+        tamano = 1 << nivel
+        bloque_inicio = -(-inicio // tamano) * tamano
+        usa = ((bloque_inicio >> nivel) & 1).astype(bool) & (bloque_inicio < n)
+        if usa.any():
+            claves = np.sort((posiciones >> nivel) * (n + 1) + proximo)
+            bloques = bloque_inicio[usa] >> nivel
+            adentro[usa] += (np.searchsorted(claves, bloques * (n + 1) + consultas[usa])
+                             - bloques * tamano)
+        nivel += 1
+    # Las que se alinean al final del sufijo ya quedaron contadas; como próximo uso < i
+    # implica j < i, basta con restar del largo del intervalo
+    distancias[consultas] = consultas - p - adentro
+    return distancias
+
+# Función para obtener los fallos LRU para cada cantidad de marcos en una sola pasada
+def curva_lru(referencias, marcos):
+    return _curva_pila(distancias_lru(referencias), marcos)
+
+# Función para simular FIFO para todas las cantidades de marcos a la vez. En FIFO la página
+# cargada en el fallo número f sale en el fallo f + k, así que alcanza con guardar, para cada
+# página y cada k, en qué fallo se cargó: es un acierto si desde entonces hubo a lo sumo k fallos
+# (contando el suyo).
+def curva_fifo(referencias, marcos):
+    _requiere_numpy()
+    densas = densificar(referencias)
+    # Una referencia repetida enseguida siempre es un acierto (con al menos un marco)
+    if len(densas):
+        densas = densas[np.concatenate([[True], densas[1:] != densas[:-1]])]
+    marcos = np.asarray(marcos, dtype=np.int64)
+    paginas = int(densas.max()) + 1 if len(densas) else 0
+    cargada = np.full((paginas, len(marcos)), -np.iinfo(np.int64).max // 2, dtype=np.int64)
+    fallos = np.zeros(len(marcos), dtype=np.int64)
+    for pagina in densas.tolist():
+        fila = cargada[pagina]
+        falla = fallos - fila > marcos
+        np.copyto(fila, fallos, where=falla)
+        fallos += falla
+    return fallos
+
+# Función para calcular las distancias de pila OPT (0 en la primera referencia a cada página).
+# OPT también es un algoritmo de pila (Mattson): en la pila, los primeros k elementos son las
+# páginas cargadas con k marcos. La página referenciada sube al tope y, bajando por la pila,
+# en cada posición queda la de próximo uso más cercano entre la que se arrastra y la que
+# estaba; la otra (la víctima de esa cantidad de marcos) sigue bajando. Con k marcos hay
+# fallo si la distancia es 0 o mayor que k. Cuesta O(profundidad) por referencia.
+def distancias_opt(referencias, proximo=None):
+    _requiere_numpy()
+    referencias = densificar(referencias)
+    if proximo is None:
+        proximo = proximo_uso(referencias)
+    distancias = np.zeros(len(referencias), dtype=np.int64)
+    siguiente = [0] * (int(referencias.max()) + 1 if len(referencias) else 0)  # Próximo uso de cada página
+    pila = []
+    for t, (pagina, uso) in enumerate(zip(referencias.tolist(), proximo.tolist())):
+        if pila and pila[0] == pagina:
+            distancias[t] = 1
+        elif pila:
+            arrastrada = pila[0]
+            pila[0] = pagina
+            for i in range(1, len(pila)):
+                actual = pila[i]
+                if actual == pagina:
+                    pila[i] = arrastrada
+                    distancias[t] = i + 1
+                    break
+                if siguiente[arrastrada] < siguiente[actual]:
+                    pila[i], arrastrada = arrastrada, actual
+            else:
+                pila.append(arrastrada)
+        else:
+            pila.append(pagina)
+        siguiente[pagina] = uso
+    return distancias
+
+# Función para obtener los fallos OPT para cada cantidad de marcos en una sola pasada
+def curva_opt(referencias, marcos, proximo=None):
+    return _curva_pila(distancias_opt(referencias, proximo), marcos)
+
+# Función para contar los fallos por cantidad de marcos a partir de las distancias de pila
+# (distancia d >= 1: acierto con d marcos o más; 0: primera referencia, siempre falla)
+def _curva_pila(distancias, marcos):
+    marcos = np.asarray(marcos, dtype=np.int64)
+    conteo = np.bincount(distancias)
+    mayores = np.concatenate([np.cumsum(conteo[::-1])[::-1], [0]])  # mayores[d] = #distancias >= d
+    frias = conteo[0] if len(conteo) else 0
+    return frias + mayores[np.minimum(marcos + 1, len(conteo))]
+
+# Función para encontrar anomalías de Belady: pares (k, k') con k < k' y más fallos con k' marcos
+def anomalias_belady(marcos, fallos):
+    orden = np.argsort(marcos, kind='stable')
+    marcos, fallos = np.asarray(marcos)[orden], np.asarray(fallos)[orden]
+    minimo = np.minimum.accumulate(fallos)  # Menos fallos vistos con menos marcos
+    anomalias = []
+    for i in np.nonzero(fallos[1:] > minimo[:-1])[0] + 1:
+        k = int(marcos[np.argmax(fallos[:i] == minimo[i - 1])])
+        anomalias.append((k, int(marcos[i]), int(minimo[i - 1]), int(fallos[i])))
+    return anomalias
+
+# Función para calcular las curvas de fallos por cantidad de marcos de varias políticas
+def analizar(referencias, marcos, politicas=POLITICAS):
+    _requiere_numpy()
+    referencias = densificar(referencias)
+    marcos = np.asarray(sorted(set(int(k) for k in marcos)), dtype=np.int64)
+    curvas = {}
+    for politica in politicas:
+        if politica == 'lru':
+            curvas[politica] = curva_lru(referencias, marcos)
+        elif politica == 'opt':
+            curvas[politica] = curva_opt(referencias, marcos)
+        elif politica == 'fifo':
+            curvas[politica] = curva_fifo(referencias, marcos)
+        else:
+            raise ValueError(f"Política sin análisis fuera de línea: {politica}")
+    return marcos, curvas
+
+# Función para generar una cadena de referencias con el mismo modelo de localidad que la
+# paginación del simulador (fases sobre una ventana de páginas y saltos ocasionales)
+def generar_referencias(cantidad, paginas_virtuales, semilla=None):
+    _requiere_numpy()
+    aleatorio = np.random.default_rng(semilla)
+    ventana = min(VENTANA, paginas_virtuales)
+    fases = -(-cantidad // LARGO_FASE)
+    bases = np.repeat(aleatorio.integers(0, paginas_virtuales - ventana + 1, fases), LARGO_FASE)[:cantidad]
+    en_ventana = bases + aleatorio.integers(0, ventana, cantidad)
+    saltos = aleatorio.integers(0, paginas_virtuales, cantidad)
+    return np.where(aleatorio.random(cantidad) < LOCALIDAD, en_ventana, saltos)
+
+# Función para leer una cadena de referencias: .npy (se mapea sin copiarla) o texto con un
+# número por línea (o separados por espacios). Con `tamano_pagina` son direcciones y se pasan a páginas.
+def leer_referencias(ruta, tamano_pagina=None):
+    _requiere_numpy()
+    if ruta.endswith('.npy'):
+        referencias = np.load(ruta, mmap_mode='r')
+    else:
+        referencias = np.fromfile(ruta, dtype=np.int64, sep=' ')
+    if tamano_pagina:
+        referencias = referencias // tamano_pagina
+    return referencias
+
+# Función para convertir "1-64" o "4,8,16" en una lista de cantidades de marcos
+def _marcos(texto):
+    marcos = []
+    for parte in texto.split(','):
+        if '-' in parte:
+            desde, hasta = parte.split('-')
+            marcos.extend(range(int(desde), int(hasta) + 1))
+        else:
+            marcos.append(int(parte))
+    return marcos
+
+if __name__ == "__main__":
+    import argparse
+    import time
+
+    parser = argparse.ArgumentParser(description="Curvas de fallos de página por cantidad de marcos (FIFO, LRU, OPT)")
+    parser.add_argument("referencias", nargs="?", default=None, help="Cadena de referencias (.npy o texto); sin archivo se genera una")
+    parser.add_argument("--generar", type=int, default=1000000, help="Referencias a generar si no se da un archivo")
+    parser.add_argument("--paginas", type=int, default=64, help="Páginas virtuales de la cadena generada")
+    parser.add_argument("--semilla", type=int, default=0, help="Semilla de la cadena generada")
+    parser.add_argument("--tamano-pagina", type=int, default=None, help="El archivo tiene direcciones: pasarlas a páginas de este tamaño")
+    parser.add_argument("--marcos", type=_marcos, default=list(range(1, 33)), help="Cantidades de marcos, como 1-32 o 4,8,16")
+    parser.add_argument("--politicas", type=lambda t: t.split(','), default=list(POLITICAS), help="Políticas, separadas por comas")
+    args = parser.parse_args()
+
+    if args.referencias:
+        referencias = leer_referencias(args.referencias, args.tamano_pagina)
+    else:
+        referencias = generar_referencias(args.generar, args.paginas, args.semilla)
+    inicio = time.perf_counter()
+    marcos, curvas = analizar(referencias, args.marcos, args.politicas)
+
+    print(",".join(['marcos'] + [f"fallos_{politica}" for politica in curvas]
+                   + [f"tasa_{politica}" for politica in curvas]))
+    for i, k in enumerate(marcos):
+        print(",".join([str(k)] + [str(curva[i]) for curva in curvas.values()]
+                       + [f"{curva[i] / len(referencias):.6f}" for curva in curvas.values()]))
+    print(f"{len(referencias)} referencias, {len(marcos)} cantidades de marcos en "
+          f"{time.perf_counter() - inicio:.1f} s", file=sys.stderr)
+    if 'fifo' in curvas:
+        for k, k_mayor, fallos, fallos_mayor in anomalias_belady(marcos, curvas['fifo']):
+            print(f"Anomalía de Belady (FIFO): {k} marcos -> {fallos} fallos, "
+                  f"{k_mayor} marcos -> {fallos_mayor} fallos", file=sys.stderr)
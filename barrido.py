@@ -0,0 +1,169 @@
+import csv
+import itertools
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from planificadores import crear_planificador
+from simulador import Simulador
+from tlb import TLB
+
+# Barrido de parámetros: corre el simulador sin interfaz para cada combinación de una
+# grilla de parámetros, repartiendo las corridas entre todos los núcleos con un
+# ProcessPoolExecutor, y junta las métricas de cada corrida en una sola tabla.
+
+# Grilla por defecto (cada clave es un parámetro de Simulador)
+GRILLA = {
+    'memoria_total': [500, 1000, 2000],
+    'tamano_pagina': [25, 50, 100],
+    'planificador': ['fifo', 'rr', 'sjf'],
+    'compactar': [False, True],
+    'numero_recursos': [1, 3],
+}
+
+COLUMNAS_METRICAS = ['terminados', 'rechazados', 'reloj', 'retorno_medio', 'retorno_p95', 'espera_media',
+                     'respuesta_media', 'ocupacion_cpu', 'ocupacion_memoria', 'paginas_movidas', 'fragmentacion_interna',
+                     'tasa_fallos', 'tasa_tlb', 'acceso_efectivo', 'transiciones', 'segundos']
+
+# Función para generar todas las combinaciones de la grilla como diccionarios.
+# El quantum solo cambia algo en round robin: las demás políticas se corren una sola vez,
+# con quantum vacío, en lugar de repetir la misma corrida por cada quantum
+def generar_configuraciones(grilla):
+    nombres = list(grilla)
+    vistas = set()
+    for valores in itertools.product(*(grilla[nombre] for nombre in nombres)):
+        configuracion = dict(zip(nombres, valores))
+        if configuracion.get('quantum') is not None and configuracion.get('planificador') != 'rr':
+            configuracion['quantum'] = None
+            clave = tuple(configuracion.values())
+            if clave in vistas:
+                continue
+            vistas.add(clave)
+        yield configuracion
+
+# Función para correr una configuración y devolver sus métricas (corre en un proceso del pool).
+# Todas las configuraciones usan la misma carga para la misma semilla, así se comparan entre sí.
+def correr_configuracion(configuracion, procesos=500, intervalo=8.0, semilla=0):
+    parametros = dict(configuracion)
+    entradas_tlb = parametros.pop('tlb', None)
+    quantum = parametros.pop('quantum', None)
+    if quantum is not None and parametros.get('planificador') == 'rr':
+        parametros['planificador'] = crear_planificador('rr', quantum=quantum)
+    simulador = Simulador(semilla=semilla, tlb=TLB(entradas_tlb) if entradas_tlb else None, **parametros)
+    simulador.agregar_procesos_aleatorios(procesos, intervalo)
+
+    inicio = time.perf_counter()
+    transiciones = simulador.ejecutar()
+    resumen = simulador.metricas.resumen()
+    fila = dict(configuracion)
+    fila.update(
+        terminados=resumen['terminados'],
+        rechazados=resumen['rechazos'],
+        reloj=round(resumen['reloj'], 3),
+        retorno_medio=round(resumen['retorno']['media'], 3),
+        retorno_p95=round(resumen['retorno']['p95'], 3),
+        espera_media=round(resumen['espera']['media'], 3),
+        respuesta_media=round(resumen['respuesta']['media'], 3),
+        ocupacion_cpu=round(resumen['ocupacion_cpu'], 4),
+        ocupacion_memoria=round(resumen['ocupacion_memoria'], 4),
+        paginas_movidas=simulador.costo_compactacion.paginas_movidas,
+        fragmentacion_interna=round(resumen['buddy']['fragmentacion_interna_acumulada'], 4) if resumen['buddy'] else 0.0,
+        tasa_fallos=round(resumen['paginacion']['tasa_fallos'], 4) if resumen['paginacion'] else 0.0,
+        tasa_tlb=_redondear_tlb(resumen['tlb'], 'tasa_aciertos', 4),
+        acceso_efectivo=_redondear_tlb(resumen['tlb'], 'tiempo_acceso_efectivo', 2),
+        transiciones=transiciones,
+        segundos=round(time.perf_counter() - inicio, 4),
+    )
+    return fila
+
+# Valor de la TLB para la tabla: vacío sin TLB y n/a si la TLB no tuvo búsquedas (sin paginación)
+def _redondear_tlb(resumen_tlb, clave, decimales):
+    if resumen_tlb is None:
+        return None
+    valor = resumen_tlb[clave]
+    return 'n/a' if valor is None else round(valor, decimales)
+
+def _correr(argumentos):
+    return correr_configuracion(*argumentos)
+
+# Función para correr todas las configuraciones de la grilla en paralelo.
+# Devuelve las filas en el mismo orden que generar_configuraciones.
+def barrer(grilla=GRILLA, procesos=500, intervalo=8.0, semilla=0, trabajadores=None):
+    configuraciones = list(generar_configuraciones(grilla))
+    trabajadores = trabajadores or os.cpu_count() or 1
+    # Se mandan las corridas por tandas para no pagar la comunicación entre procesos una por una
+    tanda = max(1, len(configuraciones) // (trabajadores * 4))
+    argumentos = [(configuracion, procesos, intervalo, semilla) for configuracion in configuraciones]
+    with ProcessPoolExecutor(max_workers=trabajadores) as pool:
+        return list(pool.map(_correr, argumentos, chunksize=tanda))
+
+# Función para escribir la tabla de resultados en CSV
+def escribir_csv(filas, archivo):
+    if not filas:
+        return
+    columnas = [c for c in filas[0] if c not in COLUMNAS_METRICAS] + COLUMNAS_METRICAS
+    escritor = csv.DictWriter(archivo, fieldnames=columnas)
+    escritor.writeheader()
+    escritor.writerows(filas)
+
+# Función para convertir "500,1000" en [500, 1000] (o en booleanos para si/no)
+def _lista(texto, tipo=int):
+    if tipo is bool:
+        return [valor.strip().lower() in ('si', 'sí', 'true', '1') for valor in texto.split(',')]
+    return [tipo(valor) for valor in texto.split(',')]
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Barrido de parámetros del simulador en paralelo")
+    parser.add_argument("--memoria", type=_lista, default=GRILLA['memoria_total'], help="Tamaños de memoria, separados por comas")
+    parser.add_argument("--pagina", type=_lista, default=GRILLA['tamano_pagina'], help="Tamaños de página, separados por comas")
+    parser.add_argument("--planificador", type=lambda t: _lista(t, str), default=GRILLA['planificador'], help="Planificadores, separados por comas")
+    parser.add_argument("--compactar", type=lambda t: _lista(t, bool), default=GRILLA['compactar'], help="Compactación (si/no), separados por comas")
+    parser.add_argument("--buddy", action="store_true", help="Agregar corridas con el asignador buddy para comparar con paginación y compactación")
+    parser.add_argument("--recursos", type=_lista, default=GRILLA['numero_recursos'], help="Cantidades de recursos, separadas por comas")
+    parser.add_argument("--paginacion", type=lambda t: _lista(t, str), default=None, help="Políticas de reemplazo con paginación por demanda, separadas por comas (para dimensionar la memoria por tasa de fallos)")
+    parser.add_argument("--tlb", type=_lista, default=None, help="Entradas de la TLB por CPU, separadas por comas (se mide con --paginacion)")
+    parser.add_argument("--quantum", type=lambda t: _lista(t, float), default=None, help="Quantums del round robin, separados por comas")
+    parser.add_argument("--cpus", type=_lista, default=[1], help="Cantidades de CPUs, separadas por comas")
+    parser.add_argument("--procesos", type=int, default=500, help="Procesos por corrida")
+    parser.add_argument("--intervalo", type=float, default=8.0, help="Tiempo medio entre llegadas")
+    parser.add_argument("--semilla", type=int, default=0, help="Semilla de la carga (la misma para todas las corridas)")
+    parser.add_argument("--trabajadores", type=int, default=None, help="Procesos del pool (por defecto, uno por núcleo)")
+    parser.add_argument("--salida", default=None, help="Archivo CSV de resultados (por defecto, la salida estándar)")
+    args = parser.parse_args()
+    if args.buddy and args.paginacion:
+        parser.error("--buddy no se combina con --paginacion: la paginación por demanda carga marcos sueltos")
+
+    grilla = {
+        'memoria_total': args.memoria,
+        'tamano_pagina': args.pagina,
+        'planificador': args.planificador,
+        'compactar': args.compactar,
+        'numero_recursos': args.recursos,
+        'numero_cpus': args.cpus,
+    }
+    if args.tlb:
+        grilla['tlb'] = args.tlb
+    if args.quantum:
+        grilla['quantum'] = args.quantum
+    if args.paginacion:
+        grilla['paginacion'] = args.paginacion
+        grilla['compactar'] = [False]  # La paginación por demanda no usa memoria contigua
+    inicio = time.perf_counter()
+    if args.buddy:
+        # El buddy no se compacta: se agrega una corrida con buddy por cada configuración sin compactación
+        grilla['buddy'] = [False]
+        filas = barrer(grilla, args.procesos, args.intervalo, args.semilla, args.trabajadores)
+        filas += barrer(dict(grilla, compactar=[False], buddy=[True]), args.procesos, args.intervalo,
+                        args.semilla, args.trabajadores)
+    else:
+        filas = barrer(grilla, args.procesos, args.intervalo, args.semilla, args.trabajadores)
+    if args.salida:
+        with open(args.salida, 'w', newline='') as archivo:
+            escribir_csv(filas, archivo)
+    else:
+        escribir_csv(filas, sys.stdout)
+    print(f"{len(filas)} configuraciones en {time.perf_counter() - inicio:.1f} s "
+          f"con {args.trabajadores or os.cpu_count()} procesos", file=sys.stderr)
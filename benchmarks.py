@@ -0,0 +1,200 @@
+import json
+import platform
+import sys
+import time
+
+import compactador
+from simulador import Proceso, Simulador
+
+# Microbenchmarks de los caminos más usados del simulador (sin interfaz gráfica):
+# asignar y liberar páginas (sueltas o en bloques buddy), compactar la memoria y las
+# transiciones de estado.
+# Cada caso se mide operación por operación y se informan operaciones por segundo y
+# percentiles de latencia. Los resultados se guardan en JSON y se pueden comparar
+# contra una corrida anterior para detectar las que se pusieron más lentas (se compara
+# la mediana, que no se mueve por una pausa aislada del recolector de basura).
+
+TAMANOS_MEMORIA = [20, 1000, 100000, 1000000]  # En páginas
+LARGOS_COLA = [10, 1000, 100000]  # Procesos en Listo
+PRESUPUESTO = 0.5  # Segundos de medición por caso
+MAX_REPETICIONES = 100000
+TOLERANCIA = 0.2  # Una mediana más de un 20% mayor que la de la base se marca como más lenta
+
+TAMANO_PAGINA = 10
+
+# Función para medir `operacion()` una vez por repetición hasta agotar el presupuesto.
+# `preparar()` (si se da) se llama antes de cada repetición y no se mide.
+# Devuelve las latencias en nanosegundos.
+def cronometrar(operacion, presupuesto=PRESUPUESTO, max_repeticiones=MAX_REPETICIONES, preparar=None):
+    reloj = time.perf_counter_ns
+    latencias = []
+    limite = reloj() + int(presupuesto * 1e9)
+    while len(latencias) < max_repeticiones and (not latencias or reloj() < limite):
+        if preparar is not None:
+            preparar()
+        inicio = reloj()
+        operacion()
+        latencias.append(reloj() - inicio)
+    return latencias
+
+# Función para resumir las latencias: operaciones por segundo y percentiles en microsegundos
+def resumir(latencias):
+    ordenadas = sorted(latencias)
+    total = sum(ordenadas)
+
+    def percentil(p):
+        return ordenadas[min(len(ordenadas) - 1, int(len(ordenadas) * p))] / 1000
+
+    return {
+        'repeticiones': len(ordenadas),
+        'ops_por_segundo': len(ordenadas) / total * 1e9 if total else float('inf'),
+        'p50_us': percentil(0.50),
+        'p95_us': percentil(0.95),
+        'p99_us': percentil(0.99),
+        'max_us': ordenadas[-1] / 1000,
+    }
+
+# Función para crear un simulador con `paginas` páginas, la mitad ocupada por procesos de
+# una página. Por defecto queda un hueco cada dos páginas; con `mitad_baja` se libera toda
+# la mitad baja (fragmentación máxima, lo peor para la compactación)
+def _memoria_fragmentada(paginas, mitad_baja=False, **opciones):
+    simulador = Simulador(memoria_total=paginas * TAMANO_PAGINA, tamano_pagina=TAMANO_PAGINA, **opciones)
+    procesos = []
+    for i in range(paginas):
+        proceso = Proceso(i + 1, TAMANO_PAGINA, recurso=0)
+        simulador._por_id[proceso.id] = proceso
+        simulador.asignar_paginas(proceso)
+        procesos.append(proceso)
+    if mitad_baja:
+        liberados, quedan = procesos[:paginas // 2], procesos[paginas // 2:]
+    else:
+        liberados, quedan = procesos[::2], procesos[1::2]
+    for proceso in liberados:
+        simulador.memoria.liberar(proceso.paginas)
+        proceso.paginas = []
+    return simulador, quedan
+
+# Asignar y liberar las páginas de un proceso de 4 páginas (o menos si la memoria es chica).
+# Con `buddy` se libera la mitad baja: con un hueco cada dos páginas ningún bloque libre se
+# fusiona y el pedido no entraría (esa fragmentación se compara en el barrido, acá el costo)
+def medir_asignar_liberar(paginas, presupuesto=PRESUPUESTO, buddy=False):
+    simulador, _ = _memoria_fragmentada(paginas, mitad_baja=buddy, buddy=buddy)
+    proceso = Proceso(0, min(4, paginas // 4) * TAMANO_PAGINA, recurso=0)
+    asignar = cronometrar(lambda: simulador.asignar_paginas(proceso), presupuesto / 2,
+                          preparar=lambda: simulador.liberar_paginas(proceso))
+    liberar = cronometrar(lambda: simulador.liberar_paginas(proceso), presupuesto / 2,
+                          preparar=lambda: simulador.asignar_paginas(proceso))
+    modo = 'buddy/' if buddy else ''
+    return {f'asignar_paginas/{modo}paginas={paginas}': resumir(asignar),
+            f'liberar_paginas/{modo}paginas={paginas}': resumir(liberar)}
+
+# Compactar la memoria fragmentada: un paso incremental y una compactación completa.
+# Cuando hace falta se vuelve a la disposición fragmentada antes de la repetición (sin medir).
+def medir_compactar(paginas, presupuesto=PRESUPUESTO):
+    simulador, procesos = _memoria_fragmentada(paginas, mitad_baja=True, compactar=True)
+    memoria = simulador.memoria
+    disposicion = list(memoria.paginas)
+    paginas_de = [list(proceso.paginas) for proceso in procesos]
+
+    def fragmentar():
+        memoria.paginas[:] = disposicion
+        memoria.reconstruir()
+        for proceso, paginas_proceso in zip(procesos, paginas_de):
+            proceso.paginas = list(paginas_proceso)
+
+    # Los pasos incrementales se miden seguidos hasta que la fragmentación baja del umbral
+    def fragmentar_si_hace_falta():
+        if not compactador.necesita_compactar(memoria, simulador.umbral_compactacion):
+            fragmentar()
+
+    # El primer paso arma los montículos del asignador (recorre la tabla una vez): no se mide
+    simulador.compactar_memoria()
+    fragmentar()
+
+    # La compactación completa es O(páginas): se limita la cantidad de repeticiones
+    repeticiones = max(3, 2000000 // paginas)
+    paso = cronometrar(simulador.compactar_memoria, presupuesto / 2, preparar=fragmentar_si_hace_falta)
+    completa = cronometrar(lambda: simulador.compactar_memoria(forzar=True), presupuesto / 2, repeticiones, fragmentar)
+    return {f'compactar_memoria/paso/paginas={paginas}': resumir(paso),
+            f'compactar_memoria/completa/paginas={paginas}': resumir(completa)}
+
+# Transiciones de estado con `largo` procesos circulando entre Listo, Ejecutando y Bloqueado.
+# Cada operación es un evento del simulador (despacho, fin de ráfaga, fin de bloqueo...).
+# Cada proceso tiene un recurso propio: los recursos solo se sueltan al terminar, así que
+# compartidos dejarían casi todos los procesos bloqueados en las colas de los recursos.
+def medir_transiciones(largo, planificador='fifo', presupuesto=PRESUPUESTO):
+    simulador = Simulador(memoria_total=largo * TAMANO_PAGINA, tamano_pagina=TAMANO_PAGINA,
+                          numero_recursos=largo, max_bloqueos=float('inf'), planificador=planificador)
+    for i in range(largo):
+        simulador.agregar_proceso(TAMANO_PAGINA, 0.0, recurso=i)
+    # Las llegadas y el paso de todos a Listo (un solo evento O(largo)) no se miden
+    simulador.ejecutar(hasta=0.0)
+    while simulador._revisando_nuevos:
+        simulador.paso()
+    latencias = cronometrar(simulador.paso, presupuesto)
+    return {f'transiciones/{planificador}/cola={largo}': resumir(latencias)}
+
+# Función para correr todos los casos; devuelve el documento que se guarda en JSON
+def correr(tamanos=TAMANOS_MEMORIA, largos=LARGOS_COLA, presupuesto=PRESUPUESTO):
+    resultados = {}
+    for paginas in tamanos:
+        resultados.update(medir_asignar_liberar(paginas, presupuesto))
+        resultados.update(medir_asignar_liberar(paginas, presupuesto, buddy=True))
+        resultados.update(medir_compactar(paginas, presupuesto))
+    for largo in largos:
+        for planificador in ('fifo', 'sjf'):
+            resultados.update(medir_transiciones(largo, planificador, presupuesto))
+    return {
+        'python': sys.version.split()[0],
+        'plataforma': platform.platform(),
+        'fecha': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'resultados': resultados,
+    }
+
+# Función para comparar contra una corrida base; devuelve los casos más lentos que la tolerancia
+# como (nombre, mediana base en µs, mediana actual en µs, cambio relativo)
+def comparar(base, actual, tolerancia=TOLERANCIA):
+    lentos = []
+    for nombre, resultado in actual['resultados'].items():
+        anterior = base['resultados'].get(nombre)
+        if anterior is None or not anterior['p50_us']:
+            continue
+        cambio = resultado['p50_us'] / anterior['p50_us'] - 1
+        if cambio > tolerancia:
+            lentos.append((nombre, anterior['p50_us'], resultado['p50_us'], cambio))
+    return lentos
+
+def _imprimir(documento):
+    print(f"{'caso':50} {'ops/s':>14} {'p50 µs':>10} {'p95 µs':>10} {'p99 µs':>10}")
+    for nombre, r in documento['resultados'].items():
+        print(f"{nombre:50} {r['ops_por_segundo']:14,.0f} {r['p50_us']:10.2f} {r['p95_us']:10.2f} {r['p99_us']:10.2f}")
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Microbenchmarks de memoria, compactación y transiciones")
+    parser.add_argument("--paginas", type=lambda t: [int(v) for v in t.split(',')], default=TAMANOS_MEMORIA,
+                        help="Tamaños de memoria en páginas, separados por comas")
+    parser.add_argument("--colas", type=lambda t: [int(v) for v in t.split(',')], default=LARGOS_COLA,
+                        help="Largos de la cola Listo, separados por comas")
+    parser.add_argument("--presupuesto", type=float, default=PRESUPUESTO, help="Segundos de medición por caso")
+    parser.add_argument("--salida", default=None, help="Archivo JSON donde guardar los resultados")
+    parser.add_argument("--comparar", default=None, help="Archivo JSON de una corrida base para comparar")
+    parser.add_argument("--tolerancia", type=float, default=TOLERANCIA, help="Aumento relativo tolerado de la mediana de latencia respecto de la base")
+    args = parser.parse_args()
+
+    documento = correr(args.paginas, args.colas, args.presupuesto)
+    _imprimir(documento)
+    if args.salida:
+        with open(args.salida, 'w') as archivo:
+            json.dump(documento, archivo, indent=2)
+
+    if args.comparar:
+        with open(args.comparar) as archivo:
+            base = json.load(archivo)
+        lentos = comparar(base, documento, args.tolerancia)
+        for nombre, antes, ahora, cambio in lentos:
+            print(f"MÁS LENTO: {nombre}: mediana {antes:.2f} -> {ahora:.2f} µs ({cambio:+.0%})")
+        if lentos:
+            sys.exit(1)
+        print(f"Ninguna mediana aumentó más del {args.tolerancia:.0%} respecto de {args.comparar}")
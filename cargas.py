@@ -0,0 +1,137 @@
+import csv
+import gzip
+import json
+import math
+
+# Lectura de cargas de trabajo desde archivos CSV o JSONL (opcionalmente comprimidos con gzip).
+# Cada fila describe un proceso: instante de llegada, memoria en MB y, opcionalmente, recurso,
+# duración de ráfaga y prioridad. Los archivos se leen línea por línea con un generador, así
+# que un archivo de varios gigabytes se procesa con memoria constante. Las llegadas tienen
+# que venir ordenadas por instante: una fila anterior a la previa es un error de la carga.
+# (Simulador.cargar igual hace entrar en el instante actual a una llegada que ya pasó, por
+# ejemplo si la carga se agrega con la simulación ya avanzada.)
+
+# Nombres de columna aceptados para cada campo
+COLUMNAS = {
+    'llegada': ('llegada', 'arrival', 'arrival_time'),
+    'memoria': ('memoria', 'memory', 'memory_mb'),
+    'recurso': ('recurso', 'resource'),
+    'rafaga': ('rafaga', 'burst', 'burst_length'),
+    'prioridad': ('prioridad', 'priority'),
+}
+
+# Clase para representar una fila de la carga
+class Llegada:
+    __slots__ = ('llegada', 'memoria', 'recurso', 'rafaga', 'prioridad')
+
+    def __init__(self, llegada, memoria, recurso=None, rafaga=None, prioridad=0):
+        self.llegada = llegada
+        self.memoria = memoria
+        self.recurso = recurso
+        self.rafaga = rafaga
+        self.prioridad = prioridad
+
+    def __repr__(self):
+        return (f"Llegada({self.llegada}, {self.memoria}, recurso={self.recurso}, "
+                f"rafaga={self.rafaga}, prioridad={self.prioridad})")
+
+# Funciones para convertir un campo a número: JSON ya trae números, y ahí un booleano o un
+# 100.7 para un campo entero se rechazan en vez de convertirse en 1 o en 100
+def _entero(valor):
+    if isinstance(valor, bool):
+        raise TypeError(f"se espera un entero, no {valor!r}")
+    if isinstance(valor, float):
+        if not valor.is_integer():
+            raise ValueError(f"se espera un entero, no {valor!r}")
+        return int(valor)
+    return int(valor)
+
+def _real(valor):
+    if isinstance(valor, bool):
+        raise TypeError(f"se espera un número, no {valor!r}")
+    return float(valor)
+
+# Función para convertir un diccionario con los nombres de columna aceptados en una Llegada;
+# si se conoce `numero_recursos` también se controla que el recurso sea uno de ellos
+def _a_llegada(fila, numero, numero_recursos=None):
+    valores = {}
+    for campo, nombres in COLUMNAS.items():
+        for nombre in nombres:
+            valor = fila.get(nombre)
+            if valor is not None and valor != '':
+                valores[campo] = valor
+                break
+    try:
+        llegada = Llegada(_real(valores['llegada']), _entero(valores['memoria']),
+                          _entero(valores['recurso']) if 'recurso' in valores else None,
+                          _real(valores['rafaga']) if 'rafaga' in valores else None,
+                          _entero(valores.get('prioridad', 0)))
+    except KeyError as error:
+        raise ValueError(f"Línea {numero}: falta el campo {error.args[0]}") from None
+    except (ValueError, TypeError) as error:
+        raise ValueError(f"Línea {numero}: valor inválido ({error})") from None
+    if not math.isfinite(llegada.llegada):
+        raise ValueError(f"Línea {numero}: el instante de llegada tiene que ser finito ({llegada.llegada})")
+    if llegada.rafaga is not None and not (math.isfinite(llegada.rafaga) and llegada.rafaga > 0):
+        raise ValueError(f"Línea {numero}: la ráfaga tiene que ser positiva y finita ({llegada.rafaga})")
+    if llegada.memoria <= 0:
+        raise ValueError(f"Línea {numero}: la memoria tiene que ser positiva ({llegada.memoria})")
+    if llegada.recurso is not None and numero_recursos is not None \
+            and not 0 <= llegada.recurso < numero_recursos:
+        raise ValueError(f"Línea {numero}: el recurso {llegada.recurso} no existe "
+                         f"(hay {numero_recursos}, de 0 a {numero_recursos - 1})")
+    return llegada
+
+def _abrir(ruta):
+    if ruta.endswith('.gz'):
+        return gzip.open(ruta, 'rt', newline='')
+    return open(ruta, newline='')
+
+# Función para convertir las filas (número de línea, diccionario) en llegadas controlando
+# que vengan ordenadas por instante
+def _llegadas(filas, numero_recursos):
+    anterior = -math.inf
+    for numero, fila in filas:
+        llegada = _a_llegada(fila, numero, numero_recursos)
+        if llegada.llegada < anterior:
+            raise ValueError(f"Línea {numero}: la llegada {llegada.llegada} es anterior a la de la "
+                             f"fila previa ({anterior}); la carga tiene que estar ordenada")
+        anterior = llegada.llegada
+        yield llegada
+
+def _filas_csv(archivo):
+    lector = csv.DictReader(archivo)
+    for fila in lector:
+        # line_num es la última línea física leída: cuenta las líneas en blanco y los
+        # campos entre comillas que ocupan varias líneas
+        yield lector.line_num, fila
+
+def _filas_jsonl(archivo):
+    for numero, linea in enumerate(archivo, start=1):
+        if linea.strip():
+            try:
+                fila = json.loads(linea)
+            except ValueError as error:
+                raise ValueError(f"Línea {numero}: JSON inválido ({error})") from None
+            if not isinstance(fila, dict):
+                raise ValueError(f"Línea {numero}: se espera un objeto JSON")
+            yield numero, fila
+
+# Función para leer una carga en CSV (con encabezado) línea por línea
+def leer_csv(ruta, numero_recursos=None):
+    with _abrir(ruta) as archivo:
+        yield from _llegadas(_filas_csv(archivo), numero_recursos)
+
+# Función para leer una carga en JSONL (un objeto por línea) línea por línea
+def leer_jsonl(ruta, numero_recursos=None):
+    with _abrir(ruta) as archivo:
+        yield from _llegadas(_filas_jsonl(archivo), numero_recursos)
+
+# Función para leer una carga eligiendo el formato por la extensión del archivo
+def leer_carga(ruta, numero_recursos=None):
+    nombre = ruta[:-3] if ruta.endswith('.gz') else ruta
+    if nombre.endswith(('.jsonl', '.ndjson', '.json')):
+        return leer_jsonl(ruta, numero_recursos)
+    if nombre.endswith('.csv'):
+        return leer_csv(ruta, numero_recursos)
+    raise ValueError(f"Formato de carga desconocido: {ruta} (se espera .csv o .jsonl)")
@@ -0,0 +1,89 @@
+import heapq
+from collections import OrderedDict, deque
+
+# Cola de procesos para un estado (Nuevos, Listos, Bloqueados, Terminados).
+# Internamente es un diccionario ordenado por id (una lista doblemente enlazada
+# con índice), así que encolar, sacar el primero y quitar un proceso puntual
+# cuestan O(1). Cada proceso guarda en `proceso.cola` la cola en la que está.
+class ColaEstado:
+    def __init__(self, nombre):
+        self.nombre = nombre
+        self._procesos = OrderedDict()
+
+    def __len__(self):
+        return len(self._procesos)
+
+    def __bool__(self):
+        return bool(self._procesos)
+
+    # Se recorre una copia para que otros hilos puedan seguir moviendo procesos mientras tanto
+    def __iter__(self):
+        return iter(list(self._procesos.values()))
+
+    def __contains__(self, proceso):
+        return proceso.cola is self
+
+    # Función para agregar un proceso al final de la cola
+    def append(self, proceso):
+        self._procesos[proceso.id] = proceso
+        proceso.cola = self
+
+    # Función para sacar el primer proceso de la cola
+    def popleft(self):
+        _, proceso = self._procesos.popitem(last=False)
+        proceso.cola = None
+        return proceso
+
+    # Función para quitar un proceso puntual de la cola
+    def remove(self, proceso):
+        del self._procesos[proceso.id]
+        proceso.cola = None
+
+    def clear(self):
+        for proceso in self._procesos.values():
+            proceso.cola = None
+        self._procesos.clear()
+
+# Cola de procesos que esperan memoria para ser admitidos, con un balde por cantidad de
+# páginas pedidas (FIFO dentro de cada balde). Los baldes se crean recién cuando alguien
+# pide esa cantidad, y un montículo guarda las cantidades con balde no vacío: cuando se
+# liberan páginas se mira solo el pedido más chico, así que con la memoria llena revisar
+# la cola cuesta O(1) y la cola ocupa memoria según los pedidos, no según la memoria total.
+class ColaAdmision:
+    def __init__(self):
+        self._baldes = {}  # Páginas pedidas -> deque de procesos (solo baldes no vacíos)
+        self._tamanos = []  # Montículo con las claves de _baldes
+        self._cantidad = 0
+
+    def __len__(self):
+        return self._cantidad
+
+    def __bool__(self):
+        return self._cantidad > 0
+
+    # Los procesos en orden de páginas pedidas
+    def __iter__(self):
+        return iter([proceso for paginas in sorted(self._baldes) for proceso in self._baldes[paginas]])
+
+    # Función para encolar un proceso que pide `paginas` páginas
+    def append(self, proceso, paginas):
+        balde = self._baldes.get(paginas)
+        if balde is None:
+            balde = self._baldes[paginas] = deque()
+            heapq.heappush(self._tamanos, paginas)
+        balde.append(proceso)
+        self._cantidad += 1
+
+    # Función para sacar el proceso que pide menos páginas si entra en `libres` páginas (si no, None)
+    def sacar(self, libres):
+        tamanos = self._tamanos
+        if not tamanos or tamanos[0] > libres:
+            return None
+        paginas = tamanos[0]
+        balde = self._baldes[paginas]
+        proceso = balde.popleft()
+        if not balde:
+            del self._baldes[paginas]
+            heapq.heappop(tamanos)
+        self._cantidad -= 1
+        return proceso
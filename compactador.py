@@ -0,0 +1,127 @@
+# Compactación incremental de la memoria paginada.
+# En lugar de reconstruir toda la tabla de páginas, se arma un plan de
+# reubicación con la menor cantidad posible de movimientos y solo se mueven
+# esas páginas. Cada compactación informa su costo para poder comparar políticas.
+
+UMBRAL_FRAGMENTACION = 0.5  # Compactar cuando más de la mitad de la memoria libre quedó en huecos
+PASOS_COMPACTACION = 4  # Máximo de páginas que se mueven en cada paso incremental
+VELOCIDAD_COPIA = 1000  # MB que se copian por unidad de tiempo simulado
+
+# Hacia dónde se corren las páginas ocupadas
+HACIA_INICIO = 'inicio'
+HACIA_FINAL = 'final'
+
+# Clase para acumular el costo de una o varias compactaciones
+class CostoCompactacion:
+    def __init__(self, paginas_movidas=0, bytes_copiados=0, tiempo=0.0):
+        self.paginas_movidas = paginas_movidas
+        self.bytes_copiados = bytes_copiados
+        self.tiempo = tiempo  # Tiempo simulado que llevó copiar las páginas
+
+    def __add__(self, otro):
+        return CostoCompactacion(self.paginas_movidas + otro.paginas_movidas,
+                                 self.bytes_copiados + otro.bytes_copiados,
+                                 self.tiempo + otro.tiempo)
+
+    def __str__(self):
+        return f"{self.paginas_movidas} páginas movidas, {self.bytes_copiados} bytes copiados, {self.tiempo:.3f} de tiempo"
+
+# Clase para representar un plan de reubicación: lista de movimientos (origen, destino)
+# donde cada destino está libre en el momento de aplicar su movimiento
+class PlanCompactacion:
+    def __init__(self, movimientos, inicio_hueco=None):
+        self.movimientos = movimientos
+        self.inicio_hueco = inicio_hueco  # Primera página del hueco que abre el plan (si se pidió un hueco)
+
+    def __len__(self):
+        return len(self.movimientos)
+
+    # Función para calcular el costo del plan según el tamaño de página (en MB)
+    def costo(self, tamano_pagina, velocidad_copia=VELOCIDAD_COPIA):
+        movidas = len(self.movimientos)
+        return CostoCompactacion(movidas, movidas * tamano_pagina * 1024 * 1024,
+                                 movidas * tamano_pagina / velocidad_copia)
+
+# Función para saber si conviene compactar según la fragmentación actual
+def necesita_compactar(memoria, umbral=UMBRAL_FRAGMENTACION):
+    return memoria.desplazadas > 0 and memoria.fragmentacion > umbral
+
+# Función para armar el plan que junta las páginas ocupadas contra un extremo.
+# Solo se mueven las páginas que quedan fuera de la zona final, cada una una sola vez,
+# así que la cantidad de movimientos es la mínima posible.
+def planificar(paginas, hacia=HACIA_INICIO, max_movimientos=None):
+    ocupadas = len(paginas) - paginas.count(None)
+    if hacia == HACIA_INICIO:
+        # Huecos en [0, ocupadas) reciben las páginas de [ocupadas, N), de la más alta a la más baja
+        huecos = (i for i in range(ocupadas) if paginas[i] is None)
+        origenes = (i for i in range(len(paginas) - 1, ocupadas - 1, -1) if paginas[i] is not None)
+    elif hacia == HACIA_FINAL:
+        # Huecos en [N - ocupadas, N) reciben las páginas de [0, N - ocupadas), de la más baja a la más alta
+        frontera = len(paginas) - ocupadas
+        huecos = (i for i in range(len(paginas) - 1, frontera - 1, -1) if paginas[i] is None)
+        origenes = (i for i in range(frontera) if paginas[i] is not None)
+    else:
+        raise ValueError(f"Dirección de compactación desconocida: {hacia}")
+
+    movimientos = []
+    for origen, destino in zip(origenes, huecos):
+        if max_movimientos is not None and len(movimientos) >= max_movimientos:
+            break
+        movimientos.append((origen, destino))
+    return PlanCompactacion(movimientos)
+
+# Función para armar el plan que abre un hueco de `cantidad` páginas seguidas moviendo
+# la menor cantidad de páginas: se elige la ventana con menos páginas ocupadas y esas
+# páginas se llevan a los huecos más cercanos al extremo indicado. Devuelve None si no
+# hay memoria libre suficiente.
+def planificar_hueco(paginas, cantidad, hacia=HACIA_INICIO):
+    total = len(paginas)
+    if cantidad <= 0 or paginas.count(None) < cantidad:
+        return None
+
+    # Ventana deslizante de tamaño `cantidad` contando páginas ocupadas
+    ocupadas = sum(1 for i in range(cantidad) if paginas[i] is not None)
+    mejor, mejor_inicio = ocupadas, 0
+    for inicio in range(1, total - cantidad + 1):
+        if paginas[inicio - 1] is not None:
+            ocupadas -= 1
+        if paginas[inicio + cantidad - 1] is not None:
+            ocupadas += 1
+        # Con empate se prefiere la ventana más cercana al extremo opuesto al que se corren las páginas
+        if ocupadas < mejor or (ocupadas == mejor and hacia == HACIA_INICIO):
+            mejor, mejor_inicio = ocupadas, inicio
+        if mejor == 0 and hacia == HACIA_FINAL:
+            break
+
+    fin = mejor_inicio + cantidad
+    origenes = [i for i in range(mejor_inicio, fin) if paginas[i] is not None]
+    afuera = list(range(mejor_inicio)) + list(range(fin, total))
+    if hacia == HACIA_FINAL:
+        afuera.reverse()
+    huecos = (i for i in afuera if paginas[i] is None)
+    return PlanCompactacion(list(zip(origenes, huecos)), mejor_inicio)
+
+# Función para aplicar un plan sobre el asignador de páginas.
+# `reubicar(dueno, origen, destino)` se llama por cada página movida para que el
+# dueño actualice su lista de páginas. Devuelve el costo de la compactación.
+def aplicar(memoria, plan, reubicar=None, velocidad_copia=VELOCIDAD_COPIA):
+    paginas = memoria.paginas
+    for origen, destino in plan.movimientos:
+        dueno = paginas[origen]
+        memoria.mover(origen, destino)
+        if reubicar is not None:
+            reubicar(dueno, origen, destino)
+    return plan.costo(memoria.tamano_pagina, velocidad_copia)
+
+# Función para compactar la memoria hacia el inicio moviendo a lo sumo `max_movimientos` páginas.
+# Un paso acotado le pide los movimientos al asignador, que ya sabe qué páginas quedaron por
+# encima de la frontera y qué huecos por debajo: cuesta O(max_movimientos · log páginas) y no
+# O(páginas). La compactación completa recorre la tabla igual, así que usa `planificar`.
+def compactar(memoria, reubicar=None, max_movimientos=None):
+    if not memoria.desplazadas:
+        return CostoCompactacion()
+    if max_movimientos is None:
+        plan = planificar(memoria.paginas, HACIA_INICIO)
+    else:
+        plan = PlanCompactacion(memoria.movimientos_compactacion(max_movimientos))
+    return aplicar(memoria, plan, reubicar)
@@ -0,0 +1,31 @@
+# Clase para representar una CPU simulada (CPU0, CPU1...) con su lugar de ejecución.
+# Lleva el tramo que está corriendo y cuánto tiempo estuvo ocupada, para medir la ocupación.
+# Con colas por CPU, `cola` es su propio planificador; con cola compartida es el mismo para todas.
+class CPU:
+    def __init__(self, id, cola):
+        self.id = id
+        self.cola = cola
+        self.proceso = None  # Proceso en ejecución
+        self.inicio_tramo = 0.0  # Cuándo empezó el tramo actual
+        self.tramo = 0.0  # Cuánto dura ese tramo
+        self.espera_fallos = 0.0  # Parte del tramo esperando al swap por fallos de página
+        self.evento = None  # Secuencia del evento FIN_RAFAGA pendiente
+        self.ocupado = 0.0  # Tiempo total ejecutando procesos
+        self.despachados = 0
+        self.tlb = None  # TLB propia de la CPU (si se simula)
+
+    def __str__(self):
+        if self.proceso is None:
+            return f"CPU{self.id}: Libre"
+        return f"CPU{self.id}: P{self.proceso.id}"
+
+    # Fracción del tiempo que estuvo ocupada hasta el instante `reloj`
+    def ocupacion(self, reloj):
+        ocupado = self.ocupado
+        if self.proceso is not None:
+            ocupado += reloj - self.inicio_tramo
+        return ocupado / reloj if reloj > 0 else 0.0
+
+# Función para crear las CPUs; `crear_cola()` da la cola de cada una (o None si la comparten)
+def crear_cpus(cantidad, cola_compartida=None, crear_cola=None):
+    return [CPU(i, cola_compartida if crear_cola is None else crear_cola()) for i in range(cantidad)]
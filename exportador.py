@@ -0,0 +1,128 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Servidor HTTP local que publica el estado del simulador en el formato de texto de
+# Prometheus (GET /metrics). Corre en un hilo aparte y solo lee contadores que el
+# simulador ya mantiene (largos de cola, memoria, recursos, transiciones): nunca toma
+# el lock del simulador, así un scrape no frena la simulación.
+
+PUERTO = 9464
+TIPO_CONTENIDO = 'text/plain; version=0.0.4; charset=utf-8'
+
+# Función para armar el texto de las métricas a partir del estado actual del simulador
+def texto_metricas(simulador):
+    lineas = []
+
+    def metrica(nombre, tipo, ayuda, valores):
+        lineas.append(f"# HELP {nombre} {ayuda}")
+        lineas.append(f"# TYPE {nombre} {tipo}")
+        for etiquetas, valor in valores:
+            if etiquetas:
+                texto = ",".join(f'{clave}="{dato}"' for clave, dato in etiquetas.items())
+                lineas.append(f"{nombre}{{{texto}}} {valor}")
+            else:
+                lineas.append(f"{nombre} {valor}")
+
+    reloj = simulador.reloj
+    memoria = simulador.memoria
+    metrica('simulador_reloj', 'gauge', 'Reloj virtual de la simulación', [({}, reloj)])
+    metrica('simulador_cola_procesos', 'gauge', 'Procesos en cada cola de estado', [
+        ({'estado': cola.nombre}, len(cola))
+        for cola in (simulador.procesos_nuevos, simulador.procesos_listos,
+                     simulador.procesos_bloqueados, simulador.procesos_terminados)])
+    if simulador.esperando_memoria is not None:
+        metrica('simulador_esperando_memoria', 'gauge', 'Procesos que esperan memoria para ser admitidos',
+                [({}, len(simulador.esperando_memoria))])
+    metrica('simulador_procesos_total', 'counter', 'Procesos admitidos, rechazados y terminados', [
+        ({'resultado': 'admitido'}, simulador.admitidos),
+        ({'resultado': 'rechazado'}, simulador.rechazados),
+        ({'resultado': 'terminado'}, simulador.terminados)])
+    metrica('simulador_memoria_usada_mb', 'gauge', 'MEMORIA_USADA: memoria ocupada por páginas asignadas',
+            [({}, memoria.memoria_usada)])
+    metrica('simulador_memoria_total_mb', 'gauge', 'Memoria total', [({}, memoria.memoria_total)])
+    metrica('simulador_fragmentacion', 'gauge', 'Fracción de la memoria libre repartida en huecos',
+            [({}, memoria.fragmentacion)])
+    if simulador.buddy:
+        metrica('simulador_fragmentacion_interna', 'gauge', 'Fracción de las páginas ocupadas que el buddy asignó de más',
+                [({}, memoria.fragmentacion_interna)])
+    memoria_virtual = simulador.memoria_virtual
+    if memoria_virtual is not None:
+        metrica('simulador_referencias_total', 'counter', 'Referencias a memoria virtual',
+                [({}, memoria_virtual.referencias)])
+        metrica('simulador_fallos_pagina_total', 'counter', 'Fallos de página (usar rate() para la tasa)',
+                [({'politica': memoria_virtual.politica.nombre}, memoria_virtual.fallos)])
+        metrica('simulador_desalojos_total', 'counter', 'Páginas desalojadas al swap',
+                [({}, memoria_virtual.desalojos)])
+    if simulador.tlb is not None:
+        metrica('simulador_tlb_aciertos_total', 'counter', 'Aciertos de la TLB',
+                [({'cpu': str(cpu.id)}, cpu.tlb.aciertos) for cpu in simulador.cpus])
+        metrica('simulador_tlb_fallos_total', 'counter', 'Fallos de la TLB',
+                [({'cpu': str(cpu.id)}, cpu.tlb.fallos) for cpu in simulador.cpus])
+        metrica('simulador_tlb_vaciados_total', 'counter', 'Vaciados de la TLB por cambio de contexto',
+                [({'cpu': str(cpu.id)}, cpu.tlb.vaciados) for cpu in simulador.cpus])
+    metrica('simulador_recurso_ocupado', 'gauge', '1 si el recurso tiene dueño', [
+        ({'recurso': f"R{recurso.id}"}, int(recurso.ocupado_por is not None)) for recurso in simulador.recursos])
+    metrica('simulador_recurso_esperando', 'gauge', 'Procesos en la cola de espera del recurso', [
+        ({'recurso': f"R{recurso.id}"}, len(recurso.esperando)) for recurso in simulador.recursos])
+    metrica('simulador_cpu_ocupacion', 'gauge', 'Fracción del tiempo virtual que la CPU estuvo ocupada', [
+        ({'cpu': str(cpu.id)}, cpu.ocupacion(reloj)) for cpu in simulador.cpus])
+    metrica('simulador_transiciones_total', 'counter', 'Transiciones de estado (usar rate() para la tasa)',
+            [({}, simulador.transiciones)])
+
+    metricas = simulador.metricas
+    if metricas is not None:
+        # copy() de un diccionario es atómico con el GIL aunque el simulador lo esté modificando
+        metrica('simulador_transiciones_estado_total', 'counter', 'Transiciones por estado de origen y destino', [
+            ({'de': anterior, 'a': nuevo}, cantidad)
+            for (anterior, nuevo), cantidad in metricas.transiciones.copy().items()])
+        for nombre, histograma in (('retorno', metricas.retorno), ('espera', metricas.espera),
+                                   ('respuesta', metricas.respuesta), ('bloqueado', metricas.bloqueado)):
+            baldes = list(histograma.baldes)
+            acumulado = 0
+            valores = []
+            for limite, cuenta in zip(histograma.limites, baldes):
+                acumulado += cuenta
+                valores.append(({'le': '+Inf' if limite == float('inf') else limite}, acumulado))
+            lineas.append(f"# HELP simulador_tiempo_{nombre} Tiempo de {nombre} de los procesos terminados")
+            lineas.append(f"# TYPE simulador_tiempo_{nombre} histogram")
+            for etiquetas, valor in valores:
+                lineas.append(f'simulador_tiempo_{nombre}_bucket{{le="{etiquetas["le"]}"}} {valor}')
+            lineas.append(f"simulador_tiempo_{nombre}_sum {histograma.suma}")
+            lineas.append(f"simulador_tiempo_{nombre}_count {acumulado}")
+    return "\n".join(lineas) + "\n"
+
+class _Manejador(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.split('?')[0] not in ('/metrics', '/'):
+            self.send_error(404)
+            return
+        cuerpo = texto_metricas(self.server.simulador).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', TIPO_CONTENIDO)
+        self.send_header('Content-Length', str(len(cuerpo)))
+        self.end_headers()
+        self.wfile.write(cuerpo)
+
+    def log_message(self, formato, *argumentos):
+        pass  # Sin una línea en la consola por cada scrape
+
+# Clase para publicar las métricas de un simulador en http://direccion:puerto/metrics
+class ServidorMetricas:
+    def __init__(self, simulador, puerto=PUERTO, direccion='127.0.0.1'):
+        self.servidor = ThreadingHTTPServer((direccion, puerto), _Manejador)
+        self.servidor.daemon_threads = True
+        self.servidor.simulador = simulador
+        self.hilo = threading.Thread(target=self.servidor.serve_forever, daemon=True)
+
+    @property
+    def direccion(self):
+        host, puerto = self.servidor.server_address[:2]
+        return f"http://{host}:{puerto}/metrics"
+
+    def iniciar(self):
+        self.hilo.start()
+        return self
+
+    def detener(self):
+        self.servidor.shutdown()
+        self.servidor.server_close()
@@ -0,0 +1,110 @@
+import tkinter as tk
+from tkinter import messagebox
+
+from vistas import CanvasMemoria, ListaProcesos, RefrescoInterfaz
+
+# Interfaz gráfica que se conecta a un Simulador que ya está corriendo (en otro hilo).
+# No tiene lógica propia de memoria ni de planificación: lee el estado del simulador
+# bajo su lock y solo redibuja lo que cambió, a lo sumo una vez por cuadro.
+class Interfaz(tk.Tk):
+    def __init__(self, simulador, titulo="Simulación de Procesos y Memoria"):
+        super().__init__()
+        self.title(titulo)
+        self.simulador = simulador
+        self._rechazados_vistos = simulador.rechazados
+        self._admitidos_vistos = simulador.admitidos
+
+        # Widgets de memoria y procesos
+        self.memoria_label = tk.Label(self, text="")
+        self.memoria_label.pack()
+
+        self.canvas = tk.Canvas(self, width=500, height=300, bg="white")
+        self.canvas.pack()
+        self.vista_memoria = CanvasMemoria(self.canvas, simulador.numero_paginas)
+
+        self.listas = []
+        for nombre, cola in (("Nuevos", simulador.procesos_nuevos), ("Listos", simulador.procesos_listos),
+                             ("Bloqueados", simulador.procesos_bloqueados),
+                             ("Terminados", simulador.procesos_terminados)):
+            frame = tk.Frame(self)
+            frame.pack(side=tk.LEFT, padx=10)
+            tk.Label(frame, text=nombre).pack()
+            listbox = tk.Listbox(frame, width=30, height=10)
+            listbox.pack()
+            self.listas.append((ListaProcesos(listbox), cola))
+
+        # Entrada y botones para agregar procesos
+        self.memoria_entry = tk.Entry(self)
+        self.memoria_entry.pack(pady=10)
+        tk.Button(self, text="Agregar Proceso Manual", command=self.agregar_proceso_manual).pack(pady=5)
+        tk.Button(self, text="Agregar Proceso Aleatorio", command=self.agregar_proceso_aleatorio).pack(pady=5)
+
+        # Estado de ejecución y mensajes
+        self.ejecucion_label = tk.Label(self, text="")
+        self.ejecucion_label.pack(pady=10)
+        self.mensaje_error = tk.Label(self, text="", fg="red")
+        self.mensaje_error.pack()
+
+        # Estado de los recursos
+        self.recurso_labels = []
+        for recurso in simulador.recursos:
+            label = tk.Label(self, text=str(recurso))
+            label.pack()
+            self.recurso_labels.append(label)
+
+        # Conectarse al simulador: a partir de acá registra qué páginas cambian y avisa cada evento
+        self.refresco = RefrescoInterfaz(self, self.dibujar_interfaz)
+        with simulador.lock:
+            simulador.memoria.activar_cambios()
+            self.vista_memoria.dibujar(simulador.paginas_memoria)
+            simulador.al_cambiar = self.refresco.marcar
+        self.refresco.iniciar()
+
+    # Función para agregar un proceso manualmente
+    def agregar_proceso_manual(self):
+        try:
+            memoria_necesaria = int(self.memoria_entry.get())
+            if memoria_necesaria > 0:
+                self.simulador.agregar_proceso(memoria_necesaria)
+            else:
+                messagebox.showerror("Error", "La memoria debe ser un número positivo.")
+        except ValueError:
+            messagebox.showerror("Error", "Ingrese un valor numérico válido para la memoria.")
+        finally:
+            self.memoria_entry.delete(0, tk.END)  # Limpiar el campo de entrada
+
+    # Función para agregar un proceso aleatorio
+    def agregar_proceso_aleatorio(self):
+        self.simulador.agregar_proceso(self.simulador.aleatorio.randint(50, 200))
+
+    # Función para redibujar la interfaz gráfica (la llama el refresco en el hilo de Tk)
+    def dibujar_interfaz(self):
+        simulador = self.simulador
+        with simulador.lock:
+            texto = f"Memoria Usada: {simulador.memoria_usada}/{simulador.memoria_total} MB"
+            if simulador.compactar:
+                texto += f" (compactación: {simulador.costo_compactacion.paginas_movidas} páginas movidas)"
+            self.memoria_label.config(text=texto)
+
+            # Actualizar las listas de procesos (solo las líneas que cambiaron)
+            for lista, cola in self.listas:
+                lista.dibujar(cola)
+
+            # Qué corre en cada CPU y qué fracción del tiempo estuvo ocupada
+            self.ejecucion_label.config(text="\n".join(
+                f"{cpu} (ocupación {cpu.ocupacion(simulador.reloj):.0%})" for cpu in simulador.cpus))
+
+            # Avisar si algún proceso nuevo no entró en memoria; el aviso se borra al admitir otro
+            rechazados, admitidos = simulador.rechazados, simulador.admitidos
+            if rechazados > self._rechazados_vistos:
+                self.mensaje_error.config(text="Memoria insuficiente para el nuevo proceso.")
+            elif admitidos > self._admitidos_vistos:
+                self.mensaje_error.config(text="")
+            self._rechazados_vistos, self._admitidos_vistos = rechazados, admitidos
+
+            # Mostrar procesos en memoria (solo las páginas que cambiaron)
+            self.vista_memoria.dibujar(simulador.paginas_memoria, simulador.memoria.tomar_cambios())
+
+            # Actualizar estado de los recursos
+            for label, recurso in zip(self.recurso_labels, simulador.recursos):
+                label.config(text=str(recurso))
@@ -0,0 +1,485 @@
+import heapq
+import threading
+
+# Lado de la frontera `paginas_usadas` en el que quedó mal una página (ver AsignadorPaginas)
+DESPLAZADA = 1  # Ocupada por encima de la frontera
+HUECO = 2  # Libre por debajo de la frontera
+
+# Base de los asignadores de memoria física: la tabla de páginas (dueño de cada página),
+# el registro de páginas cambiadas y el lock. Cada asignador cuenta sus páginas libres.
+class _Asignador:
+    def __init__(self, numero_paginas, tamano_pagina, registrar_cambios=False):
+        self.numero_paginas = numero_paginas
+        self.tamano_pagina = tamano_pagina
+        self.paginas = [None] * numero_paginas  # Tabla de páginas para la memoria
+        # Páginas cuyo dueño cambió desde la última vez que se pidieron (para redibujar solo esas)
+        self.cambios = set() if registrar_cambios else None
+        self.lock = threading.Lock()
+
+    @property
+    def paginas_usadas(self):
+        return self.numero_paginas - self.paginas_libres
+
+    @property
+    def memoria_total(self):
+        return self.numero_paginas * self.tamano_pagina
+
+    @property
+    def memoria_usada(self):
+        return self.paginas_usadas * self.tamano_pagina
+
+    # Función para empezar a registrar las páginas que cambian (por ejemplo al conectar una interfaz)
+    def activar_cambios(self):
+        with self.lock:
+            if self.cambios is None:
+                self.cambios = set()
+
+    # Función para obtener y vaciar el conjunto de páginas cambiadas
+    def tomar_cambios(self):
+        with self.lock:
+            cambios = self.cambios
+            if cambios is not None:
+                self.cambios = set()
+            return cambios
+
+    # Función para calcular cuántas páginas ocupa una cantidad de memoria (redondeo hacia arriba)
+    def paginas_necesarias(self, memoria):
+        return (memoria + self.tamano_pagina - 1) // self.tamano_pagina
+
+# Asignador de páginas de memoria con una lista de páginas libres.
+# Mantiene la tabla de páginas (dueño de cada página) y una pila con las
+# páginas libres, de modo que asignar y liberar cuestan O(páginas pedidas)
+# en lugar de recorrer toda la memoria.
+class AsignadorPaginas(_Asignador):
+    def __init__(self, numero_paginas, tamano_pagina, registrar_cambios=False):
+        super().__init__(numero_paginas, tamano_pagina, registrar_cambios)
+        # Pila de páginas libres (la página más baja queda arriba) y posición
+        # de cada página dentro de la pila, para poder sacar una página puntual en O(1)
+        self._libres = list(range(numero_paginas - 1, -1, -1))
+        self._posicion = list(range(numero_paginas - 1, -1, -1))
+        # Páginas ocupadas que quedaron por encima de la frontera `paginas_usadas` (desplazadas) y
+        # páginas libres por debajo de ella (huecos); siempre hay tantas de unas como de otras.
+        # Para compactar por pasos hacen falta la desplazada más alta y el hueco más bajo: los dan
+        # dos montículos que se arman recién la primera vez que se piden movimientos (sin
+        # compactación no cuestan nada). Desde ahí asignar y liberar solo anotan en `_nuevas` las
+        # páginas que pasan a un lado y se llevan al montículo al compactar; las que ya no son de
+        # ese lado se descartan al aparecer arriba o al rearmar el montículo (borrado perezoso).
+        self._montones = None  # Lado -> montículo (las desplazadas como -página, la más alta arriba)
+        self._nuevas = None  # Lado -> páginas que pasaron a ese lado desde la última compactación
+        self.desplazadas = 0
+
+    @property
+    def paginas_libres(self):
+        return len(self._libres)
+
+    # Fracción de la memoria libre que quedó repartida en huecos (0 = toda la memoria libre está al final)
+    @property
+    def fragmentacion(self):
+        libres = len(self._libres)
+        return self.desplazadas / libres if libres else 0.0
+
+    # Función para asignar `cantidad` páginas a `dueno`; devuelve la lista de páginas o None
+    def asignar(self, dueno, cantidad):
+        with self.lock:
+            libres = self._libres
+            if len(libres) < cantidad:
+                return None
+            asignadas = []
+            for _ in range(cantidad):
+                pagina = libres.pop()
+                self._ocupar(pagina, dueno)
+                asignadas.append(pagina)
+            return asignadas
+
+    # Función para asignar `cantidad` páginas consecutivas (primer hueco que alcance); devuelve None si no hay hueco
+    def asignar_contiguas(self, dueno, cantidad):
+        with self.lock:
+            if len(self._libres) < cantidad:
+                return None
+            if self.desplazadas == 0:
+                # Toda la memoria libre está al final
+                inicio = self.numero_paginas - len(self._libres)
+            else:
+                inicio = self._buscar_hueco(cantidad)
+                if inicio is None:
+                    return None
+            asignadas = list(range(inicio, inicio + cantidad))
+            for pagina in asignadas:
+                self._tomar(pagina)
+                self._ocupar(pagina, dueno)
+            return asignadas
+
+    # Función para asignar a `dueno` páginas puntuales (que tienen que estar libres)
+    def ocupar(self, dueno, paginas):
+        with self.lock:
+            for pagina in paginas:
+                self._tomar(pagina)
+                self._ocupar(pagina, dueno)
+
+    # Función para buscar el primer tramo de `cantidad` páginas libres seguidas
+    def _buscar_hueco(self, cantidad):
+        seguidas = 0
+        for i, dueno in enumerate(self.paginas):
+            if dueno is not None:
+                seguidas = 0
+                continue
+            seguidas += 1
+            if seguidas == cantidad:
+                return i - cantidad + 1
+        return None
+
+    # Función para devolver páginas a la lista de libres
+    def liberar(self, paginas_liberadas):
+        with self.lock:
+            libres = self._libres
+            paginas = self.paginas
+            for pagina in paginas_liberadas:
+                if paginas[pagina] is None:
+                    continue  # Ya estaba libre
+                self._desocupar(pagina)
+                self._posicion[pagina] = len(libres)
+                libres.append(pagina)
+            self._acotar_anotadas()
+
+    # Función para saber si una página sigue del lado indicado de la frontera
+    def _de_lado(self, pagina, lado):
+        if lado == DESPLAZADA:
+            return pagina >= self.paginas_usadas and self.paginas[pagina] is not None
+        return pagina < self.paginas_usadas and self.paginas[pagina] is None
+
+    # Función para anotar una página que pasó a un lado (solo una vez armados los montículos)
+    def _anotar(self, pagina, lado):
+        self._nuevas[lado].append(pagina)
+
+    # Función para que las anotadas no crezcan sin límite si pasa mucho sin compactar. Se llama
+    # con la tabla y la lista de libres al día: `_limpiar` mira de qué lado queda cada página
+    def _acotar_anotadas(self):
+        nuevas = self._nuevas
+        if nuevas is not None and len(nuevas[DESPLAZADA]) + len(nuevas[HUECO]) > 4 * self.desplazadas + 128:
+            self._limpiar(DESPLAZADA)
+            self._limpiar(HUECO)
+
+    # Función para rearmar el montículo de un lado con sus páginas anotadas, sin repetidas
+    # ni las que ya no son de ese lado
+    def _limpiar(self, lado):
+        signo = -1 if lado == DESPLAZADA else 1
+        paginas = {signo * entrada for entrada in self._montones[lado]}
+        paginas.update(self._nuevas[lado])
+        monton = [signo * pagina for pagina in paginas if self._de_lado(pagina, lado)]
+        heapq.heapify(monton)
+        self._montones[lado] = monton
+        self._nuevas[lado] = []
+
+    # Función para marcar una página como ocupada (la página ya salió de la lista de libres)
+    def _ocupar(self, pagina, dueno):
+        paginas = self.paginas
+        frontera = self.numero_paginas - len(self._libres) - 1  # Frontera antes de ocupar la página
+        paginas[pagina] = dueno
+        if self.cambios is not None:
+            self.cambios.add(pagina)
+        if pagina >= frontera:
+            self.desplazadas += 1
+            if self._nuevas is not None and pagina > frontera:
+                self._anotar(pagina, DESPLAZADA)
+        if paginas[frontera] is not None:
+            self.desplazadas -= 1  # La página de la frontera pasa a quedar por debajo
+        elif self._nuevas is not None:
+            self._anotar(frontera, HUECO)  # Y si está libre queda como hueco
+        if self._nuevas is not None:
+            self._acotar_anotadas()
+
+    # Función para marcar una página como libre (todavía no está en la lista de libres)
+    def _desocupar(self, pagina):
+        paginas = self.paginas
+        frontera = self.numero_paginas - len(self._libres)  # Frontera antes de liberar la página
+        paginas[pagina] = None
+        if self.cambios is not None:
+            self.cambios.add(pagina)
+        if pagina >= frontera:
+            self.desplazadas -= 1
+        elif self._nuevas is not None and pagina < frontera - 1:
+            self._anotar(pagina, HUECO)
+        if paginas[frontera - 1] is not None:
+            self.desplazadas += 1  # La última página por debajo pasa a quedar por encima
+            if self._nuevas is not None:
+                self._anotar(frontera - 1, DESPLAZADA)
+
+    # Función para sacar una página puntual de la lista de libres
+    def _tomar(self, pagina):
+        libres = self._libres
+        indice = self._posicion[pagina]
+        ultima = libres.pop()
+        if ultima != pagina:
+            libres[indice] = ultima
+            self._posicion[ultima] = indice
+
+    # Función para mover el contenido de la página `origen` a la página libre `destino`
+    def mover(self, origen, destino):
+        with self.lock:
+            self._tomar(destino)
+            self.paginas[destino] = self.paginas[origen]
+            self.paginas[origen] = None
+            if self.cambios is not None:
+                self.cambios.update((origen, destino))
+            self._posicion[origen] = len(self._libres)
+            self._libres.append(origen)
+            frontera = self.numero_paginas - len(self._libres)
+            if origen >= frontera:
+                self.desplazadas -= 1
+            elif self._nuevas is not None:
+                self._anotar(origen, HUECO)
+            if destino >= frontera:
+                self.desplazadas += 1
+                if self._nuevas is not None:
+                    self._anotar(destino, DESPLAZADA)
+            self._acotar_anotadas()
+
+    # Función para elegir hasta `cantidad` movimientos que compactan la memoria hacia el inicio:
+    # las páginas desplazadas más altas a los huecos más bajos, como `compactador.planificar`,
+    # pero sin recorrer la tabla de páginas: O(movimientos · log páginas)
+    def movimientos_compactacion(self, cantidad=None):
+        with self.lock:
+            if cantidad is None or cantidad > self.desplazadas:
+                cantidad = self.desplazadas
+            origenes = self._primeras(DESPLAZADA, cantidad)
+            destinos = self._primeras(HUECO, cantidad)
+            return list(zip(origenes, destinos))
+
+    # Función para armar los montículos con las páginas que están de cada lado (recorre la tabla)
+    def _armar_montones(self):
+        frontera = self.paginas_usadas
+        paginas = self.paginas
+        self._montones = {DESPLAZADA: [], HUECO: []}
+        self._nuevas = {DESPLAZADA: [i for i in range(frontera, self.numero_paginas) if paginas[i] is not None],
+                        HUECO: [i for i in range(frontera) if paginas[i] is None]}
+        self._limpiar(DESPLAZADA)
+        self._limpiar(HUECO)
+
+    # Función para obtener las primeras `cantidad` páginas de un lado (sin sacarlas de su montículo)
+    def _primeras(self, lado, cantidad):
+        if self._montones is None:
+            self._armar_montones()  # Primera compactación
+        # Pasar las anotadas al montículo: de a una si son pocas, si no rearmándolo entero
+        if len(self._nuevas[lado]) > len(self._montones[lado]) or len(self._montones[lado]) > 2 * self.desplazadas + 64:
+            self._limpiar(lado)
+        signo = -1 if lado == DESPLAZADA else 1
+        monton = self._montones[lado]
+        for pagina in self._nuevas[lado]:
+            heapq.heappush(monton, signo * pagina)
+        self._nuevas[lado] = []
+        elegidas = []
+        vistas = set()  # Una página puede estar repetida en el montículo
+        while len(elegidas) < cantidad:
+            pagina = signo * heapq.heappop(monton)
+            if pagina not in vistas and self._de_lado(pagina, lado):
+                vistas.add(pagina)
+                elegidas.append(pagina)
+        for pagina in elegidas:
+            heapq.heappush(monton, signo * pagina)
+        return elegidas
+
+    # Función para reconstruir la lista de libres a partir de la tabla de páginas
+    def reconstruir(self):
+        with self.lock:
+            self._libres = [i for i in range(self.numero_paginas - 1, -1, -1) if self.paginas[i] is None]
+            for indice, pagina in enumerate(self._libres):
+                self._posicion[pagina] = indice
+            frontera = self.numero_paginas - len(self._libres)
+            self.desplazadas = sum(1 for dueno in self.paginas[frontera:] if dueno is not None)
+            if self._montones is not None:
+                self._armar_montones()  # Ya se venía compactando: se rearman ahora
+            if self.cambios is not None:
+                self.cambios.update(range(self.numero_paginas))
+
+# Asignador buddy binario: la memoria se reparte en bloques de 2^orden páginas alineados a su
+# tamaño. Un pedido de `cantidad` páginas recibe un bloque del menor orden que alcance, partiendo
+# a la mitad uno más grande si hace falta; al liberarlo se fusiona con su compañero (el bloque
+# vecino del mismo orden, `inicio ^ 2^orden`) mientras el compañero esté libre. Partir y fusionar
+# cuestan O(log páginas) porque hay un conjunto de bloques libres por orden. Las páginas que el
+# bloque da de más quedan ocupadas sin usar: es la fragmentación interna, que se lleva por
+# asignación. Todas las páginas del bloque se devuelven como del dueño, así que liberar la lista
+# completa (o solo la primera página del bloque) deja libre el bloque entero.
+class AsignadorBuddy(_Asignador):
+    def __init__(self, numero_paginas, tamano_pagina, registrar_cambios=False):
+        super().__init__(numero_paginas, tamano_pagina, registrar_cambios)
+        self.orden_maximo = max(numero_paginas.bit_length() - 1, 0)
+        self._libres = [set() for _ in range(self.orden_maximo + 1)]  # Orden -> inicios de bloques libres
+        self._cantidad_libres = numero_paginas
+        # Si la memoria no es potencia de dos, arranca partida en los bloques alineados más grandes
+        inicio = 0
+        while inicio < numero_paginas:
+            orden = (numero_paginas - inicio).bit_length() - 1
+            if inicio:
+                orden = min(orden, (inicio & -inicio).bit_length() - 1)
+            self._libres[orden].add(inicio)
+            inicio += 1 << orden
+        self.bloques = {}  # Inicio de cada bloque asignado -> (orden, páginas pedidas)
+        self.desperdicio = 0  # Páginas asignadas de más en los bloques ocupados ahora
+        self.asignaciones = 0
+        self.paginas_pedidas = 0  # Acumulados de todas las asignaciones
+        self.paginas_entregadas = 0
+        self.divisiones = 0
+        self.fusiones = 0
+
+    @property
+    def paginas_libres(self):
+        return self._cantidad_libres
+
+    # Páginas del bloque libre más grande: el pedido más grande que se puede atender ahora
+    @property
+    def mayor_bloque(self):
+        for orden in range(self.orden_maximo, -1, -1):
+            if self._libres[orden]:
+                return 1 << orden
+        return 0
+
+    # Páginas del bloque más grande posible (con la memoria vacía)
+    @property
+    def bloque_maximo(self):
+        return 1 << self.orden_maximo if self.numero_paginas else 0
+
+    # Fragmentación externa: fracción de la memoria libre que no está en el bloque libre más grande
+    @property
+    def fragmentacion(self):
+        libres = self._cantidad_libres
+        return 1 - self.mayor_bloque / libres if libres else 0.0
+
+    # Fragmentación interna: fracción de las páginas ocupadas que se asignaron de más
+    @property
+    def fragmentacion_interna(self):
+        usadas = self.paginas_usadas
+        return self.desperdicio / usadas if usadas else 0.0
+
+    # Función para asignar a `dueno` un bloque de al menos `cantidad` páginas; devuelve sus páginas o None
+    def asignar(self, dueno, cantidad):
+        if cantidad <= 0:
+            return []
+        orden = (cantidad - 1).bit_length()
+        with self.lock:
+            libres = self._libres
+            actual = orden
+            while actual <= self.orden_maximo and not libres[actual]:
+                actual += 1
+            if actual > self.orden_maximo:
+                return None
+            inicio = libres[actual].pop()
+            while actual > orden:
+                # Partir el bloque: la mitad alta queda libre un orden más abajo
+                actual -= 1
+                libres[actual].add(inicio + (1 << actual))
+                self.divisiones += 1
+            tamano = 1 << orden
+            asignadas = range(inicio, inicio + tamano)
+            self.paginas[inicio:inicio + tamano] = [dueno] * tamano
+            if self.cambios is not None:
+                self.cambios.update(asignadas)
+            self.bloques[inicio] = (orden, cantidad)
+            self._cantidad_libres -= tamano
+            self.desperdicio += tamano - cantidad
+            self.asignaciones += 1
+            self.paginas_pedidas += cantidad
+            self.paginas_entregadas += tamano
+            return list(asignadas)
+
+    # Los bloques ya son contiguos
+    asignar_contiguas = asignar
+
+    # Función para liberar los bloques que empiezan en alguna de las páginas dadas
+    def liberar(self, paginas_liberadas):
+        with self.lock:
+            libres = self._libres
+            for inicio in paginas_liberadas:
+                bloque = self.bloques.pop(inicio, None)
+                if bloque is None:
+                    continue  # No es el inicio de un bloque asignado (o ya estaba libre)
+                orden, pedidas = bloque
+                tamano = 1 << orden
+                self.paginas[inicio:inicio + tamano] = [None] * tamano
+                if self.cambios is not None:
+                    self.cambios.update(range(inicio, inicio + tamano))
+                self._cantidad_libres += tamano
+                self.desperdicio -= tamano - pedidas
+                while orden < self.orden_maximo:
+                    companero = inicio ^ (1 << orden)
+                    if companero not in libres[orden]:
+                        break
+                    libres[orden].remove(companero)
+                    inicio = min(inicio, companero)
+                    orden += 1
+                    self.fusiones += 1
+                libres[orden].add(inicio)
+
+    def resumen(self):
+        return {
+            'paginas': self.numero_paginas,
+            'bloque_maximo': self.bloque_maximo,
+            'mayor_bloque_libre': self.mayor_bloque,
+            'fragmentacion_externa': self.fragmentacion,
+            'fragmentacion_interna': self.fragmentacion_interna,
+            'desperdicio_paginas': self.desperdicio,
+            'asignaciones': self.asignaciones,
+            'paginas_pedidas': self.paginas_pedidas,
+            'paginas_entregadas': self.paginas_entregadas,
+            # Fragmentación interna de todas las asignaciones hechas, no solo de las que siguen vivas
+            'fragmentacion_interna_acumulada': (1 - self.paginas_pedidas / self.paginas_entregadas
+                                                if self.paginas_entregadas else 0.0),
+            'divisiones': self.divisiones,
+            'fusiones': self.fusiones,
+        }
+
+# Memoria paginada donde cada página guarda el id del proceso que la ocupa y la
+# memoria usada se cuenta por el espacio que pidió cada proceso (la lógica de 1.py,
+# sin interfaz gráfica). Un mismo id puede agregarse varias veces y se libera todo junto.
+# Con `buddy`, las páginas se reparten en bloques de un asignador buddy en lugar de sueltas.
+class MemoriaProcesos:
+    def __init__(self, tamano_memoria, tamano_pagina, buddy=False):
+        self.tamano_memoria = tamano_memoria
+        self.tamano_pagina = tamano_pagina
+        self.paginas_totales = tamano_memoria // tamano_pagina
+        asignador = AsignadorBuddy if buddy else AsignadorPaginas
+        self.asignador = asignador(self.paginas_totales, tamano_pagina, registrar_cambios=True)
+        self.memoria_usada = 0  # Espacio usado en memoria
+        self._procesos = {}  # id del proceso -> [páginas, espacio]
+        self.lock = threading.Lock()
+
+    # Tabla de páginas: id del proceso que ocupa cada página (o None)
+    @property
+    def paginas(self):
+        return self.asignador.paginas
+
+    # Función para agregar un proceso; devuelve False si no hay espacio suficiente
+    def agregar(self, id_proceso, espacio):
+        with self.lock:
+            if self.memoria_usada + espacio > self.tamano_memoria:
+                return False
+            paginas = self.asignador.asignar(id_proceso, self.asignador.paginas_necesarias(espacio))
+            if paginas is None:
+                return False
+            registro = self._procesos.setdefault(id_proceso, [[], 0])
+            registro[0].extend(paginas)
+            registro[1] += espacio
+            self.memoria_usada += espacio
+            return True
+
+    # Función para liberar la memoria de un proceso; devuelve la cantidad de páginas liberadas
+    def liberar(self, id_proceso):
+        with self.lock:
+            registro = self._procesos.pop(id_proceso, None)
+            if registro is None:
+                return 0
+            paginas, espacio = registro
+            self.asignador.liberar(paginas)
+            self.memoria_usada -= espacio
+            return len(paginas)
+
+    # Función para vaciar toda la memoria
+    def reiniciar(self):
+        with self.lock:
+            for paginas, _ in self._procesos.values():
+                self.asignador.liberar(paginas)
+            self._procesos.clear()
+            self.memoria_usada = 0
+
+    # Función para obtener y vaciar el conjunto de páginas cambiadas
+    def tomar_cambios(self):
+        return self.asignador.tomar_cambios()
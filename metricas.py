@@ -0,0 +1,190 @@
+import bisect
+import csv
+import json
+
+import tlb
+
+# Métricas de planificación y memoria del simulador.
+# Se actualizan en cada cambio de estado con contadores y histogramas de baldes fijos,
+# así el costo por transición es constante y no se guarda una lista de muestras.
+# Por proceso: tiempo de retorno, de espera (en Listo), de respuesta (hasta el primer
+# despacho) y bloqueado. Globales: rendimiento, ocupación de CPU y de memoria, largo de
+# las colas (promedio en el tiempo y máximo) y contención por recurso.
+
+# Límites superiores de los baldes (en unidades de tiempo virtual); el último junta todo lo demás
+LIMITES = (0.5, 1, 2, 4, 8, 16, 32, 64, 128, 256, 512, 1024, 2048, 4096, float('inf'))
+
+ESTADOS = ('Nuevos', 'Listo', 'Ejecutando', 'Bloqueado', 'Terminado')
+
+# Histograma con baldes fijos: registrar un valor cuesta una búsqueda binaria en los límites
+class Histograma:
+    def __init__(self, limites=LIMITES):
+        self.limites = limites
+        self.baldes = [0] * len(limites)
+        self.cantidad = 0
+        self.suma = 0.0
+        self.maximo = 0.0
+
+    def registrar(self, valor):
+        self.baldes[bisect.bisect_left(self.limites, valor)] += 1
+        self.cantidad += 1
+        self.suma += valor
+        if valor > self.maximo:
+            self.maximo = valor
+
+    @property
+    def media(self):
+        return self.suma / self.cantidad if self.cantidad else 0.0
+
+    # Percentil aproximado: el límite superior del balde donde cae (acotado por el máximo visto)
+    def percentil(self, p):
+        if not self.cantidad:
+            return 0.0
+        objetivo = p * self.cantidad
+        acumulado = 0
+        for limite, cuenta in zip(self.limites, self.baldes):
+            acumulado += cuenta
+            if acumulado >= objetivo:
+                return min(limite, self.maximo)
+        return self.maximo
+
+    def a_dict(self):
+        return {
+            'cantidad': self.cantidad,
+            'media': self.media,
+            'p50': self.percentil(0.50),
+            'p95': self.percentil(0.95),
+            'p99': self.percentil(0.99),
+            'maximo': self.maximo,
+            'baldes': dict(zip((str(limite) for limite in self.limites), self.baldes)),
+        }
+
+# Largo de una cola integrado en el tiempo, para sacar el promedio y el máximo
+class LargoCola:
+    def __init__(self):
+        self.largo = 0
+        self.maximo = 0
+        self.area = 0.0
+        self.ultimo = 0.0
+
+    def cambiar(self, delta, reloj):
+        self.area += self.largo * (reloj - self.ultimo)
+        self.ultimo = reloj
+        self.largo += delta
+        if self.largo > self.maximo:
+            self.maximo = self.largo
+
+    def promedio(self, reloj):
+        area = self.area + self.largo * (reloj - self.ultimo)
+        return area / reloj if reloj > 0 else 0.0
+
+# Métricas de una corrida; el simulador llama a `llegada`, `rechazo`, `transicion`,
+# `memoria` y `contencion`, y se consultan con `resumen()`
+class Metricas:
+    def __init__(self, simulador, archivo_procesos=None):
+        self.simulador = simulador
+        self.retorno = Histograma()
+        self.espera = Histograma()
+        self.respuesta = Histograma()
+        self.bloqueado = Histograma()
+        self.colas = {estado: LargoCola() for estado in ESTADOS}
+        self.memoria_usada = LargoCola()  # Páginas ocupadas en el tiempo
+        self.transiciones = {}  # (estado anterior, estado nuevo) -> cantidad
+        self.pedidos_recurso = [0] * len(simulador.recursos)
+        self.esperas_recurso = [0] * len(simulador.recursos)  # Pedidos que encontraron el recurso ocupado
+        self.llegadas = 0
+        self.rechazos = 0
+        # Con `archivo_procesos` se escribe una fila CSV por proceso terminado
+        self._escritor = None
+        if archivo_procesos is not None:
+            self._escritor = csv.writer(archivo_procesos)
+            self._escritor.writerow(['id', 'llegada', 'fin', 'retorno', 'espera', 'respuesta', 'bloqueado'])
+
+    def llegada(self, proceso, reloj):
+        self.llegadas += 1
+        proceso.desde = reloj
+        self.colas['Nuevos'].cambiar(1, reloj)
+
+    def rechazo(self, reloj):
+        self.llegadas += 1
+        self.rechazos += 1
+
+    # Función para contar un cambio de estado y acumular el tiempo que el proceso pasó en el anterior
+    def transicion(self, proceso, anterior, nuevo, reloj):
+        duracion = reloj - proceso.desde
+        proceso.desde = reloj
+        if anterior == 'Listo':
+            proceso.espera += duracion
+        elif anterior == 'Bloqueado':
+            proceso.bloqueado += duracion
+        if nuevo == 'Ejecutando' and proceso.respuesta is None:
+            proceso.respuesta = reloj - proceso.llegada
+
+        clave = (anterior, nuevo)
+        self.transiciones[clave] = self.transiciones.get(clave, 0) + 1
+        self.colas[anterior].cambiar(-1, reloj)
+        self.colas[nuevo].cambiar(1, reloj)
+
+        if nuevo == 'Terminado':
+            retorno = reloj - proceso.llegada
+            self.retorno.registrar(retorno)
+            self.espera.registrar(proceso.espera)
+            self.respuesta.registrar(proceso.respuesta)
+            self.bloqueado.registrar(proceso.bloqueado)
+            if self._escritor is not None:
+                self._escritor.writerow([proceso.id, proceso.llegada, reloj, retorno, proceso.espera,
+                                         proceso.respuesta, proceso.bloqueado])
+
+    def memoria(self, paginas_usadas, reloj):
+        self.memoria_usada.cambiar(paginas_usadas - self.memoria_usada.largo, reloj)
+
+    def contencion(self, recurso, ocupado):
+        self.pedidos_recurso[recurso] += 1
+        if ocupado:
+            self.esperas_recurso[recurso] += 1
+
+    # Función para obtener todas las métricas como un diccionario (se puede llamar en cualquier momento)
+    def resumen(self):
+        simulador = self.simulador
+        reloj = simulador.reloj
+        cpus = simulador.cpus
+        terminados = self.retorno.cantidad
+        return {
+            'reloj': reloj,
+            'llegadas': self.llegadas,
+            'rechazos': self.rechazos,
+            'terminados': terminados,
+            'rendimiento': terminados / reloj if reloj > 0 else 0.0,
+            'ocupacion_cpu': sum(cpu.ocupacion(reloj) for cpu in cpus) / len(cpus),
+            'ocupacion_por_cpu': [cpu.ocupacion(reloj) for cpu in cpus],
+            'ocupacion_memoria': self.memoria_usada.promedio(reloj) / simulador.numero_paginas,
+            'esperando_memoria': len(simulador.esperando_memoria) if simulador.esperando_memoria is not None else 0,
+            'colas': {estado: {'largo': cola.largo, 'promedio': cola.promedio(reloj), 'maximo': cola.maximo}
+                      for estado, cola in self.colas.items()},
+            'recursos': [{'pedidos': pedidos, 'esperas': esperas,
+                          'contencion': esperas / pedidos if pedidos else 0.0,
+                          'esperando': len(recurso.esperando)}
+                         for pedidos, esperas, recurso in zip(self.pedidos_recurso, self.esperas_recurso,
+                                                               simulador.recursos)],
+            'transiciones': {f"{anterior}->{nuevo}": cantidad
+                             for (anterior, nuevo), cantidad in self.transiciones.items()},
+            'retorno': self.retorno.a_dict(),
+            'espera': self.espera.a_dict(),
+            'respuesta': self.respuesta.a_dict(),
+            'bloqueado': self.bloqueado.a_dict(),
+            'paginacion': simulador.memoria_virtual.resumen() if simulador.memoria_virtual is not None else None,
+            'buddy': simulador.memoria.resumen() if simulador.buddy else None,
+            'tlb': tlb.resumir([cpu.tlb for cpu in cpus], niveles=self._niveles_tabla()) if simulador.tlb is not None else None,
+        }
+
+    # Accesos a memoria de un fallo de TLB: los de la tabla de páginas (uno si no hay paginación)
+    def _niveles_tabla(self):
+        memoria_virtual = self.simulador.memoria_virtual
+        if memoria_virtual is None or not memoria_virtual.tabla.busquedas:
+            return 1
+        return memoria_virtual.tabla.costo_medio
+
+    # Función para guardar el resumen en un archivo JSON
+    def exportar(self, ruta):
+        with open(ruta, 'w') as archivo:
+            json.dump(self.resumen(), archivo, indent=2)
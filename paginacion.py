@@ -0,0 +1,259 @@
+import bisect
+from collections import OrderedDict
+
+from tablas_paginas import crear_tabla
+
+# Memoria virtual con paginación por demanda.
+# Cada proceso tiene un espacio de direcciones lógico (sus páginas virtuales) que puede ser
+# más grande que la memoria física. Una página se carga en un marco la primera vez que se
+# referencia (fallo de página, se lee del swap simulado) y, si no quedan marcos libres, la
+# política de reemplazo elige una víctima que vuelve al swap. El simulador solo llama a:
+#   crear_espacio(id, paginas_virtuales, aleatorio)   al admitir un proceso
+#   ejecutar(id, cantidad, tlb)                       al despachar: hace `cantidad` referencias
+#   liberar(id)                                       al terminar: devuelve todos sus marcos
+# Las políticas de reemplazo, como los planificadores, se eligen por nombre:
+#   cargada(marco)          se cargó una página en el marco
+#   referenciada(marco)     acierto sobre una página que ya estaba en el marco
+#   liberada(marco)         el marco quedó libre (víctima o proceso terminado)
+#   victima(memoria)        marco a desalojar (solo se pide con la memoria llena)
+
+TIEMPO_FALLO = 0.05  # Tiempo que la CPU espera al swap por cada fallo de página
+REFERENCIAS_POR_UNIDAD = 8  # Referencias a memoria por unidad de tiempo de CPU
+LARGO_PROGRAMA = 64  # Referencias del programa de cada proceso (se repite en ciclo)
+LARGO_FASE = 16  # Referencias seguidas dentro de la misma ventana de localidad
+VENTANA = 4  # Páginas de cada ventana de localidad
+LOCALIDAD = 0.9  # Probabilidad de que una referencia caiga dentro de la ventana
+
+# Reemplazo FIFO: sale la página que lleva más tiempo cargada
+class FIFO:
+    nombre = 'fifo'
+
+    def __init__(self):
+        self._marcos = OrderedDict()  # Marcos en orden de carga
+
+    def cargada(self, marco):
+        self._marcos[marco] = None
+
+    def referenciada(self, marco):
+        pass
+
+    def liberada(self, marco):
+        self._marcos.pop(marco, None)
+
+    def victima(self, memoria):
+        return next(iter(self._marcos))
+
+# Reemplazo LRU: sale la página referenciada hace más tiempo
+class LRU(FIFO):
+    nombre = 'lru'
+
+    def referenciada(self, marco):
+        self._marcos.move_to_end(marco)
+
+# Reemplazo del reloj (segunda oportunidad): la aguja pasa por los marcos y desaloja el
+# primero con el bit de referencia apagado, apagando los bits que encuentra prendidos
+class Reloj:
+    nombre = 'clock'
+
+    def __init__(self):
+        self._usado = {}  # Marco cargado -> bit de referencia
+        self._aguja = 0
+
+    def cargada(self, marco):
+        self._usado[marco] = True
+
+    def referenciada(self, marco):
+        self._usado[marco] = True
+
+    def liberada(self, marco):
+        self._usado.pop(marco, None)
+
+    def victima(self, memoria):
+        usado = self._usado
+        numero_marcos = memoria.numero_marcos
+        while True:
+            marco = self._aguja
+            self._aguja = (marco + 1) % numero_marcos
+            if marco not in usado:
+                continue
+            if not usado[marco]:
+                return marco
+            usado[marco] = False
+
+# Reemplazo óptimo (Belady): sale la página que se va a volver a usar más tarde.
+# El futuro de cada proceso se conoce porque su programa está generado de antemano;
+# como el orden en que se intercalan los procesos depende de la planificación, la
+# distancia se mide en referencias del propio dueño de la página.
+class OPT:
+    nombre = 'opt'
+
+    def __init__(self):
+        self._marcos = set()
+
+    def cargada(self, marco):
+        self._marcos.add(marco)
+
+    def referenciada(self, marco):
+        pass
+
+    def liberada(self, marco):
+        self._marcos.discard(marco)
+
+    def victima(self, memoria):
+        return max(self._marcos, key=memoria.proximo_uso)
+
+POLITICAS = {clase.nombre: clase for clase in (FIFO, LRU, Reloj, OPT)}
+
+# Función para crear una política de reemplazo a partir de su nombre ('fifo', 'lru', 'clock', 'opt')
+def crear_politica(nombre='fifo'):
+    try:
+        return POLITICAS[nombre]()
+    except KeyError:
+        raise ValueError(f"Política de reemplazo desconocida: {nombre}") from None
+
+# Función para generar el programa de un proceso: referencias con localidad, en fases que
+# se concentran en una ventana de páginas y de vez en cuando saltan a cualquier otra
+def generar_programa(paginas_virtuales, aleatorio, largo=LARGO_PROGRAMA):
+    programa = []
+    ventana = min(VENTANA, paginas_virtuales)
+    while len(programa) < largo:
+        base = aleatorio.randrange(paginas_virtuales - ventana + 1)
+        for _ in range(min(LARGO_FASE, largo - len(programa))):
+            if aleatorio.random() < LOCALIDAD:
+                programa.append(base + aleatorio.randrange(ventana))
+            else:
+                programa.append(aleatorio.randrange(paginas_virtuales))
+    return programa
+
+# Clase para el espacio de direcciones de un proceso: su programa de referencias
+class EspacioDirecciones:
+    __slots__ = ('programa', 'posicion', '_usos')
+
+    def __init__(self, programa):
+        self.programa = programa
+        self.posicion = 0  # Próxima referencia del programa
+        self._usos = None  # Página -> posiciones del programa donde se usa (para OPT)
+
+    # Referencias que faltan para que el programa vuelva a usar `pagina`
+    def distancia(self, pagina):
+        if self._usos is None:
+            self._usos = {}
+            for i, referencia in enumerate(self.programa):
+                self._usos.setdefault(referencia, []).append(i)
+        usos = self._usos.get(pagina)
+        if not usos:
+            return float('inf')
+        i = bisect.bisect_left(usos, self.posicion)
+        if i < len(usos):
+            return usos[i] - self.posicion
+        return usos[0] + len(self.programa) - self.posicion
+
+# Memoria virtual sobre el asignador de páginas físicas (cada página física es un marco).
+# Las traducciones viven en `tabla` (plana, multinivel o invertida, ver tablas_paginas.py).
+# `al_cargar(id, marco)` y `al_desalojar(id, marco, pagina)` avisan al simulador de cada cambio.
+class MemoriaVirtual:
+    def __init__(self, asignador, politica='fifo', al_cargar=None, al_desalojar=None, tabla='plana'):
+        self.asignador = asignador
+        self.politica = crear_politica(politica) if isinstance(politica, str) else politica
+        if isinstance(tabla, str):
+            tabla = crear_tabla(tabla, marcos=asignador.numero_paginas) if tabla == 'invertida' else crear_tabla(tabla)
+        self.tabla = tabla
+        self.al_cargar = al_cargar
+        self.al_desalojar = al_desalojar
+        self.espacios = {}  # Id de proceso -> EspacioDirecciones
+        self._virtual = [None] * asignador.numero_paginas  # Marco -> página virtual que tiene
+        self.referencias = 0
+        self.fallos = 0
+        self.desalojos = 0
+
+    @property
+    def numero_marcos(self):
+        return self.asignador.numero_paginas
+
+    @property
+    def tasa_fallos(self):
+        return self.fallos / self.referencias if self.referencias else 0.0
+
+    def crear_espacio(self, id_proceso, paginas_virtuales, aleatorio):
+        self.espacios[id_proceso] = EspacioDirecciones(generar_programa(max(1, paginas_virtuales), aleatorio))
+
+    # Función para hacer las próximas `cantidad` referencias del programa de un proceso; devuelve
+    # los fallos. Con `tlb`, cada referencia busca primero la traducción en la TLB.
+    def ejecutar(self, id_proceso, cantidad, tlb=None):
+        espacio = self.espacios[id_proceso]
+        programa = espacio.programa
+        fallos = 0
+        for _ in range(cantidad):
+            pagina = programa[espacio.posicion]
+            espacio.posicion = (espacio.posicion + 1) % len(programa)
+            if tlb is not None:
+                marco = tlb.buscar(id_proceso, pagina)
+                if marco is not None:
+                    self.referencias += 1
+                    self.politica.referenciada(marco)
+                    continue
+            marco, fallo = self.acceder(id_proceso, pagina)
+            if fallo:
+                fallos += 1
+            if tlb is not None:
+                tlb.cargar(id_proceso, pagina, marco)
+        return fallos
+
+    # Función para referenciar una página virtual recorriendo la tabla de páginas;
+    # devuelve el marco donde quedó y si hubo fallo de página
+    def acceder(self, id_proceso, pagina):
+        self.referencias += 1
+        marco = self.tabla.buscar(id_proceso, pagina)
+        if marco is not None:
+            self.politica.referenciada(marco)
+            return marco, False
+
+        self.fallos += 1
+        marcos = self.asignador.asignar(id_proceso, 1)
+        if marcos is None:
+            self._desalojar(self.politica.victima(self))
+            marcos = self.asignador.asignar(id_proceso, 1)
+        marco = marcos[0]
+        self.tabla.mapear(id_proceso, pagina, marco)
+        self._virtual[marco] = pagina
+        self.politica.cargada(marco)
+        if self.al_cargar is not None:
+            self.al_cargar(id_proceso, marco)
+        return marco, True
+
+    # Distancia hasta el próximo uso de la página que está en `marco` (para OPT)
+    def proximo_uso(self, marco):
+        return self.espacios[self.asignador.paginas[marco]].distancia(self._virtual[marco])
+
+    # Función para devolver una página al swap y dejar su marco libre
+    def _desalojar(self, marco):
+        dueno = self.asignador.paginas[marco]
+        pagina = self._virtual[marco]
+        self.tabla.desmapear(dueno, pagina)
+        self._virtual[marco] = None
+        self.asignador.liberar([marco])
+        self.politica.liberada(marco)
+        self.desalojos += 1
+        if self.al_desalojar is not None:
+            self.al_desalojar(dueno, marco, pagina)
+
+    # Función para liberar todos los marcos de un proceso que terminó
+    def liberar(self, id_proceso):
+        if self.espacios.pop(id_proceso, None) is None:
+            return
+        marcos = self.tabla.liberar(id_proceso)
+        for marco in marcos:
+            self._virtual[marco] = None
+            self.politica.liberada(marco)
+        self.asignador.liberar(marcos)
+
+    def resumen(self):
+        return {
+            'politica': self.politica.nombre,
+            'marcos': self.numero_marcos,
+            'referencias': self.referencias,
+            'fallos': self.fallos,
+            'tasa_fallos': self.tasa_fallos,
+            'desalojos': self.desalojos,
+            'tabla': self.tabla.resumen(),
+        }
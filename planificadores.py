@@ -0,0 +1,194 @@
+import copy
+import heapq
+import itertools
+from collections import deque
+
+# Políticas de planificación de CPU para el simulador.
+# Cada planificador guarda los procesos en estado Listo con la estructura que le
+# conviene a su política; el simulador solo llama a:
+#   agregar(proceso)           cuando un proceso pasa a Listo
+#   elegir(reloj)              para sacar el próximo proceso a ejecutar
+#   tramo(proceso)             tiempo máximo de CPU antes de expulsarlo (None = toda la ráfaga)
+#   expulsa(nuevo, actual, restante)  si el que llega a Listo debe desalojar al que ejecuta
+#   fin_tramo(proceso, agotado)       al terminar un tramo (agotado = se le acabó el quantum)
+#   copia()                    otra cola vacía con la misma política, para las colas por CPU
+# `expropiativa` indica si la política puede desalojar procesos (si no, `expulsa` ni se consulta).
+# Agregar y elegir cuestan O(1) o O(log n) según la política.
+
+# Planificador por orden de llegada (el comportamiento original del simulador)
+class FIFO:
+    nombre = 'fifo'
+    expropiativa = False
+
+    def __init__(self):
+        self._cola = deque()
+
+    def __len__(self):
+        return len(self._cola)
+
+    def agregar(self, proceso):
+        self._cola.append(proceso)
+
+    def elegir(self, reloj=0.0):
+        return self._cola.popleft()
+
+    def tramo(self, proceso):
+        return None
+
+    def expulsa(self, nuevo, actual, restante):
+        return False
+
+    def fin_tramo(self, proceso, agotado):
+        pass
+
+    def copia(self):
+        return copy.deepcopy(self)
+
+# Round robin: igual que FIFO pero cada proceso corre a lo sumo un quantum
+class RoundRobin(FIFO):
+    nombre = 'rr'
+
+    def __init__(self, quantum=1):
+        super().__init__()
+        self.quantum = quantum
+
+    def tramo(self, proceso):
+        return self.quantum
+
+# Planificador con un heap ordenado por una clave; el contador desempata por orden de llegada
+class _PorClave(FIFO):
+    def __init__(self):
+        self._heap = []
+        self._orden = itertools.count()
+
+    def __len__(self):
+        return len(self._heap)
+
+    def clave(self, proceso):
+        raise NotImplementedError
+
+    def agregar(self, proceso):
+        heapq.heappush(self._heap, (self.clave(proceso), next(self._orden), proceso))
+
+    def elegir(self, reloj=0.0):
+        return heapq.heappop(self._heap)[2]
+
+# Trabajo más corto primero (sin expulsión): elige la menor ráfaga restante
+class SJF(_PorClave):
+    nombre = 'sjf'
+
+    def clave(self, proceso):
+        return proceso.restante
+
+# Menor tiempo restante primero: como SJF, pero un proceso más corto que llega a Listo
+# desaloja al que está ejecutando
+class SRTF(SJF):
+    nombre = 'srtf'
+    expropiativa = True
+
+    def expulsa(self, nuevo, actual, restante):
+        return nuevo.restante < restante
+
+# Prioridad estática: menor número, mayor prioridad. Opcionalmente expropiativa
+class Prioridad(_PorClave):
+    nombre = 'prioridad'
+
+    def __init__(self, expropiativa=False):
+        super().__init__()
+        self.expropiativa = expropiativa
+
+    def clave(self, proceso):
+        return proceso.prioridad
+
+    def expulsa(self, nuevo, actual, restante):
+        return self.expropiativa and nuevo.prioridad < actual.prioridad
+
+# Reloj de los impulsos de MLFQ: cuántos impulsos se hicieron y cuándo toca el próximo.
+# Las copias de una MLFQ (colas por CPU) comparten el mismo, así la época que un proceso
+# recibió en una cola vale igual si después lo roba o lo recibe otra CPU.
+class _RelojImpulsos:
+    def __init__(self, impulso):
+        self.epoca = 0  # Cantidad de impulsos hechos; un proceso de una época anterior vuelve al nivel 0
+        self.proximo = impulso
+
+# Colas multinivel con realimentación: un proceso que agota su quantum baja de nivel,
+# uno que se bloquea antes conserva el suyo. Se atiende siempre el nivel más alto con
+# procesos, y cada `impulso` unidades de tiempo todos vuelven al nivel 0 para que
+# ninguno quede postergado para siempre.
+class MLFQ(FIFO):
+    nombre = 'mlfq'
+    expropiativa = True
+
+    def __init__(self, quantums=(1, 2, 4), impulso=50):
+        self.quantums = quantums
+        self.impulso = impulso
+        self._niveles = [deque() for _ in quantums]
+        self._cantidad = 0
+        self._impulsos = _RelojImpulsos(impulso)
+        self._epoca = 0  # Última época del reloj que se aplicó a los procesos de esta cola
+
+    def __len__(self):
+        return self._cantidad
+
+    # Las colas por CPU comparten el reloj de impulsos
+    def copia(self):
+        otra = MLFQ(self.quantums, self.impulso)
+        otra._impulsos = self._impulsos
+        otra._epoca = self._impulsos.epoca
+        return otra
+
+    def agregar(self, proceso):
+        self._al_dia()
+        if proceso.epoca != self._epoca:
+            proceso.epoca, proceso.nivel = self._epoca, 0
+        self._niveles[proceso.nivel].append(proceso)
+        self._cantidad += 1
+
+    def elegir(self, reloj=0.0):
+        impulsos = self._impulsos
+        if self.impulso is not None and reloj >= impulsos.proximo:
+            impulsos.epoca += 1
+            impulsos.proximo = reloj + self.impulso
+        self._al_dia()
+        self._cantidad -= 1
+        for nivel in self._niveles:
+            if nivel:
+                return nivel.popleft()
+
+    # Función para subir al nivel 0 los procesos de esta cola si hubo un impulso desde la última
+    # vez (lo puede haber hecho otra cola); los que no están en Listo se suben al volver
+    def _al_dia(self):
+        if self._epoca == self._impulsos.epoca:
+            return
+        self._epoca = self._impulsos.epoca
+        primero = self._niveles[0]
+        for nivel in self._niveles[1:]:
+            primero.extend(nivel)
+            nivel.clear()
+        for proceso in primero:
+            proceso.epoca, proceso.nivel = self._epoca, 0
+
+    def tramo(self, proceso):
+        return self.quantums[proceso.nivel]
+
+    # Función para obtener el nivel vigente de un proceso: el que está en ejecución durante un
+    # impulso conserva el nivel anterior hasta volver a una cola, pero ya cuenta como nivel 0
+    def _nivel(self, proceso):
+        return proceso.nivel if proceso.epoca == self._impulsos.epoca else 0
+
+    def expulsa(self, nuevo, actual, restante):
+        return self._nivel(nuevo) < self._nivel(actual)
+
+    def fin_tramo(self, proceso, agotado):
+        if agotado and proceso.nivel < len(self.quantums) - 1:
+            proceso.nivel += 1
+
+PLANIFICADORES = {clase.nombre: clase for clase in (FIFO, RoundRobin, SJF, SRTF, Prioridad, MLFQ)}
+
+# Función para crear un planificador a partir de su nombre ('fifo', 'rr', 'sjf', 'srtf', 'prioridad', 'mlfq')
+def crear_planificador(nombre='fifo', **opciones):
+    try:
+        clase = PLANIFICADORES[nombre]
+    except KeyError:
+        raise ValueError(f"Planificador desconocido: {nombre}") from None
+    return clase(**opciones)
@@ -0,0 +1,42 @@
+import threading
+from collections import deque
+
+# Clase para representar un recurso (R0, R1, R2...) con su propia cola de espera FIFO.
+# Cuando el proceso que lo tiene lo libera, el recurso pasa directamente al primero
+# de la cola, así nadie tiene que revisar periódicamente si quedó libre.
+class Recurso:
+    def __init__(self, id):
+        self.id = id
+        self.ocupado_por = None  # Proceso que tiene el recurso
+        self.esperando = deque()  # Procesos bloqueados esperando el recurso, en orden de llegada
+        self.lock = threading.Lock()
+
+    def __str__(self):
+        if self.ocupado_por is None:
+            return f"R{self.id}: Libre"
+        return f"R{self.id}: Ocupado por P{self.ocupado_por.id} ({len(self.esperando)} esperando)"
+
+    # Función para pedir el recurso: si está libre lo toma, si no el proceso queda en la cola
+    def adquirir(self, proceso):
+        with self.lock:
+            if self.ocupado_por is None:
+                self.ocupado_por = proceso
+                proceso.tiene_recurso = True
+                return True
+            self.esperando.append(proceso)
+            return False
+
+    # Función para soltar el recurso; devuelve el proceso que lo recibe (o None si nadie esperaba)
+    def liberar(self):
+        with self.lock:
+            if self.esperando:
+                siguiente = self.esperando.popleft()
+                siguiente.tiene_recurso = True
+            else:
+                siguiente = None
+            self.ocupado_por = siguiente
+            return siguiente
+
+# Función para crear la lista de recursos R0..R(n-1)
+def crear_recursos(cantidad=3):
+    return [Recurso(i) for i in range(cantidad)]
@@ -0,0 +1,384 @@
+import bisect
+import mmap
+import os
+import pickle
+import struct
+import threading
+import time
+
+import compactador
+import traza
+from paginacion import POLITICAS
+from simulador import Proceso, Simulador
+
+# Reproducción de una traza grabada sin volver a simular.
+# Los eventos se aplican sobre un Simulador que solo sirve de contenedor del estado
+# (colas, memoria, recursos y CPUs), así la misma Interfaz que mira una corrida en vivo
+# puede mirar una reproducción. La traza se lee con mmap registro por registro, de modo
+# que la memoria no depende del largo del archivo. Para saltar a un instante se usa un
+# índice de instantáneas del estado, guardado junto a la traza (`<traza>.indice`).
+
+INTERVALO_INSTANTANEAS = 10000  # Eventos entre una instantánea y la siguiente
+LOTE = 1000  # Eventos que se aplican por cada vez que se toma el lock reproduciendo sin pausa
+_FIN_INDICE = struct.Struct('<Q')  # Posición del índice al final del archivo de instantáneas
+VERSION_INDICE = 2  # Cambia cuando cambia el contenido de las instantáneas
+
+class Reproductor:
+    def __init__(self, ruta, intervalo_instantaneas=INTERVALO_INSTANTANEAS):
+        self.ruta = ruta
+        self.intervalo_instantaneas = intervalo_instantaneas
+        self._archivo = open(ruta, 'rb')
+        self._datos = mmap.mmap(self._archivo.fileno(), 0, access=mmap.ACCESS_READ)
+        self._registros = traza.leer_registros(self._datos)
+
+        # El primer registro dice cómo era la corrida
+        tipo, _, _, valores, self._inicio = next(self._registros)
+        if tipo != traza.CONFIGURACION:
+            raise ValueError("La traza no empieza con la configuración de la corrida")
+        memoria_total, tamano_pagina, numero_recursos, numero_cpus, compactar = valores[:5]
+        # Las trazas viejas no traen la paginación (quinto valor en adelante)
+        politica = valores[5] if len(valores) > 5 else 0
+        self.paginacion = list(POLITICAS)[politica - 1] if politica else None  # Política de la corrida grabada
+        self.simulador = Simulador(memoria_total, tamano_pagina, numero_recursos,
+                                   numero_cpus=numero_cpus, compactar=bool(compactar), metricas=False,
+                                   paginacion=self.paginacion)
+        self._costo_movimiento = compactador.PlanCompactacion([None]).costo(tamano_pagina)
+        self.posicion = self._inicio  # Posición en la traza del próximo registro a aplicar
+        self.eventos = 0  # Eventos aplicados desde el principio de la traza
+        self._indice = None  # [(instante, eventos, posición en la traza, posición de la instantánea)]
+
+        self._aplicar = {
+            traza.LLEGADA: self._llegada,
+            traza.RECHAZO: self._rechazo,
+            traza.ASIGNACION: self._asignacion,
+            traza.LIBERACION: self._liberacion,
+            traza.MOVIMIENTO: self._movimiento,
+            traza.LISTO: self._listo,
+            traza.DESPERTAR: self._listo,
+            traza.DESPACHO: self._despacho,
+            traza.BLOQUEO: self._bloqueo,
+            traza.TERMINADO: self._terminado,
+            traza.RECURSO_TOMADO: self._recurso_tomado,
+            traza.RECURSO_SOLTADO: self._recurso_soltado,
+            traza.CONFIGURACION: self._configuracion,
+        }
+
+    def cerrar(self):
+        self._datos.close()
+        self._archivo.close()
+
+    # Función para aplicar los eventos hasta el instante `hasta` (o hasta el final);
+    # devuelve False cuando no quedan eventos
+    def avanzar(self, hasta=None, maximo=None):
+        simulador = self.simulador
+        aplicar = self._aplicar
+        aplicados = 0
+        for tipo, tiempo, id_proceso, valores, siguiente in traza.leer_registros(self._datos, self.posicion):
+            if hasta is not None and tiempo > hasta:
+                simulador.reloj = hasta
+                return True
+            if tiempo < simulador.reloj and tipo != traza.CONFIGURACION:  # La configuración avisa por su cuenta
+                raise ValueError(f"Registro en el instante {tiempo} anterior al reloj ({simulador.reloj}): "
+                                 "la traza está desordenada")
+            simulador.reloj = tiempo
+            aplicar[tipo](tiempo, id_proceso, valores)
+            self.posicion = siguiente
+            self.eventos += 1
+            aplicados += 1
+            if maximo is not None and aplicados >= maximo:
+                return True
+        return False
+
+    # Instante del próximo evento (o None si no quedan)
+    def proximo_instante(self):
+        for _, tiempo, _, _, _ in traza.leer_registros(self._datos, self.posicion):
+            return tiempo
+        return None
+
+    # Función para reproducir desde la posición actual. `velocidad` es cuántas unidades de
+    # tiempo virtual pasan por segundo real (None = lo más rápido posible). Después de cada
+    # tanda de eventos llama a `simulador.al_cambiar`, igual que el simulador en vivo.
+    def reproducir(self, velocidad=None, detener=None):
+        simulador = self.simulador
+        inicio_real, inicio_virtual = time.monotonic(), simulador.reloj
+        while detener is None or not detener.is_set():
+            if velocidad is None:
+                with simulador.lock:
+                    quedan = self.avanzar(maximo=LOTE)
+            else:
+                proximo = self.proximo_instante()
+                if proximo is None:
+                    quedan = False
+                else:
+                    espera = (proximo - inicio_virtual) / velocidad - (time.monotonic() - inicio_real)
+                    if espera > 0:
+                        # Dormir hasta el próximo evento, revisando `detener` de vez en cuando
+                        if detener is not None:
+                            detener.wait(min(espera, 0.1))
+                        else:
+                            time.sleep(min(espera, 0.1))
+                        continue
+                    with simulador.lock:
+                        quedan = self.avanzar(hasta=proximo)
+            if simulador.al_cambiar is not None:
+                simulador.al_cambiar()
+            if not quedan:
+                return
+
+    # Función para saltar al instante `tiempo`: parte de la última instantánea anterior
+    # y aplica los eventos que faltan
+    def ir_a(self, tiempo):
+        indice = self.indexar()
+        with self.simulador.lock:
+            i = bisect.bisect_right([entrada[0] for entrada in indice], tiempo) - 1
+            if i >= 0 and (indice[i][1] > self.eventos or tiempo < self.simulador.reloj):
+                _, eventos, posicion, posicion_instantanea = indice[i]
+                with open(self._ruta_indice(), 'rb') as archivo:
+                    archivo.seek(posicion_instantanea)
+                    self._restaurar(pickle.load(archivo))
+                self.posicion, self.eventos = posicion, eventos
+            elif tiempo < self.simulador.reloj:
+                self._restaurar(None)
+                self.posicion, self.eventos = self._inicio, 0
+            self.avanzar(hasta=tiempo)
+        if self.simulador.al_cambiar is not None:
+            self.simulador.al_cambiar()
+
+    def _ruta_indice(self):
+        return self.ruta + '.indice'
+
+    # Función para armar (o cargar si ya existe y corresponde a esta traza) el índice de instantáneas
+    def indexar(self):
+        if self._indice is not None:
+            return self._indice
+        ruta_indice = self._ruta_indice()
+        tamano = len(self._datos)
+        try:
+            with open(ruta_indice, 'rb') as archivo:
+                archivo.seek(-_FIN_INDICE.size, os.SEEK_END)
+                archivo.seek(_FIN_INDICE.unpack(archivo.read(_FIN_INDICE.size))[0])
+                version, tamano_traza, intervalo, indice = pickle.load(archivo)
+            if version == VERSION_INDICE and tamano_traza == tamano and intervalo == self.intervalo_instantaneas:
+                self._indice = indice
+                return indice
+        except (OSError, EOFError, pickle.UnpicklingError, struct.error, ValueError):
+            pass
+
+        # Recorrer la traza entera con un reproductor aparte, guardando el estado cada tanto
+        auxiliar = Reproductor(self.ruta, self.intervalo_instantaneas)
+        indice = []
+        with open(ruta_indice, 'wb') as archivo:
+            while True:
+                indice.append((auxiliar.simulador.reloj, auxiliar.eventos, auxiliar.posicion, archivo.tell()))
+                pickle.dump(auxiliar._instantanea(), archivo, pickle.HIGHEST_PROTOCOL)
+                if not auxiliar.avanzar(maximo=self.intervalo_instantaneas):
+                    break
+            posicion_indice = archivo.tell()
+            pickle.dump((VERSION_INDICE, tamano, self.intervalo_instantaneas, indice), archivo, pickle.HIGHEST_PROTOCOL)
+            archivo.write(_FIN_INDICE.pack(posicion_indice))
+        auxiliar.cerrar()
+        self._indice = indice
+        return indice
+
+    # Función para copiar el estado actual en estructuras simples (ids en lugar de objetos)
+    def _instantanea(self):
+        simulador = self.simulador
+        costo = simulador.costo_compactacion
+        return {
+            'reloj': simulador.reloj,
+            'procesos': [(p.id, p.memoria, p.recurso, p.prioridad, p.llegada, p.estado, list(p.paginas),
+                          p.tiene_recurso, p.fin, None if p.cpu is None else p.cpu.id)
+                         for p in simulador._por_id.values()],
+            'admitidos': [p.id for p in simulador.procesos],
+            'rechazados': [p.id for p in simulador.procesos_rechazados],
+            'colas': [[p.id for p in cola] for cola in self._colas()],
+            'recursos': [(None if r.ocupado_por is None else r.ocupado_por.id, [p.id for p in r.esperando])
+                         for r in simulador.recursos],
+            'cpus': [(None if c.proceso is None else c.proceso.id, c.inicio_tramo, c.ocupado, c.despachados)
+                     for c in simulador.cpus],
+            'costo': (costo.paginas_movidas, costo.bytes_copiados, costo.tiempo),
+            'contadores': (simulador.admitidos, simulador.rechazados, simulador.terminados),
+        }
+
+    # Función para volver al estado de una instantánea (o al inicial si es None), modificando
+    # en el lugar las estructuras del simulador para que la interfaz conectada las siga viendo
+    def _restaurar(self, instantanea):
+        simulador = self.simulador
+        for cola in self._colas():
+            cola.clear()
+        simulador.procesos.clear()
+        simulador.procesos_rechazados.clear()
+        simulador._por_id.clear()
+        memoria = simulador.memoria
+        memoria.paginas[:] = [None] * memoria.numero_paginas
+        for recurso in simulador.recursos:
+            recurso.ocupado_por = None
+            recurso.esperando.clear()
+        for cpu in simulador.cpus:
+            cpu.proceso, cpu.inicio_tramo, cpu.ocupado, cpu.despachados = None, 0.0, 0.0, 0
+        if instantanea is None:
+            simulador.reloj = 0.0
+            simulador.admitidos = simulador.rechazados = simulador.terminados = 0
+            simulador.costo_compactacion = compactador.CostoCompactacion()
+            memoria.reconstruir()
+            return
+
+        simulador.reloj = instantanea['reloj']
+        simulador.admitidos, simulador.rechazados, simulador.terminados = instantanea['contadores']
+        simulador.costo_compactacion = compactador.CostoCompactacion(*instantanea['costo'])
+        por_id = simulador._por_id
+        for id_proceso, memoria_proceso, recurso, prioridad, llegada, estado, paginas, tiene_recurso, fin, cpu \
+                in instantanea['procesos']:
+            proceso = Proceso(id_proceso, memoria_proceso, recurso, llegada, prioridad=prioridad)
+            proceso.estado, proceso.paginas, proceso.tiene_recurso, proceso.fin = estado, paginas, tiene_recurso, fin
+            proceso.cpu = None if cpu is None else simulador.cpus[cpu]
+            por_id[id_proceso] = proceso
+            for pagina in paginas:
+                memoria.paginas[pagina] = id_proceso
+        memoria.reconstruir()
+        simulador.procesos.extend(por_id[i] for i in instantanea['admitidos'])
+        simulador.procesos_rechazados.extend(por_id[i] for i in instantanea['rechazados'])
+        for cola, ids in zip(self._colas(), instantanea['colas']):
+            for i in ids:
+                cola.append(por_id[i])
+        for recurso, (ocupado_por, esperando) in zip(simulador.recursos, instantanea['recursos']):
+            recurso.ocupado_por = None if ocupado_por is None else por_id[ocupado_por]
+            recurso.esperando.extend(por_id[i] for i in esperando)
+        for cpu, (proceso, inicio_tramo, ocupado, despachados) in zip(simulador.cpus, instantanea['cpus']):
+            cpu.proceso = None if proceso is None else por_id[proceso]
+            cpu.inicio_tramo, cpu.ocupado, cpu.despachados = inicio_tramo, ocupado, despachados
+
+    def _colas(self):
+        simulador = self.simulador
+        return (simulador.procesos_nuevos, simulador.procesos_listos,
+                simulador.procesos_bloqueados, simulador.procesos_terminados)
+
+    # Funciones que aplican cada tipo de evento sobre el estado
+
+    # La configuración solo va al principio: otra más adelante es una segunda corrida pegada
+    def _configuracion(self, tiempo, id_proceso, valores):
+        raise ValueError("La traza tiene más de una corrida (otra configuración en el medio)")
+
+    def _llegada(self, tiempo, id_proceso, valores):
+        memoria, recurso, prioridad = valores
+        self.simulador._por_id[id_proceso] = Proceso(id_proceso, memoria, recurso, tiempo, prioridad=prioridad)
+
+    def _rechazo(self, tiempo, id_proceso, valores):
+        self.simulador.procesos_rechazados.append(self.simulador._por_id[id_proceso])
+        self.simulador.rechazados += 1
+
+    def _asignacion(self, tiempo, id_proceso, valores):
+        simulador = self.simulador
+        proceso = simulador._por_id[id_proceso]
+        simulador.memoria.ocupar(id_proceso, valores)
+        proceso.paginas.extend(valores)
+        if proceso.estado == 'Nuevos' and proceso.cola is None:
+            # Entró en memoria: queda admitido en Nuevos
+            simulador.procesos.append(proceso)
+            simulador.admitidos += 1
+            simulador.procesos_nuevos.append(proceso)
+
+    def _liberacion(self, tiempo, id_proceso, valores):
+        proceso = self.simulador._por_id[id_proceso]
+        self.simulador.memoria.liberar(valores)
+        liberadas = set(valores)
+        proceso.paginas = [pagina for pagina in proceso.paginas if pagina not in liberadas]
+
+    def _movimiento(self, tiempo, id_proceso, valores):
+        origen, destino = valores
+        simulador = self.simulador
+        paginas = simulador._por_id[id_proceso].paginas
+        simulador.memoria.mover(origen, destino)
+        paginas[paginas.index(origen)] = destino
+        simulador.costo_compactacion += self._costo_movimiento
+
+    # Función para sacar a un proceso de su cola (o de su CPU) antes de pasarlo a otro estado
+    def _salir(self, tiempo, proceso):
+        if proceso.cola is not None:
+            proceso.cola.remove(proceso)
+        if proceso.estado == 'Ejecutando' and proceso.cpu is not None and proceso.cpu.proceso is proceso:
+            cpu = proceso.cpu
+            cpu.ocupado += tiempo - cpu.inicio_tramo
+            cpu.proceso = None
+
+    def _listo(self, tiempo, id_proceso, valores):
+        simulador = self.simulador
+        proceso = simulador._por_id[id_proceso]
+        self._salir(tiempo, proceso)
+        proceso.estado = 'Listo'
+        simulador.procesos_listos.append(proceso)
+
+    def _despacho(self, tiempo, id_proceso, valores):
+        simulador = self.simulador
+        proceso = simulador._por_id[id_proceso]
+        self._salir(tiempo, proceso)
+        proceso.estado = 'Ejecutando'
+        cpu = simulador.cpus[valores[0]]
+        cpu.proceso, cpu.inicio_tramo = proceso, tiempo
+        cpu.despachados += 1
+        proceso.cpu = cpu
+
+    def _bloqueo(self, tiempo, id_proceso, valores):
+        simulador = self.simulador
+        proceso = simulador._por_id[id_proceso]
+        self._salir(tiempo, proceso)
+        proceso.estado = 'Bloqueado'
+        simulador.procesos_bloqueados.append(proceso)
+        if not proceso.tiene_recurso:
+            simulador.recursos[valores[0]].esperando.append(proceso)
+
+    def _terminado(self, tiempo, id_proceso, valores):
+        simulador = self.simulador
+        proceso = simulador._por_id[id_proceso]
+        self._salir(tiempo, proceso)
+        proceso.estado = 'Terminado'
+        proceso.fin = tiempo
+        simulador.procesos_terminados.append(proceso)
+        simulador.terminados += 1
+
+    def _recurso_tomado(self, tiempo, id_proceso, valores):
+        proceso = self.simulador._por_id[id_proceso]
+        recurso = self.simulador.recursos[valores[0]]
+        if recurso.esperando and recurso.esperando[0] is proceso:
+            recurso.esperando.popleft()
+        recurso.ocupado_por = proceso
+        proceso.tiene_recurso = True
+
+    def _recurso_soltado(self, tiempo, id_proceso, valores):
+        proceso = self.simulador._por_id[id_proceso]
+        recurso = self.simulador.recursos[valores[0]]
+        if recurso.ocupado_por is proceso:
+            recurso.ocupado_por = None
+        proceso.tiene_recurso = False
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Reproducir una traza grabada por el simulador")
+    parser.add_argument("traza", help="Archivo de traza")
+    parser.add_argument("--velocidad", type=float, default=None,
+                        help="Unidades de tiempo virtual por segundo (por defecto, lo más rápido posible)")
+    parser.add_argument("--desde", type=float, default=None, help="Instante desde el que se reproduce")
+    parser.add_argument("--sin-interfaz", action="store_true", help="Reproducir sin ventana (para medir o analizar)")
+    args = parser.parse_args()
+
+    reproductor = Reproductor(args.traza)
+    if args.desde is not None:
+        reproductor.ir_a(args.desde)
+
+    if args.sin_interfaz:
+        inicio = time.perf_counter()
+        eventos = reproductor.eventos
+        reproductor.reproducir(args.velocidad)
+        duracion = time.perf_counter() - inicio
+        simulador = reproductor.simulador
+        print(f"{reproductor.eventos - eventos} eventos en {duracion:.3f} s; reloj final {simulador.reloj:.1f}, "
+              f"terminados {len(simulador.procesos_terminados)}, rechazados {len(simulador.procesos_rechazados)}")
+    else:
+        from interfaz import Interfaz
+
+        ventana = Interfaz(reproductor.simulador, f"Reproducción de {args.traza}")
+        detener = threading.Event()
+        threading.Thread(target=reproductor.reproducir, args=(args.velocidad, detener), daemon=True).start()
+        ventana.mainloop()
+        detener.set()
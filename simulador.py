@@ -0,0 +1,774 @@
+import copy
+import heapq
+import itertools
+import random
+import threading
+import time
+from collections import deque
+
+import compactador
+from memoria import AsignadorBuddy, AsignadorPaginas
+from colas import ColaAdmision, ColaEstado
+from cpus import crear_cpus
+from metricas import Metricas
+from paginacion import POLITICAS, MemoriaVirtual, REFERENCIAS_POR_UNIDAD, TIEMPO_FALLO
+from planificadores import PLANIFICADORES, crear_planificador
+from recursos import crear_recursos
+import traza
+from traza import CONFIGURACION as TRAZA_CONFIGURACION
+
+# Tipos de evento de la simulación
+LLEGADA = 0  # Un proceso nuevo llega al sistema
+FIN_RAFAGA = 1  # El proceso en ejecución termina su ráfaga de CPU
+FIN_BLOQUEO = 2  # Un proceso bloqueado con su recurso vuelve a Listo
+REVISAR_NUEVOS = 3  # Equivalente a una vuelta de nuevo_a_listo
+CARGA = 4  # Leer la próxima llegada de una carga que se lee de a poco
+
+EPSILON = 1e-9  # Tolerancia para dar por terminada una ráfaga (el reloj es de punto flotante)
+
+# Evento de la traza que corresponde a cada cambio de estado
+_EVENTOS_TRAZA = {
+    'Listo': traza.LISTO,
+    'Ejecutando': traza.DESPACHO,
+    'Bloqueado': traza.BLOQUEO,
+    'Terminado': traza.TERMINADO,
+}
+
+# Clase para representar un proceso dentro del simulador
+class Proceso:
+    def __init__(self, id, memoria, recurso=0, llegada=0.0, rafaga=2, prioridad=0):
+        self.id = id
+        self.memoria = memoria
+        self.estado = 'Nuevos'
+        self.veces_bloqueado = 0  # Atributo para contar las veces que ha sido bloqueado
+        self.recurso = recurso  # R0, R1 o R2
+        self.paginas = []  # Páginas asignadas en la memoria principal
+        self.tiene_recurso = False  # Indica si este proceso tiene bloqueado un recurso
+        self.llegada = llegada  # Instante (virtual) en que llegó el proceso
+        self.cola = None  # Cola de estado en la que está el proceso (para sacarlo en O(1))
+        self.rafaga = rafaga  # Duración de cada ráfaga de CPU
+        self.restante = rafaga  # Lo que le falta a la ráfaga actual
+        self.prioridad = prioridad  # Menor número, mayor prioridad
+        self.nivel = 0  # Nivel en las colas multinivel (MLFQ)
+        self.epoca = 0  # Impulso de MLFQ en el que se fijó su nivel (uno anterior lo devuelve al nivel 0)
+        self.fin = None  # Instante (virtual) en que terminó
+        self.cpu = None  # Última CPU en la que corrió
+        # Tiempos para las métricas
+        self.desde = llegada  # Instante en que entró al estado actual
+        self.espera = 0.0  # Tiempo total en Listo
+        self.bloqueado = 0.0  # Tiempo total en Bloqueado
+        self.respuesta = None  # Tiempo desde la llegada hasta el primer despacho
+
+    # El estado se guarda como propiedad para invalidar el texto cacheado cuando cambia
+    @property
+    def estado(self):
+        return self._estado
+
+    @estado.setter
+    def estado(self, estado):
+        self._estado = estado
+        self._texto = None
+
+    def __str__(self):
+        if self._texto is None:
+            self._texto = f"Proceso {self.id}: {self.estado} (Memoria: {self.memoria} MB) Recurso: R{self.recurso}"
+        return self._texto
+
+# Simulador de eventos discretos con reloj virtual (sin interfaz gráfica).
+# Ciclo de vida Nuevos -> Listo -> Ejecutando -> Bloqueado -> Terminado: en lugar
+# de dormir hilos, el reloj avanza hasta el próximo evento de la cola de prioridad.
+# Se puede correr de una (ejecutar) o al ritmo del reloj real (ejecutar_en_tiempo_real)
+# con una interfaz gráfica conectada, como hacen bestia.py y compactacion.py.
+class Simulador:
+    def __init__(self, memoria_total=1000, tamano_pagina=50, numero_recursos=3,
+                 duracion_rafaga=2, tiempo_bloqueo=3, max_bloqueos=3,
+                 intervalo_nuevos=3, compactar=False,
+                 umbral_compactacion=compactador.UMBRAL_FRAGMENTACION,
+                 pasos_compactacion=compactador.PASOS_COMPACTACION,
+                 compactacion_a_medida=False, planificador=None, numero_cpus=1,
+                 colas_por_cpu=False, semilla=None, traza=None, historial=None, metricas=True,
+                 esperar_memoria=False, paginacion=None, tiempo_fallo=TIEMPO_FALLO,
+                 referencias_por_unidad=REFERENCIAS_POR_UNIDAD, tlb=None, tabla_paginas='plana', buddy=False,
+                 archivo_procesos=None):
+        # Generador de números aleatorios propio: con la misma semilla, la misma corrida
+        self.semilla = semilla
+        self.aleatorio = random.Random(semilla)
+        self.traza = traza  # GrabadorTraza donde se graba cada evento (o None)
+
+        # Configuración de la memoria
+        self.memoria_total = memoria_total
+        self.tamano_pagina = tamano_pagina
+        self.numero_paginas = memoria_total // tamano_pagina
+        # Con `buddy`, cada proceso recibe un bloque contiguo de 2^k páginas de un asignador buddy
+        # (sin compactación: partir y fusionar bloques ya evita la fragmentación externa)
+        if buddy and compactar:
+            raise ValueError("El asignador buddy no se compacta: elegir buddy o compactar")
+        if buddy and paginacion is not None:
+            raise ValueError("La paginación por demanda carga marcos sueltos: no usa el asignador buddy")
+        self.buddy = buddy
+        self.memoria = (AsignadorBuddy if buddy else AsignadorPaginas)(self.numero_paginas, tamano_pagina)
+        self.paginas_memoria = self.memoria.paginas  # Tabla de páginas (dueño de cada página)
+        self.compactar = compactar  # Asignación contigua con compactación incremental
+        self.umbral_compactacion = umbral_compactacion
+        self.pasos_compactacion = pasos_compactacion
+        self.compactacion_a_medida = compactacion_a_medida  # Abrir solo el hueco que pide la asignación
+        self.costo_compactacion = compactador.CostoCompactacion()
+        # Con `paginacion` (política de reemplazo: 'fifo', 'lru', 'clock' u 'opt') cada proceso tiene
+        # un espacio virtual y sus páginas se cargan por demanda: nadie se rechaza por falta de memoria.
+        # `tabla_paginas` es la tabla que guarda las traducciones ('plana', 'multinivel', 'invertida')
+        self.memoria_virtual = None
+        if paginacion is not None:
+            if compactar:
+                raise ValueError("La paginación por demanda no usa memoria contigua: no se puede compactar")
+            self.memoria_virtual = MemoriaVirtual(self.memoria, paginacion, self._pagina_cargada,
+                                                  self._pagina_desalojada, tabla_paginas)
+        self.tiempo_fallo = tiempo_fallo  # Espera de la CPU por cada fallo de página
+        self.referencias_por_unidad = referencias_por_unidad
+
+        # Tiempos del ciclo de vida (en unidades de reloj virtual)
+        self.duracion_rafaga = duracion_rafaga
+        self.tiempo_bloqueo = tiempo_bloqueo
+        self.max_bloqueos = max_bloqueos
+        self.intervalo_nuevos = intervalo_nuevos
+
+        # Listas de procesos en los diferentes estados. Con `historial` solo se conservan los
+        # últimos procesos admitidos, rechazados y terminados (memoria constante en corridas largas)
+        self.historial = historial
+        self.procesos = deque(maxlen=historial)
+        self.procesos_nuevos = ColaEstado('Nuevos')
+        self.procesos_listos = ColaEstado('Listos')
+        self.procesos_bloqueados = ColaEstado('Bloqueados')
+        self.procesos_terminados = ColaEstado('Terminados')
+        self.procesos_rechazados = deque(maxlen=historial)
+        # Con `esperar_memoria`, el proceso que no entra en memoria espera (ordenado por páginas
+        # pedidas) a que se liberen páginas, en lugar de ser rechazado
+        self.esperando_memoria = ColaAdmision() if esperar_memoria else None
+        self.admitidos = 0
+        self.rechazados = 0
+        self.terminados = 0
+        self.recursos = crear_recursos(numero_recursos)  # Cada recurso con su cola de espera FIFO
+        self._por_id = {}
+        self._ids = itertools.count(1)
+
+        # Política de planificación: decide el orden de Listo y cuánto corre cada proceso
+        if planificador is None or isinstance(planificador, str):
+            planificador = crear_planificador(planificador or 'fifo')
+        self.planificador = planificador
+
+        # CPUs con una cola Listo compartida, o una cola por CPU donde la CPU que se queda
+        # sin trabajo le roba a la cola más larga
+        self.colas_por_cpu = colas_por_cpu
+        if colas_por_cpu:
+            self.cpus = crear_cpus(numero_cpus, crear_cola=planificador.copia)
+        else:
+            self.cpus = crear_cpus(numero_cpus, planificador)
+        # Con `tlb` (una TLB de modelo), cada CPU tiene su propia copia
+        self.tlb = tlb
+        if tlb is not None:
+            for cpu in self.cpus:
+                cpu.tlb = copy.deepcopy(tlb)
+        self._cpus_libres = self.cpus[::-1]  # Pila de CPUs libres (la CPU0 queda arriba)
+        self._cancelados = set()  # Eventos FIN_RAFAGA de tramos expulsados
+        self.expulsiones = 0
+        self.robos = 0
+
+        # Reloj virtual y cola de eventos (tiempo, secuencia, tipo, proceso)
+        self.reloj = 0.0
+        self.eventos = []
+        self._secuencia = itertools.count()
+        self._revisando_nuevos = False
+        self.transiciones = 0
+
+        # Para correr en tiempo real con otros hilos (la interfaz) leyendo y agregando procesos
+        self.lock = threading.RLock()
+        self._cambio = threading.Condition(self.lock)
+        self._inicio_real = None  # (instante real, instante virtual, velocidad) al arrancar en tiempo real
+        self.al_cambiar = None  # Función que se llama después de cada evento (por ejemplo para refrescar la interfaz)
+
+        # Métricas que se actualizan en cada transición (None para no medir); con `archivo_procesos`
+        # (un archivo de texto abierto) se escribe además una fila CSV por proceso terminado
+        self.metricas = Metricas(self, archivo_procesos) if metricas else None
+
+        if traza is not None:
+            # Paginación: 0 sin paginación por demanda, si no 1 + posición de la política en POLITICAS
+            politica = 0 if self.memoria_virtual is None else list(POLITICAS).index(self.memoria_virtual.politica.nombre) + 1
+            traza.registrar(TRAZA_CONFIGURACION, self.reloj, 0,
+                            (memoria_total, tamano_pagina, numero_recursos, numero_cpus, int(compactar), politica))
+
+        self._manejadores = {
+            LLEGADA: self._llegada,
+            FIN_RAFAGA: self._fin_rafaga,
+            FIN_BLOQUEO: self._fin_bloqueo,
+            REVISAR_NUEVOS: self._revisar_nuevos,
+            CARGA: self._cargar,
+        }
+
+    @property
+    def memoria_usada(self):
+        return self.memoria.memoria_usada
+
+    # Proceso en la CPU0 (con una sola CPU, el proceso en ejecución)
+    @property
+    def proceso_ejecucion(self):
+        return self.cpus[0].proceso
+
+    # Procesos en ejecución en todas las CPUs
+    @property
+    def procesos_ejecucion(self):
+        return [cpu.proceso for cpu in self.cpus if cpu.proceso is not None]
+
+    # Función para agendar un evento dentro de `demora` unidades de tiempo
+    def programar(self, demora, tipo, proceso=None):
+        secuencia = next(self._secuencia)
+        heapq.heappush(self.eventos, (self.reloj + demora, secuencia, tipo, proceso))
+        return secuencia
+
+    # Instante virtual actual; en tiempo real sigue al reloj de pared
+    def ahora(self):
+        if self._inicio_real is None:
+            return self.reloj
+        inicio_real, inicio_virtual, velocidad = self._inicio_real
+        return max(self.reloj, inicio_virtual + (time.monotonic() - inicio_real) * velocidad)
+
+    # Función para agregar un proceso que llegará en el instante `llegada` (por defecto, ahora)
+    def agregar_proceso(self, memoria_necesaria, llegada=None, recurso=None, rafaga=None, prioridad=0):
+        with self._cambio:
+            if llegada is None:
+                llegada = self.ahora()
+            if recurso is None:
+                recurso = self.aleatorio.randrange(len(self.recursos))
+            if rafaga is None:
+                rafaga = self.duracion_rafaga
+            proceso = Proceso(next(self._ids), memoria_necesaria, recurso, llegada, rafaga, prioridad)
+            self._por_id[proceso.id] = proceso
+            heapq.heappush(self.eventos, (llegada, next(self._secuencia), LLEGADA, proceso))
+            self._cambio.notify()  # Despertar al ciclo en tiempo real si está esperando
+            return proceso
+
+    # Función para agregar `cantidad` procesos aleatorios (memoria, recurso, ráfaga y prioridad)
+    # que llegan con un tiempo medio `intervalo` entre uno y otro, a partir de `desde`
+    def agregar_procesos_aleatorios(self, cantidad, intervalo, desde=0.0):
+        aleatorio = self.aleatorio
+        llegada = desde
+        for _ in range(cantidad):
+            self.agregar_proceso(aleatorio.randint(50, 200), llegada, rafaga=aleatorio.randint(1, 4),
+                                 prioridad=aleatorio.randint(0, 4))
+            llegada += aleatorio.expovariate(1 / intervalo)
+        return llegada
+
+    # Función para alimentar la simulación con una carga que se lee de a poco (por ejemplo
+    # cargas.leer_carga): cada llegada se lee recién cuando el reloj alcanza a la anterior,
+    # así la cola de eventos tiene una sola llegada pendiente por carga
+    def cargar(self, llegadas):
+        with self._cambio:
+            heapq.heappush(self.eventos, (self.reloj, next(self._secuencia), CARGA, iter(llegadas)))
+            self._cambio.notify()
+
+    def _cargar(self, llegadas):
+        llegada = next(llegadas, None)
+        if llegada is None:
+            return
+        instante = max(llegada.llegada, self.reloj)  # Una llegada fuera de orden entra ahora
+        self.agregar_proceso(llegada.memoria, instante, llegada.recurso, llegada.rafaga, llegada.prioridad)
+        heapq.heappush(self.eventos, (instante, next(self._secuencia), CARGA, llegadas))
+
+    # Función para cambiar el estado de un proceso contando la transición
+    def _cambiar_estado(self, proceso, estado, valores=()):
+        if self.traza is not None:
+            tipo = _EVENTOS_TRAZA[estado]
+            if tipo == traza.LISTO and proceso.estado == 'Bloqueado':
+                tipo = traza.DESPERTAR
+            self.traza.registrar(tipo, self.reloj, proceso.id, valores)
+        if self.metricas is not None:
+            self.metricas.transicion(proceso, proceso.estado, estado, self.reloj)
+        proceso.estado = estado
+        self.transiciones += 1
+
+    # Función para asignar páginas a un proceso en la memoria
+    def asignar_paginas(self, proceso):
+        if self.memoria_virtual is not None:
+            # Por demanda: el proceso entra sin páginas y las carga al referenciarlas
+            if proceso.id not in self.memoria_virtual.espacios:
+                self.memoria_virtual.crear_espacio(proceso.id, self.memoria.paginas_necesarias(proceso.memoria),
+                                                   self.aleatorio)
+                if self.traza is not None:
+                    # Asignación sin páginas: en la traza marca que el proceso quedó admitido
+                    self.traza.registrar(traza.ASIGNACION, self.reloj, proceso.id, ())
+            return True
+        faltantes = self.memoria.paginas_necesarias(proceso.memoria) - len(proceso.paginas)
+        if faltantes <= 0:
+            return True
+
+        if not self.compactar:
+            paginas = self.memoria.asignar(proceso.id, faltantes)
+        elif self.memoria.paginas_libres < faltantes:
+            paginas = None
+        else:
+            self.compactar_memoria()
+            paginas = self.memoria.asignar_contiguas(proceso.id, faltantes)
+            if paginas is None:
+                # La memoria libre alcanza pero está repartida en huecos
+                self.compactar_memoria(forzar=True, paginas_pedidas=faltantes)
+                paginas = self.memoria.asignar_contiguas(proceso.id, faltantes)
+        if paginas is None:
+            return False
+        proceso.paginas.extend(paginas)
+        if self.traza is not None:
+            self.traza.registrar(traza.ASIGNACION, self.reloj, proceso.id, paginas)
+        if self.metricas is not None:
+            self.metricas.memoria(self.memoria.paginas_usadas, self.reloj)
+        return True
+
+    # Función para liberar las páginas asignadas a un proceso
+    def liberar_paginas(self, proceso):
+        if self.traza is not None:
+            self.traza.registrar(traza.LIBERACION, self.reloj, proceso.id, proceso.paginas)
+        if self.memoria_virtual is not None:
+            self.memoria_virtual.liberar(proceso.id)
+        else:
+            self.memoria.liberar(proceso.paginas)
+        proceso.paginas = []
+        if self.metricas is not None:
+            self.metricas.memoria(self.memoria.paginas_usadas, self.reloj)
+        if self.compactar:
+            self.compactar_memoria()
+        if self.esperando_memoria:
+            self._admitir_en_espera()
+
+    # Funciones que llama la memoria virtual al cargar una página en un marco o al desalojarla
+    def _pagina_cargada(self, id_proceso, marco):
+        self._por_id[id_proceso].paginas.append(marco)
+        if self.traza is not None:
+            self.traza.registrar(traza.ASIGNACION, self.reloj, id_proceso, (marco,))
+        if self.metricas is not None:
+            self.metricas.memoria(self.memoria.paginas_usadas, self.reloj)
+
+    def _pagina_desalojada(self, id_proceso, marco, pagina):
+        self._por_id[id_proceso].paginas.remove(marco)
+        self._invalidar_tlb(id_proceso, pagina)
+        if self.traza is not None:
+            self.traza.registrar(traza.LIBERACION, self.reloj, id_proceso, (marco,))
+        if self.metricas is not None:
+            self.metricas.memoria(self.memoria.paginas_usadas, self.reloj)
+
+    # Función de compactación de memoria: solo actúa si la fragmentación pasa el umbral
+    # (o si se fuerza) y mueve a lo sumo `pasos_compactacion` páginas por llamada.
+    # Forzada con `paginas_pedidas` y compactación a medida, solo abre ese hueco.
+    def compactar_memoria(self, forzar=False, paginas_pedidas=None):
+        if forzar and paginas_pedidas and self.compactacion_a_medida:
+            plan = compactador.planificar_hueco(self.paginas_memoria, paginas_pedidas)
+            costo = compactador.aplicar(self.memoria, plan, self._reubicar_pagina)
+        elif forzar or compactador.necesita_compactar(self.memoria, self.umbral_compactacion):
+            costo = compactador.compactar(self.memoria, self._reubicar_pagina,
+                                          None if forzar else self.pasos_compactacion)
+        else:
+            return
+        self.costo_compactacion += costo
+
+    # Función para mantener al día las páginas de un proceso cuando la compactación las mueve
+    def _reubicar_pagina(self, id_proceso, origen, destino):
+        paginas = self._por_id[id_proceso].paginas
+        pagina = paginas.index(origen)
+        paginas[pagina] = destino
+        self._invalidar_tlb(id_proceso, pagina)
+        if self.traza is not None:
+            self.traza.registrar(traza.MOVIMIENTO, self.reloj, id_proceso, (origen, destino))
+
+    # Función para borrar de las TLB una traducción que dejó de valer. Al terminar un proceso
+    # sus entradas quedan en las TLB hasta que se pisen, pero traducir rechaza antes de buscar
+    # en la TLB a los procesos que ya no tienen memoria, así que nunca vuelven a acertar.
+    def _invalidar_tlb(self, id_proceso, pagina):
+        if self.tlb is not None:
+            for cpu in self.cpus:
+                cpu.tlb.invalidar(id_proceso, pagina)
+
+    # Función para traducir una dirección virtual de un proceso a una dirección física,
+    # pasando por la TLB de la CPU donde corre (o corrió por última vez). Sin paginación por
+    # demanda, la página virtual i es la i-ésima página asignada al proceso; con paginación,
+    # una página que no está en memoria se carga (fallo de página).
+    def traducir(self, id_proceso, direccion):
+        with self.lock:
+            proceso = self._por_id.get(id_proceso)
+            if proceso is None:
+                raise ValueError(f"No existe el proceso P{id_proceso}")
+            pagina, desplazamiento = divmod(direccion, self.tamano_pagina)
+            # El espacio se valida antes de la TLB: un proceso terminado (o que todavía espera
+            # memoria) no tiene páginas y sus entradas viejas no tienen que acertar
+            if self.memoria_virtual is not None:
+                if id_proceso not in self.memoria_virtual.espacios:
+                    raise ValueError(f"P{id_proceso} no tiene espacio de direcciones en memoria")
+                limite = self.memoria.paginas_necesarias(proceso.memoria)
+            else:
+                limite = len(proceso.paginas)
+            if not 0 <= pagina < limite:
+                raise ValueError(f"Dirección {direccion} fuera del espacio de P{id_proceso}")
+            tlb = (proceso.cpu or self.cpus[0]).tlb
+            marco = tlb.buscar(id_proceso, pagina) if tlb is not None else None
+            if marco is None:
+                if self.memoria_virtual is not None:
+                    marco = self.memoria_virtual.acceder(id_proceso, pagina)[0]
+                else:
+                    marco = proceso.paginas[pagina]
+                if tlb is not None:
+                    tlb.cargar(id_proceso, pagina, marco)
+            elif self.memoria_virtual is not None:
+                self.memoria_virtual.referencias += 1
+                self.memoria_virtual.politica.referenciada(marco)
+            return marco * self.tamano_pagina + desplazamiento
+
+    # Función para liberar el recurso asignado a un proceso; si alguien lo esperaba,
+    # el recurso pasa al primero de la cola y ese proceso se despierta en el acto
+    def liberar_recurso(self, proceso):
+        if proceso.tiene_recurso:
+            proceso.tiene_recurso = False
+            siguiente = self.recursos[proceso.recurso].liberar()
+            if self.traza is not None:
+                self.traza.registrar(traza.RECURSO_SOLTADO, self.reloj, proceso.id, (proceso.recurso,))
+                if siguiente is not None:
+                    self.traza.registrar(traza.RECURSO_TOMADO, self.reloj, siguiente.id, (siguiente.recurso,))
+            if siguiente is not None:
+                self._desbloquear(siguiente)
+
+    # Función para pasar un proceso de Bloqueado a Listo
+    def _desbloquear(self, proceso):
+        self.procesos_bloqueados.remove(proceso)
+        self._a_listo(proceso)
+
+    # Función para poner un proceso en Listo; si la política lo indica, desaloja a uno que ejecuta
+    def _a_listo(self, proceso):
+        self._cambiar_estado(proceso, 'Listo')
+        self.procesos_listos.append(proceso)
+        if self.colas_por_cpu:
+            # Vuelve a la cola de la última CPU en la que corrió, o a la menos cargada
+            cpu = proceso.cpu if proceso.cpu is not None else min(self.cpus, key=lambda c: len(c.cola))
+            cpu.cola.agregar(proceso)
+            candidatas = (cpu,)
+        else:
+            self.planificador.agregar(proceso)
+            candidatas = self.cpus
+        if self._cpus_libres or not candidatas[0].cola.expropiativa:
+            return  # Hay una CPU libre que lo va a tomar sin desalojar a nadie, o la política no desaloja
+        for cpu in candidatas:
+            actual = cpu.proceso
+            restante = actual.restante - max(self.reloj - cpu.inicio_tramo - cpu.espera_fallos, 0.0)
+            if cpu.cola.expulsa(proceso, actual, restante):
+                self._expulsar(cpu, restante)
+                return
+
+    # Función para sacar de la CPU al proceso en ejecución antes de que termine su tramo
+    def _expulsar(self, cpu, restante):
+        proceso = cpu.proceso
+        self._cancelados.add(cpu.evento)
+        self._liberar_cpu(cpu)
+        proceso.restante = restante
+        self.expulsiones += 1
+        cpu.cola.fin_tramo(proceso, False)
+        self._a_listo(proceso)
+
+    # Función para dejar libre una CPU sumando el tiempo que estuvo ocupada
+    def _liberar_cpu(self, cpu):
+        cpu.ocupado += self.reloj - cpu.inicio_tramo
+        cpu.proceso = None
+        self._cpus_libres.append(cpu)
+
+    # Función para elegir la cola de la que toma trabajo una CPU libre: la suya o, si está
+    # vacía, la más larga de las otras (robo de trabajo)
+    def _cola_de(self, cpu):
+        if not self.colas_por_cpu or cpu.cola:
+            return cpu.cola
+        self.robos += 1
+        return max((otra.cola for otra in self.cpus), key=len)
+
+    # Función para bloquear un proceso; si tiene su recurso se agenda su vuelta a Listo,
+    # si no, queda en la cola del recurso hasta que se lo pasen
+    def _bloquear(self, proceso):
+        self._cambiar_estado(proceso, 'Bloqueado', (proceso.recurso,))
+        self.procesos_bloqueados.append(proceso)
+        if proceso.tiene_recurso:
+            self.programar(self.tiempo_bloqueo, FIN_BLOQUEO, proceso)
+
+    # Función para mover procesos de Listo a Ejecutando mientras haya CPUs libres;
+    # el planificador elige el proceso y cuánto puede correr
+    def _despachar(self):
+        libres = self._cpus_libres
+        while libres and self.procesos_listos:
+            cpu = libres[-1]
+            planificador = self._cola_de(cpu)
+            proceso = planificador.elegir(self.reloj)
+            self.procesos_listos.remove(proceso)
+            self._cambiar_estado(proceso, 'Ejecutando', (cpu.id,))
+
+            # Si no puede adquirir el recurso, va a bloqueado
+            if not proceso.tiene_recurso:
+                obtenido = self.recursos[proceso.recurso].adquirir(proceso)
+                if self.metricas is not None:
+                    self.metricas.contencion(proceso.recurso, not obtenido)
+                if not obtenido:
+                    self._bloquear(proceso)
+                    continue
+                if self.traza is not None:
+                    self.traza.registrar(traza.RECURSO_TOMADO, self.reloj, proceso.id, (proceso.recurso,))
+
+            tramo = planificador.tramo(proceso)
+            if tramo is None or tramo > proceso.restante:
+                tramo = proceso.restante
+            # Con paginación por demanda, el tramo hace sus referencias a memoria y cada
+            # fallo de página deja a la CPU esperando al swap
+            espera_fallos = 0.0
+            if cpu.tlb is not None:
+                cpu.tlb.cambio_contexto(proceso.id)
+            if self.memoria_virtual is not None:
+                referencias = max(1, round(tramo * self.referencias_por_unidad))
+                espera_fallos = self.memoria_virtual.ejecutar(proceso.id, referencias, cpu.tlb) * self.tiempo_fallo
+            libres.pop()
+            cpu.proceso, cpu.inicio_tramo, cpu.tramo = proceso, self.reloj, tramo
+            cpu.espera_fallos = espera_fallos
+            cpu.evento = self.programar(tramo + espera_fallos, FIN_RAFAGA, proceso)
+            cpu.despachados += 1
+            proceso.cpu = cpu
+
+    def _llegada(self, proceso):
+        if self.traza is not None:
+            self.traza.registrar(traza.LLEGADA, self.reloj, proceso.id,
+                                 (proceso.memoria, proceso.recurso, proceso.prioridad))
+        if not self.asignar_paginas(proceso):
+            if self.esperando_memoria is not None:
+                paginas = self.memoria.paginas_necesarias(proceso.memoria)
+                if paginas <= (self.memoria.bloque_maximo if self.buddy else self.numero_paginas):
+                    self.esperando_memoria.append(proceso, paginas)
+                    return
+            self.procesos_rechazados.append(proceso)
+            self.rechazados += 1
+            if self.metricas is not None:
+                self.metricas.rechazo(self.reloj)
+            if self.historial is not None:
+                del self._por_id[proceso.id]
+            if self.traza is not None:
+                self.traza.registrar(traza.RECHAZO, self.reloj, proceso.id)
+            return
+        self._admitir(proceso)
+
+    # Función para admitir en Nuevos a un proceso que ya tiene sus páginas
+    def _admitir(self, proceso):
+        self.procesos.append(proceso)
+        self.admitidos += 1
+        if self.metricas is not None:
+            self.metricas.llegada(proceso, self.reloj)
+        self.procesos_nuevos.append(proceso)
+        self.transiciones += 1
+        if not self._revisando_nuevos:
+            self._revisando_nuevos = True
+            self.programar(self.intervalo_nuevos, REVISAR_NUEVOS)
+
+    # Función para admitir a los procesos en espera que entran en la memoria libre;
+    # solo se llama al liberar páginas, que es lo único que puede hacerles lugar
+    def _admitir_en_espera(self):
+        while True:
+            # Con buddy el pedido tiene que entrar en un solo bloque libre
+            proceso = self.esperando_memoria.sacar(self.memoria.mayor_bloque if self.buddy
+                                                   else self.memoria.paginas_libres)
+            if proceso is None:
+                return
+            self.asignar_paginas(proceso)
+            self._admitir(proceso)
+
+    def _revisar_nuevos(self, _):
+        while self.procesos_nuevos:
+            self._a_listo(self.procesos_nuevos.popleft())
+        self._revisando_nuevos = False
+        self._despachar()
+
+    def _fin_rafaga(self, proceso):
+        cpu = proceso.cpu
+        self._liberar_cpu(cpu)
+        proceso.restante -= cpu.tramo
+
+        # Se le acabó el quantum antes de terminar la ráfaga: vuelve a Listo
+        if proceso.restante > EPSILON:
+            cpu.cola.fin_tramo(proceso, True)
+            self._a_listo(proceso)
+            self._despachar()
+            return
+        cpu.cola.fin_tramo(proceso, False)
+        proceso.restante = proceso.rafaga
+
+        # Verificamos si ya ha sido bloqueado `max_bloqueos` veces
+        if proceso.veces_bloqueado < self.max_bloqueos:
+            proceso.veces_bloqueado += 1
+            self._bloquear(proceso)
+        else:
+            self._cambiar_estado(proceso, 'Terminado')
+            proceso.fin = self.reloj
+            self.procesos_terminados.append(proceso)
+            self.terminados += 1
+            if self.historial is not None and len(self.procesos_terminados) > self.historial:
+                del self._por_id[self.procesos_terminados.popleft().id]
+            self.liberar_paginas(proceso)
+            self.liberar_recurso(proceso)
+        self._despachar()
+
+    def _fin_bloqueo(self, proceso):
+        self._desbloquear(proceso)
+        self._despachar()
+
+    # Función para procesar el próximo evento; devuelve False si no quedan eventos
+    def paso(self):
+        if not self.eventos:
+            return False
+        tiempo, secuencia, tipo, proceso = heapq.heappop(self.eventos)
+        if self._cancelados and secuencia in self._cancelados:
+            self._cancelados.discard(secuencia)
+            return True
+        self.reloj = tiempo
+        self._manejadores[tipo](proceso)
+        if self.al_cambiar is not None:
+            self.al_cambiar()
+        return True
+
+    # Función para ejecutar la simulación hasta vaciar la cola o llegar a `hasta`
+    def ejecutar(self, hasta=None):
+        eventos = self.eventos
+        manejadores = self._manejadores
+        cancelados = self._cancelados
+        while eventos:
+            if hasta is not None and eventos[0][0] > hasta:
+                self.reloj = hasta
+                break
+            tiempo, secuencia, tipo, proceso = heapq.heappop(eventos)
+            if cancelados and secuencia in cancelados:
+                cancelados.discard(secuencia)  # Fin de tramo de un proceso que fue expulsado
+                continue
+            self.reloj = tiempo
+            manejadores[tipo](proceso)
+        return self.transiciones
+
+    # Función para ejecutar la simulación al ritmo del reloj real: `velocidad` unidades
+    # de tiempo virtual por segundo. Corre hasta que se active el evento `detener`
+    # (pensada para un hilo aparte mientras la interfaz lee el estado bajo `lock`).
+    def ejecutar_en_tiempo_real(self, velocidad=1.0, detener=None):
+        with self._cambio:
+            self._inicio_real = (time.monotonic(), self.reloj, velocidad)
+            try:
+                while detener is None or not detener.is_set():
+                    ahora = self.ahora()
+                    if self.eventos and self.eventos[0][0] <= ahora:
+                        self.paso()
+                        continue
+                    # Dormir hasta el próximo evento o hasta que agreguen un proceso
+                    espera = (self.eventos[0][0] - ahora) / velocidad if self.eventos else None
+                    if detener is not None and (espera is None or espera > 0.1):
+                        espera = 0.1  # Revisar `detener` de vez en cuando
+                    self._cambio.wait(espera)
+            finally:
+                self.reloj = self.ahora()
+                self._inicio_real = None
+
+if __name__ == "__main__":
+    import argparse
+    from cargas import leer_carga
+    from paginacion import POLITICAS
+    from tablas_paginas import NIVELES, TABLAS, TablaMultinivel
+    from tlb import REEMPLAZOS, TLB
+
+    parser = argparse.ArgumentParser(description="Simulación de procesos y memoria sin interfaz gráfica")
+    parser.add_argument("--procesos", type=int, default=200, help="Cantidad de procesos a simular")
+    parser.add_argument("--intervalo", type=float, default=8.0, help="Tiempo medio entre llegadas")
+    parser.add_argument("--compactar", action="store_true", help="Asignar páginas contiguas compactando la memoria cuando se fragmenta")
+    parser.add_argument("--buddy", action="store_true", help="Asignar la memoria física con un asignador buddy (bloques de 2^k páginas)")
+    parser.add_argument("--a-medida", action="store_true", help="Al compactar por falta de hueco, abrir solo el hueco pedido")
+    parser.add_argument("--planificador", choices=sorted(PLANIFICADORES), default="fifo", help="Política de planificación de CPU")
+    parser.add_argument("--quantum", type=float, default=1.0, help="Quantum del round robin")
+    parser.add_argument("--cpus", type=int, default=1, help="Cantidad de CPUs simuladas")
+    parser.add_argument("--por-cpu", action="store_true", help="Una cola Listo por CPU con robo de trabajo (en lugar de una compartida)")
+    parser.add_argument("--semilla", type=int, default=None, help="Semilla para repetir exactamente la misma corrida")
+    parser.add_argument("--traza", default=None, help="Archivo donde grabar la traza binaria de eventos")
+    parser.add_argument("--carga", default=None, help="Carga de trabajo en CSV o JSONL (en lugar de procesos aleatorios)")
+    parser.add_argument("--esperar-memoria", action="store_true", help="Los procesos que no entran en memoria esperan a que se libere (en lugar de ser rechazados)")
+    parser.add_argument("--paginacion", choices=sorted(POLITICAS), default=None, help="Memoria virtual con paginación por demanda y esta política de reemplazo")
+    parser.add_argument("--tiempo-fallo", type=float, default=TIEMPO_FALLO, help="Espera de la CPU por cada fallo de página")
+    parser.add_argument("--tabla-paginas", choices=sorted(TABLAS), default="plana", help="Tabla de páginas de la paginación por demanda")
+    parser.add_argument("--niveles", type=int, default=NIVELES, help="Niveles de la tabla multinivel")
+    parser.add_argument("--tlb", type=int, default=None, help="Simular una TLB por CPU con esta cantidad de entradas")
+    parser.add_argument("--asociatividad", type=int, default=4, help="Vías por conjunto de la TLB")
+    parser.add_argument("--tlb-reemplazo", choices=REEMPLAZOS, default="lru", help="Reemplazo dentro de cada conjunto de la TLB")
+    parser.add_argument("--asid", action="store_true", help="La TLB distingue procesos y no se vacía en cada cambio de contexto")
+    parser.add_argument("--tamano-pagina", type=int, default=50, help="Tamaño de página (en MB)")
+    parser.add_argument("--memoria", type=int, default=1000, help="Memoria física total (en MB)")
+    parser.add_argument("--historial", type=int, default=None, help="Procesos terminados que se conservan (por defecto, todos)")
+    parser.add_argument("--metricas", default=None, help="Archivo JSON donde exportar las métricas al terminar")
+    parser.add_argument("--metricas-procesos", default=None, help="Archivo CSV con una fila por proceso terminado")
+    parser.add_argument("--puerto-metricas", type=int, default=None, help="Publicar métricas para Prometheus en este puerto local mientras corre")
+    args = parser.parse_args()
+
+    opciones = {"quantum": args.quantum} if args.planificador == "rr" else {}
+    grabador = traza.GrabadorTraza(args.traza) if args.traza else None
+    archivo_procesos = open(args.metricas_procesos, 'w', newline='') if args.metricas_procesos else None
+    tabla_paginas = TablaMultinivel(args.niveles) if args.tabla_paginas == "multinivel" else args.tabla_paginas
+    modelo_tlb = TLB(args.tlb, args.asociatividad, args.tlb_reemplazo, args.asid) if args.tlb else None
+    simulador = Simulador(args.memoria, args.tamano_pagina, compactar=args.compactar, compactacion_a_medida=args.a_medida,
+                          planificador=crear_planificador(args.planificador, **opciones),
+                          numero_cpus=args.cpus, colas_por_cpu=args.por_cpu,
+                          semilla=args.semilla, traza=grabador, historial=args.historial,
+                          esperar_memoria=args.esperar_memoria, paginacion=args.paginacion,
+                          tiempo_fallo=args.tiempo_fallo, tlb=modelo_tlb, tabla_paginas=tabla_paginas,
+                          buddy=args.buddy, archivo_procesos=archivo_procesos)
+    if args.carga:
+        simulador.cargar(leer_carga(args.carga, len(simulador.recursos)))
+    else:
+        simulador.agregar_procesos_aleatorios(args.procesos, args.intervalo)
+    if args.puerto_metricas is not None:
+        from exportador import ServidorMetricas
+        ServidorMetricas(simulador, args.puerto_metricas).iniciar()
+
+    inicio = time.perf_counter()
+    transiciones = simulador.ejecutar()
+    duracion = time.perf_counter() - inicio
+    if grabador is not None:
+        grabador.cerrar()
+    if archivo_procesos is not None:
+        archivo_procesos.close()
+
+    print(f"Procesos terminados: {simulador.terminados}/{simulador.admitidos + simulador.rechazados} "
+          f"(rechazados por memoria: {simulador.rechazados})")
+    print(f"Reloj virtual final: {simulador.reloj:.1f}")
+    resumen = simulador.metricas.resumen()
+    print(f"Tiempo de retorno medio ({args.planificador}): {resumen['retorno']['media']:.2f} "
+          f"(p95 {resumen['retorno']['p95']:.0f}), espera media {resumen['espera']['media']:.2f}, "
+          f"respuesta media {resumen['respuesta']['media']:.2f} ({simulador.expulsiones} expulsiones)")
+    print(f"Ocupación de memoria media: {resumen['ocupacion_memoria']:.0%}; contención por recurso: "
+          + ", ".join(f"R{i} {r['contencion']:.0%}" for i, r in enumerate(resumen['recursos'])))
+    if simulador.reloj > 0:
+        print(f"Rendimiento: {simulador.terminados / simulador.reloj:.3f} procesos terminados por unidad de tiempo "
+              f"con {args.cpus} CPU(s) ({simulador.robos} robos de trabajo)")
+        print("Ocupación: " + ", ".join(f"CPU{cpu.id} {cpu.ocupacion(simulador.reloj):.0%}" for cpu in simulador.cpus))
+    if simulador.memoria_virtual is not None:
+        paginacion = resumen['paginacion']
+        print(f"Paginación ({paginacion['politica']}, {paginacion['marcos']} marcos): {paginacion['fallos']} fallos "
+              f"en {paginacion['referencias']} referencias ({paginacion['tasa_fallos']:.2%}), "
+              f"{paginacion['desalojos']} desalojos")
+        print(f"Tabla de páginas {paginacion['tabla']['tabla']}: {paginacion['tabla']['huella_maxima']:,} bytes como máximo, "
+              f"{paginacion['tabla']['costo_medio']:.2f} accesos por búsqueda")
+    if resumen['tlb'] is not None:
+        datos_tlb = resumen['tlb']
+        if datos_tlb['tasa_aciertos'] is None:
+            # Sin paginación por demanda nadie traduce direcciones durante la corrida
+            print(f"TLB ({datos_tlb['entradas']} entradas, {datos_tlb['asociatividad']} vías): sin búsquedas, "
+                  f"tasa de aciertos y tiempo efectivo de acceso n/a (la TLB se consulta con --paginacion)")
+        else:
+            print(f"TLB ({datos_tlb['entradas']} entradas, {datos_tlb['asociatividad']} vías): "
+                  f"{datos_tlb['tasa_aciertos']:.2%} de aciertos, {datos_tlb['vaciados']} vaciados "
+                  f"({datos_tlb['entradas_vaciadas']} entradas perdidas), tiempo efectivo de acceso "
+                  f"{datos_tlb['tiempo_acceso_efectivo']:.1f} (TLB 1, memoria 100)")
+    if args.compactar:
+        print(f"Costo de compactación: {simulador.costo_compactacion}")
+    if resumen['buddy'] is not None:
+        datos_buddy = resumen['buddy']
+        print(f"Buddy ({datos_buddy['asignaciones']} asignaciones): fragmentación interna "
+              f"{datos_buddy['fragmentacion_interna_acumulada']:.1%} ({datos_buddy['paginas_entregadas']} páginas "
+              f"entregadas para {datos_buddy['paginas_pedidas']} pedidas), {datos_buddy['divisiones']} divisiones, "
+              f"{datos_buddy['fusiones']} fusiones")
+    print(f"Transiciones: {transiciones} en {duracion:.3f} s ({transiciones / duracion:,.0f} por segundo)")
+    if grabador is not None:
+        print(f"Traza: {grabador.eventos} eventos grabados en {args.traza}")
+    if args.metricas:
+        simulador.metricas.exportar(args.metricas)
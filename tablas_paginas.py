@@ -0,0 +1,313 @@
+import random
+
+# Tablas de páginas para espacios de direcciones grandes (por defecto 48 bits con páginas de
+# 4 KiB, o sea números de página virtual de 36 bits). Todas traducen (proceso, página virtual)
+# a marco con la misma interfaz:
+#   mapear(id, pagina, marco)    la página quedó cargada en el marco
+#   buscar(id, pagina)           marco de la página, o None si no está mapeada
+#   desmapear(id, pagina)        la página salió de memoria
+#   liberar(id)                  el proceso terminó: devuelve los marcos que tenía
+#   huella                       bytes que ocupa la tabla en memoria (huella_maxima: el pico)
+#   costo_medio                  accesos a memoria por búsqueda (lo que cuesta un fallo de TLB)
+# Plana: un arreglo por proceso hasta la página más alta usada (como un registro límite).
+# Multinivel: árbol radix de 2, 3 o 4 niveles cuyos nodos se crean recién cuando hacen falta.
+# Invertida: una entrada por marco, buscada con una tabla hash de anclas y cadenas.
+
+BITS_VIRTUALES = 48
+BITS_DESPLAZAMIENTO = 12
+TAMANO_ENTRADA = 8  # Bytes por entrada de tabla (PTE)
+TAMANO_ENTRADA_INVERTIDA = 16  # Proceso, página virtual y siguiente de la cadena
+TAMANO_ANCLA = 4
+NIVELES = 3  # Niveles de la tabla multinivel: con 36 bits de página, nodos de 2^12 entradas
+
+# Clase base con los contadores de búsqueda comunes a todas las tablas
+class _Tabla:
+    nombre = None
+
+    def __init__(self, bits_virtuales=BITS_VIRTUALES, bits_desplazamiento=BITS_DESPLAZAMIENTO):
+        self.bits_pagina = bits_virtuales - bits_desplazamiento  # Bits del número de página virtual
+        self.busquedas = 0
+        self.accesos = 0
+        self.huella_maxima = 0
+
+    @property
+    def costo_medio(self):
+        return self.accesos / self.busquedas if self.busquedas else 0.0
+
+    def _validar(self, pagina):
+        if not 0 <= pagina < 1 << self.bits_pagina:
+            raise ValueError(f"Página virtual {pagina} fuera del espacio de {self.bits_pagina} bits")
+
+    # Se llama después de que la tabla crece
+    def _crecio(self):
+        huella = self.huella
+        if huella > self.huella_maxima:
+            self.huella_maxima = huella
+
+    def resumen(self):
+        return {'tabla': self.nombre, 'huella': self.huella, 'huella_maxima': self.huella_maxima,
+                'costo_medio': self.costo_medio}
+
+# Tabla plana: un arreglo de entradas por proceso, indexado por página virtual, que llega
+# hasta la página más alta que usó el proceso. Se busca con un solo acceso.
+class TablaPlana(_Tabla):
+    nombre = 'plana'
+
+    def __init__(self, bits_virtuales=BITS_VIRTUALES, bits_desplazamiento=BITS_DESPLAZAMIENTO):
+        super().__init__(bits_virtuales, bits_desplazamiento)
+        self._procesos = {}  # Id -> {página: marco} (el arreglo se modela con su largo)
+        self._largos = {}  # Id -> entradas del arreglo (página más alta + 1)
+        self.entradas = 0
+
+    def mapear(self, id_proceso, pagina, marco):
+        self._validar(pagina)
+        self._procesos.setdefault(id_proceso, {})[pagina] = marco
+        largo = self._largos.get(id_proceso, 0)
+        if pagina >= largo:
+            self._largos[id_proceso] = pagina + 1
+            self.entradas += pagina + 1 - largo
+            self._crecio()
+
+    def buscar(self, id_proceso, pagina):
+        self.busquedas += 1
+        self.accesos += 1
+        return self._procesos.get(id_proceso, {}).get(pagina)
+
+    def desmapear(self, id_proceso, pagina):
+        self._procesos[id_proceso].pop(pagina, None)
+
+    def liberar(self, id_proceso):
+        self.entradas -= self._largos.pop(id_proceso, 0)
+        return list(self._procesos.pop(id_proceso, {}).values())
+
+    @property
+    def huella(self):
+        return self.entradas * TAMANO_ENTRADA
+
+# Tabla multinivel (radix): los bits de la página virtual se reparten entre los niveles y
+# cada nivel indexa un nodo de 2^bits entradas. Solo se crean los nodos de las regiones
+# usadas, así que un proceso disperso paga unos pocos nodos por región.
+class TablaMultinivel(_Tabla):
+    nombre = 'multinivel'
+
+    def __init__(self, niveles=NIVELES, bits_virtuales=BITS_VIRTUALES, bits_desplazamiento=BITS_DESPLAZAMIENTO):
+        super().__init__(bits_virtuales, bits_desplazamiento)
+        if not 1 <= niveles <= self.bits_pagina:
+            raise ValueError(f"Cantidad de niveles inválida: {niveles}")
+        self.niveles = niveles
+        # Bits de cada nivel, del más alto al más bajo (los primeros niveles se llevan el resto)
+        base, resto = divmod(self.bits_pagina, niveles)
+        self._bits = [base + (1 if i < resto else 0) for i in range(niveles)]
+        self._desplazamientos = [sum(self._bits[i + 1:]) for i in range(niveles)]
+        self._raices = {}  # Id -> nodo raíz
+        self.nodos = 0
+        self.entradas = 0  # Entradas reservadas en todos los nodos
+
+    def _indices(self, pagina):
+        return [(pagina >> desplazamiento) & ((1 << bits) - 1)
+                for bits, desplazamiento in zip(self._bits, self._desplazamientos)]
+
+    def _nuevo_nodo(self, nivel):
+        self.nodos += 1
+        self.entradas += 1 << self._bits[nivel]
+        self._crecio()
+        return [None] * (1 << self._bits[nivel])
+
+    def mapear(self, id_proceso, pagina, marco):
+        self._validar(pagina)
+        nodo = self._raices.get(id_proceso)
+        if nodo is None:
+            nodo = self._raices[id_proceso] = self._nuevo_nodo(0)
+        indices = self._indices(pagina)
+        for nivel, indice in enumerate(indices[:-1]):
+            if nodo[indice] is None:
+                nodo[indice] = self._nuevo_nodo(nivel + 1)
+            nodo = nodo[indice]
+        nodo[indices[-1]] = marco
+
+    # Se recorre desde la raíz: un acceso por nivel hasta encontrar la entrada o un hueco
+    def buscar(self, id_proceso, pagina):
+        self.busquedas += 1
+        nodo = self._raices.get(id_proceso)
+        if nodo is None:
+            return None
+        for indice in self._indices(pagina):
+            self.accesos += 1
+            nodo = nodo[indice]
+            if nodo is None:
+                return None
+        return nodo
+
+    # Los nodos vacíos no se devuelven (como en la mayoría de los sistemas, hasta que termina el proceso)
+    def desmapear(self, id_proceso, pagina):
+        nodo = self._raices[id_proceso]
+        indices = self._indices(pagina)
+        for indice in indices[:-1]:
+            nodo = nodo[indice]
+            if nodo is None:
+                return
+        nodo[indices[-1]] = None
+
+    def liberar(self, id_proceso):
+        raiz = self._raices.pop(id_proceso, None)
+        marcos = []
+        pendientes = [] if raiz is None else [(raiz, 0)]
+        while pendientes:
+            nodo, nivel = pendientes.pop()
+            self.nodos -= 1
+            self.entradas -= len(nodo)
+            for hijo in nodo:
+                if hijo is None:
+                    continue
+                if nivel == self.niveles - 1:
+                    marcos.append(hijo)
+                else:
+                    pendientes.append((hijo, nivel + 1))
+        return marcos
+
+    @property
+    def huella(self):
+        return self.entradas * TAMANO_ENTRADA
+
+    def resumen(self):
+        resumen = super().resumen()
+        resumen.update(niveles=self.niveles, nodos=self.nodos)
+        return resumen
+
+# Tabla invertida: una entrada por marco físico con (proceso, página virtual). Para buscar,
+# un hash de (proceso, página) elige un ancla y se sigue la cadena de marcos que comparten
+# ese hash. Ocupa lo mismo sin importar cuántos procesos haya ni cuán dispersos sean.
+class TablaInvertida(_Tabla):
+    nombre = 'invertida'
+
+    def __init__(self, marcos, bits_virtuales=BITS_VIRTUALES, bits_desplazamiento=BITS_DESPLAZAMIENTO):
+        super().__init__(bits_virtuales, bits_desplazamiento)
+        self.marcos = marcos
+        anclas = 1
+        while anclas < marcos:
+            anclas *= 2
+        self._mascara = anclas - 1
+        self._anclas = [None] * anclas  # Hash -> primer marco de la cadena
+        self._dueno = [None] * marcos  # Marco -> (proceso, página virtual)
+        self._siguiente = [None] * marcos  # Marco -> siguiente marco de la cadena
+        self._crecio()  # Ocupa todo desde el principio
+
+    def _hash(self, id_proceso, pagina):
+        clave = (pagina * 0x9E3779B97F4A7C15 + id_proceso * 0xC2B2AE3D27D4EB4F) & 0xFFFFFFFFFFFFFFFF
+        return (clave >> 29) & self._mascara
+
+    def mapear(self, id_proceso, pagina, marco):
+        self._validar(pagina)
+        if self._dueno[marco] is not None:
+            self.desmapear(*self._dueno[marco])
+        ancla = self._hash(id_proceso, pagina)
+        self._dueno[marco] = (id_proceso, pagina)
+        self._siguiente[marco] = self._anclas[ancla]
+        self._anclas[ancla] = marco
+
+    # Un acceso para el ancla y uno por cada entrada de la cadena que se mira
+    def buscar(self, id_proceso, pagina):
+        self.busquedas += 1
+        self.accesos += 1
+        clave = (id_proceso, pagina)
+        marco = self._anclas[self._hash(id_proceso, pagina)]
+        while marco is not None:
+            self.accesos += 1
+            if self._dueno[marco] == clave:
+                return marco
+            marco = self._siguiente[marco]
+        return None
+
+    def desmapear(self, id_proceso, pagina):
+        ancla = self._hash(id_proceso, pagina)
+        clave = (id_proceso, pagina)
+        anterior, marco = None, self._anclas[ancla]
+        while marco is not None and self._dueno[marco] != clave:
+            anterior, marco = marco, self._siguiente[marco]
+        if marco is None:
+            return
+        if anterior is None:
+            self._anclas[ancla] = self._siguiente[marco]
+        else:
+            self._siguiente[anterior] = self._siguiente[marco]
+        self._dueno[marco] = self._siguiente[marco] = None
+
+    # No hay índice por proceso: se recorren todos los marcos (solo pasa al terminar un proceso)
+    def liberar(self, id_proceso):
+        marcos = [marco for marco, dueno in enumerate(self._dueno) if dueno is not None and dueno[0] == id_proceso]
+        for marco in marcos:
+            self.desmapear(*self._dueno[marco])
+        return marcos
+
+    @property
+    def huella(self):
+        return self.marcos * TAMANO_ENTRADA_INVERTIDA + len(self._anclas) * TAMANO_ANCLA
+
+TABLAS = {clase.nombre: clase for clase in (TablaPlana, TablaMultinivel, TablaInvertida)}
+
+# Función para crear una tabla a partir de su nombre ('plana', 'multinivel', 'invertida');
+# la invertida necesita la cantidad de marcos y la multinivel acepta `niveles`
+def crear_tabla(nombre='plana', **opciones):
+    try:
+        clase = TABLAS[nombre]
+    except KeyError:
+        raise ValueError(f"Tabla de páginas desconocida: {nombre}") from None
+    return clase(**opciones)
+
+# Función para generar las páginas de un proceso disperso: código y heap abajo, pila arriba
+# y algunas regiones mapeadas en lugares al azar, cada una de unas pocas páginas seguidas
+def paginas_dispersas(aleatorio, bits_pagina=BITS_VIRTUALES - BITS_DESPLAZAMIENTO, regiones=4, paginas_por_region=16):
+    tope = 1 << bits_pagina
+    inicios = [0x400, 0x600, tope - paginas_por_region]  # Código, heap y pila
+    inicios += [aleatorio.randrange(tope - paginas_por_region) for _ in range(regiones)]
+    return [inicio + i for inicio in inicios for i in range(paginas_por_region)]
+
+# Función para comparar las tablas con los mismos procesos dispersos: mapea todas sus
+# páginas y hace `busquedas` búsquedas (algunas a páginas sin mapear)
+def comparar(tablas, procesos=32, regiones=4, paginas_por_region=16, busquedas=100000, semilla=0):
+    aleatorio = random.Random(semilla)
+    espacios = {id_proceso: paginas_dispersas(aleatorio, tablas[0].bits_pagina, regiones, paginas_por_region)
+                for id_proceso in range(1, procesos + 1)}
+    consultas = []
+    for _ in range(busquedas):
+        id_proceso = aleatorio.randrange(1, procesos + 1)
+        if aleatorio.random() < 0.9:
+            consultas.append((id_proceso, aleatorio.choice(espacios[id_proceso])))
+        else:
+            consultas.append((id_proceso, aleatorio.randrange(1 << tablas[0].bits_pagina)))
+    mapeadas = sum(len(paginas) for paginas in espacios.values())
+    filas = []
+    for tabla in tablas:
+        marco = 0
+        for id_proceso, paginas in espacios.items():
+            for pagina in paginas:
+                tabla.mapear(id_proceso, pagina, marco)
+                marco += 1
+        for id_proceso, pagina in consultas:
+            tabla.buscar(id_proceso, pagina)
+        fila = tabla.resumen()
+        fila['bytes_por_pagina'] = tabla.huella / mapeadas
+        filas.append(fila)
+    return filas
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Huella y costo de búsqueda de tablas de páginas para procesos dispersos")
+    parser.add_argument("--bits", type=int, default=BITS_VIRTUALES, help="Bits de las direcciones virtuales")
+    parser.add_argument("--desplazamiento", type=int, default=BITS_DESPLAZAMIENTO, help="Bits del desplazamiento (tamaño de página)")
+    parser.add_argument("--procesos", type=int, default=32, help="Procesos a mapear")
+    parser.add_argument("--regiones", type=int, default=4, help="Regiones al azar por proceso (además de código, heap y pila)")
+    parser.add_argument("--paginas", type=int, default=16, help="Páginas por región")
+    parser.add_argument("--busquedas", type=int, default=100000, help="Búsquedas a medir")
+    parser.add_argument("--semilla", type=int, default=0, help="Semilla de los procesos y las búsquedas")
+    args = parser.parse_args()
+
+    marcos = args.procesos * (args.regiones + 3) * args.paginas
+    tablas = [TablaPlana(args.bits, args.desplazamiento)]
+    tablas += [TablaMultinivel(niveles, args.bits, args.desplazamiento) for niveles in (2, 3, 4)]
+    tablas.append(TablaInvertida(marcos, args.bits, args.desplazamiento))
+    print(f"{'tabla':<14}{'huella':>18}{'bytes/página':>16}{'accesos/búsqueda':>18}")
+    for fila in comparar(tablas, args.procesos, args.regiones, args.paginas, args.busquedas, args.semilla):
+        nombre = fila['tabla'] + (f" ({fila['niveles']})" if 'niveles' in fila else "")
+        print(f"{nombre:<14}{fila['huella']:>18,}{fila['bytes_por_pagina']:>16,.1f}{fila['costo_medio']:>18.2f}")
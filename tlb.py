@@ -0,0 +1,118 @@
+import random
+from collections import OrderedDict
+
+# TLB simulada: caché asociativa por conjuntos de traducciones (proceso, página virtual) -> marco.
+# Tiene `entradas` entradas repartidas en conjuntos de `asociatividad` vías; la página elige
+# el conjunto y, si el conjunto está lleno, la política de reemplazo elige la vía a pisar.
+# Sin identificadores de espacio de direcciones (ASID), cada cambio de contexto la vacía
+# entera; con ASID las entradas de otros procesos quedan y solo se distinguen por el id.
+# Cuenta aciertos, fallos y vaciados para estimar el tiempo efectivo de acceso a memoria.
+
+REEMPLAZOS = ('lru', 'fifo', 'aleatorio')
+
+# Clase para representar una TLB (cada CPU tiene la suya)
+class TLB:
+    def __init__(self, entradas=64, asociatividad=4, reemplazo='lru', asid=False, semilla=0):
+        if entradas % asociatividad:
+            raise ValueError("La cantidad de entradas tiene que ser múltiplo de la asociatividad")
+        if reemplazo not in REEMPLAZOS:
+            raise ValueError(f"Reemplazo de TLB desconocido: {reemplazo}")
+        self.entradas = entradas
+        self.asociatividad = asociatividad
+        self.reemplazo = reemplazo
+        self.asid = asid
+        self._conjuntos = [OrderedDict() for _ in range(entradas // asociatividad)]
+        self._aleatorio = random.Random(semilla)
+        self.proceso = None  # Proceso cuyo espacio de direcciones está cargado
+        self.aciertos = 0
+        self.fallos = 0
+        self.cambios_contexto = 0
+        self.vaciados = 0
+        self.entradas_vaciadas = 0  # Entradas válidas perdidas en los vaciados
+
+    def _conjunto(self, pagina):
+        return self._conjuntos[pagina % len(self._conjuntos)]
+
+    # Fracción de búsquedas que acertaron (None si nunca se buscó nada: no hay con qué medir)
+    @property
+    def tasa_aciertos(self):
+        total = self.aciertos + self.fallos
+        return self.aciertos / total if total else None
+
+    # Función para buscar la traducción de una página; devuelve el marco o None (fallo de TLB)
+    def buscar(self, id_proceso, pagina):
+        conjunto = self._conjunto(pagina)
+        marco = conjunto.get((id_proceso, pagina))
+        if marco is None:
+            self.fallos += 1
+            return None
+        self.aciertos += 1
+        if self.reemplazo == 'lru':
+            conjunto.move_to_end((id_proceso, pagina))
+        return marco
+
+    # Función para guardar una traducción después de recorrer la tabla de páginas
+    def cargar(self, id_proceso, pagina, marco):
+        conjunto = self._conjunto(pagina)
+        if len(conjunto) >= self.asociatividad:
+            if self.reemplazo == 'aleatorio':
+                del conjunto[self._aleatorio.choice(list(conjunto))]
+            else:
+                conjunto.popitem(last=False)  # La menos usada (LRU) o la más vieja (FIFO)
+        conjunto[(id_proceso, pagina)] = marco
+
+    # Función para invalidar una traducción (la página salió de memoria o se movió)
+    def invalidar(self, id_proceso, pagina):
+        self._conjunto(pagina).pop((id_proceso, pagina), None)
+
+    # Función para vaciar la TLB; devuelve cuántas entradas válidas se perdieron
+    def vaciar(self):
+        perdidas = sum(len(conjunto) for conjunto in self._conjuntos)
+        for conjunto in self._conjuntos:
+            conjunto.clear()
+        self.vaciados += 1
+        self.entradas_vaciadas += perdidas
+        return perdidas
+
+    # Función para cambiar al espacio de direcciones de otro proceso (vacía la TLB si no hay ASID)
+    def cambio_contexto(self, id_proceso):
+        if id_proceso == self.proceso:
+            return
+        if self.proceso is not None:
+            self.cambios_contexto += 1
+            if not self.asid:
+                self.vaciar()
+        self.proceso = id_proceso
+
+    # Tiempo efectivo de acceso: siempre se consulta la TLB y se accede a memoria; en un fallo
+    # además se recorre la tabla de páginas (`niveles` accesos a memoria). None sin búsquedas
+    def tiempo_acceso_efectivo(self, tiempo_tlb=1.0, tiempo_memoria=100.0, niveles=1):
+        tasa = self.tasa_aciertos
+        if tasa is None:
+            return None
+        return tiempo_tlb + tiempo_memoria + (1 - tasa) * niveles * tiempo_memoria
+
+    def resumen(self):
+        return {
+            'entradas': self.entradas,
+            'asociatividad': self.asociatividad,
+            'aciertos': self.aciertos,
+            'fallos': self.fallos,
+            'tasa_aciertos': self.tasa_aciertos,
+            'cambios_contexto': self.cambios_contexto,
+            'vaciados': self.vaciados,
+            'entradas_vaciadas': self.entradas_vaciadas,
+        }
+
+# Función para juntar las estadísticas de las TLB de todas las CPUs
+def resumir(tlbs, tiempo_tlb=1.0, tiempo_memoria=100.0, niveles=1):
+    total = TLB(tlbs[0].entradas, tlbs[0].asociatividad, tlbs[0].reemplazo, tlbs[0].asid)
+    for tlb in tlbs:
+        total.aciertos += tlb.aciertos
+        total.fallos += tlb.fallos
+        total.cambios_contexto += tlb.cambios_contexto
+        total.vaciados += tlb.vaciados
+        total.entradas_vaciadas += tlb.entradas_vaciadas
+    resumen = total.resumen()
+    resumen['tiempo_acceso_efectivo'] = total.tiempo_acceso_efectivo(tiempo_tlb, tiempo_memoria, niveles)
+    return resumen
@@ -0,0 +1,107 @@
+import os
+import struct
+
+# Traza binaria de eventos del simulador.
+# Cada registro es una cabecera fija (tipo, instante, id del proceso, cantidad de valores)
+# seguida de esa cantidad de enteros sin signo de 32 bits (páginas, CPU, recurso...).
+# El archivo se crea de nuevo en cada corrida (una traza es una sola corrida) y los registros
+# se juntan en un búfer en memoria que se baja al disco por bloques, así grabar un evento
+# cuesta un par de microsegundos.
+
+MAGICO = b'SIMTRZ01'  # Cabecera del archivo: identifica el formato y su versión
+CABECERA = struct.Struct('<BdII')  # tipo, instante, id del proceso, cantidad de valores
+TAMANO_BUFER = 1 << 16  # Bytes que se juntan antes de escribir
+
+# Tipos de evento
+LLEGADA = 1  # Llega un proceso (si lo admiten le siguen ASIGNACION y queda en Nuevos): [memoria, recurso, prioridad]
+RECHAZO = 2  # El proceso que llegó no entró en memoria
+LISTO = 3  # Nuevos -> Listo, o Ejecutando -> Listo (quantum o expulsión)
+DESPACHO = 4  # Listo -> Ejecutando: [cpu]
+BLOQUEO = 5  # Ejecutando -> Bloqueado: [recurso]
+DESPERTAR = 6  # Bloqueado -> Listo
+TERMINADO = 7  # Ejecutando -> Terminado
+ASIGNACION = 8  # Páginas asignadas al proceso: [páginas...] (vacía al admitirlo con paginación por demanda)
+LIBERACION = 9  # Páginas liberadas por el proceso: [páginas...]
+MOVIMIENTO = 10  # La compactación movió una página del proceso: [origen, destino]
+RECURSO_TOMADO = 11  # El proceso obtuvo su recurso: [recurso]
+RECURSO_SOLTADO = 12  # El proceso soltó su recurso: [recurso]
+CONFIGURACION = 13  # Primer registro de la corrida: [memoria total, tamaño de página, recursos, cpus, compactar, paginación]
+
+NOMBRES = {
+    LLEGADA: 'LLEGADA', RECHAZO: 'RECHAZO', LISTO: 'LISTO', DESPACHO: 'DESPACHO',
+    BLOQUEO: 'BLOQUEO', DESPERTAR: 'DESPERTAR', TERMINADO: 'TERMINADO', ASIGNACION: 'ASIGNACION',
+    LIBERACION: 'LIBERACION', MOVIMIENTO: 'MOVIMIENTO', RECURSO_TOMADO: 'RECURSO_TOMADO',
+    RECURSO_SOLTADO: 'RECURSO_SOLTADO', CONFIGURACION: 'CONFIGURACION',
+}
+
+# Formatos de los valores ya compilados según la cantidad (los más comunes se reusan)
+_formatos = {}
+
+def _formato(cantidad):
+    formato = _formatos.get(cantidad)
+    if formato is None:
+        formato = _formatos[cantidad] = struct.Struct(f'<{cantidad}I')
+    return formato
+
+# Clase para grabar la traza en un archivo (o en cualquier objeto con `write`)
+class GrabadorTraza:
+    def __init__(self, destino, tamano_bufer=TAMANO_BUFER):
+        if isinstance(destino, (str, os.PathLike)):
+            self._archivo = open(destino, 'wb')  # Pisa la traza de una corrida anterior
+            self._propio = True
+        else:
+            self._archivo = destino
+            self._propio = False
+        self.tamano_bufer = tamano_bufer
+        self._bufer = bytearray()
+        self.eventos = 0
+        if self._archivo.tell() == 0:
+            self._bufer += MAGICO
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.cerrar()
+
+    # Función para grabar un evento
+    def registrar(self, tipo, tiempo, id_proceso, valores=()):
+        bufer = self._bufer
+        bufer += CABECERA.pack(tipo, tiempo, id_proceso, len(valores))
+        if valores:
+            bufer += _formato(len(valores)).pack(*valores)
+        self.eventos += 1
+        if len(bufer) >= self.tamano_bufer:
+            self.bajar()
+
+    # Función para escribir en el archivo lo que quedó en el búfer
+    def bajar(self):
+        if self._bufer:
+            self._archivo.write(self._bufer)
+            self._bufer.clear()
+
+    def cerrar(self):
+        self.bajar()
+        self._archivo.flush()
+        if self._propio:
+            self._archivo.close()
+
+# Función para leer una traza desde bytes (o un mmap) a partir de `inicio`.
+# Genera (tipo, instante, id del proceso, valores, posición del registro siguiente).
+def leer_registros(datos, inicio=len(MAGICO)):
+    if datos[:len(MAGICO)] != MAGICO:
+        raise ValueError("El archivo no es una traza del simulador")
+    posicion = inicio
+    fin = len(datos)
+    tamano = CABECERA.size
+    while posicion + tamano <= fin:
+        tipo, tiempo, id_proceso, cantidad = CABECERA.unpack_from(datos, posicion)
+        if posicion + tamano + 4 * cantidad > fin:
+            break  # Último registro cortado (la grabación se interrumpió a la mitad)
+        posicion += tamano
+        if cantidad:
+            valores = _formato(cantidad).unpack_from(datos, posicion)
+            posicion += 4 * cantidad
+        else:
+            valores = ()
+        yield tipo, tiempo, id_proceso, valores, posicion
@@ -0,0 +1,119 @@
+# Ayudas para la interfaz gráfica de los simuladores.
+
+INTERVALO_REFRESCO_MS = 33  # Un redibujado cada ~33 ms (unos 30 cuadros por segundo)
+
+# Refresco de la interfaz limitado a una vez por cuadro.
+# Los hilos de trabajo solo llaman a `marcar()` (no tocan Tk); un único ciclo
+# `ventana.after` en el hilo de Tk llama a `dibujar()` si hubo cambios desde el
+# último cuadro, sin importar cuántas transiciones ocurrieron en el medio.
+class RefrescoInterfaz:
+    def __init__(self, ventana, dibujar, intervalo_ms=INTERVALO_REFRESCO_MS):
+        self.ventana = ventana
+        self.dibujar = dibujar
+        self.intervalo_ms = intervalo_ms
+        self._sucio = True  # Dibujar al menos el primer cuadro
+
+    # Función para avisar que el estado cambió (se puede llamar desde cualquier hilo)
+    def marcar(self):
+        self._sucio = True
+
+    # Función para arrancar el ciclo de refresco (llamar desde el hilo de Tk)
+    def iniciar(self):
+        self.ventana.after(self.intervalo_ms, self._cuadro)
+
+    def _cuadro(self):
+        if self._sucio:
+            self._sucio = False  # Se limpia antes de dibujar para no perder cambios hechos mientras tanto
+            self.dibujar()
+        self.ventana.after(self.intervalo_ms, self._cuadro)
+
+# Mapa de la memoria dibujado en un Canvas con un rectángulo y un texto fijos por página.
+# En cada refresco solo se reconfiguran (itemconfig) las páginas cuyo dueño cambió,
+# en lugar de borrar y volver a crear todos los elementos.
+class CanvasMemoria:
+    def __init__(self, canvas, numero_paginas, columnas=10, ancho=50, alto=50, margen_x=0,
+                 color_libre="", color_ocupada="lightblue", texto_libre="", texto_ocupada="{}"):
+        self.canvas = canvas
+        self.color_libre = color_libre
+        self.color_ocupada = color_ocupada
+        self.texto_libre = texto_libre
+        self.texto_ocupada = texto_ocupada
+        self._rectangulos = []
+        self._textos = []
+        self._duenos = [None] * numero_paginas  # Lo que está dibujado en cada página
+
+        for i in range(numero_paginas):
+            x0, y0 = margen_x + (i % columnas) * ancho, (i // columnas) * alto
+            x1, y1 = x0 + ancho, y0 + alto
+            self._rectangulos.append(canvas.create_rectangle(x0, y0, x1, y1, fill=color_libre, outline="black"))
+            self._textos.append(canvas.create_text((x0 + ancho // 2, y0 + alto // 2), text=texto_libre, fill="black"))
+
+    # Función para redibujar las páginas indicadas en `cambiadas` (o todas si es None)
+    def dibujar(self, paginas, cambiadas=None):
+        indices = range(len(self._duenos)) if cambiadas is None else cambiadas
+        itemconfig = self.canvas.itemconfig
+        for i in indices:
+            dueno = paginas[i]
+            if dueno == self._duenos[i]:
+                continue
+            self._duenos[i] = dueno
+            if dueno is None:
+                itemconfig(self._rectangulos[i], fill=self.color_libre)
+                itemconfig(self._textos[i], text=self.texto_libre)
+            else:
+                itemconfig(self._rectangulos[i], fill=self.color_ocupada)
+                itemconfig(self._textos[i], text=self.texto_ocupada.format(dueno))
+
+# Listbox que muestra una cola de procesos aplicando solo las diferencias.
+# Recuerda qué línea (id, texto) dibujó en cada posición y, al refrescar, borra las
+# de procesos que ya no están, inserta las nuevas y reemplaza las que cambiaron de texto.
+class ListaProcesos:
+    def __init__(self, listbox):
+        self.listbox = listbox
+        self._lineas = []  # (id del proceso, texto) de cada línea dibujada
+
+    def dibujar(self, procesos):
+        listbox = self.listbox
+        nuevas = [(proceso.id, str(proceso)) for proceso in procesos]
+        vigentes = {id_proceso for id_proceso, _ in nuevas}
+
+        # Borrar las líneas de procesos que ya no están, de atrás hacia adelante y por tramos
+        actuales = self._lineas
+        i = len(actuales) - 1
+        while i >= 0:
+            if actuales[i][0] in vigentes:
+                i -= 1
+                continue
+            fin = i
+            while i >= 0 and actuales[i][0] not in vigentes:
+                i -= 1
+            listbox.delete(i + 1, fin)
+        actuales = [linea for linea in actuales if linea[0] in vigentes]
+        por_ubicar = {id_proceso for id_proceso, _ in actuales}
+
+        # Recorrer la cola nueva junto con las líneas que quedaron
+        j = 0
+        pendientes = []  # Líneas nuevas que se insertan juntas
+        for i, (id_proceso, texto) in enumerate(nuevas):
+            if j < len(actuales) and actuales[j][0] == id_proceso:
+                if pendientes:
+                    listbox.insert(i - len(pendientes), *pendientes)
+                    pendientes = []
+                if actuales[j][1] != texto:
+                    listbox.delete(i)
+                    listbox.insert(i, texto)
+                por_ubicar.discard(id_proceso)
+                j += 1
+            elif id_proceso in por_ubicar:
+                # La cola cambió de orden: se reescribe desde acá hasta el final
+                if pendientes:
+                    listbox.insert(i - len(pendientes), *pendientes)
+                    pendientes = []
+                listbox.delete(i, "end")
+                listbox.insert("end", *[texto for _, texto in nuevas[i:]])
+                break
+            else:
+                pendientes.append(texto)
+        if pendientes:
+            listbox.insert(len(nuevas) - len(pendientes), *pendientes)
+        self._lineas = nuevas